@@ -17,6 +17,7 @@ Key Components:
 - Database initialization through SQLAlchemy
 - Password hashing configuration via bcrypt
 - Namespace registration for all API endpoints
+- orjson-backed JSON parsing and serialization
 - Authorization schema definition for API documentation
 
 API Structure:
@@ -33,6 +34,9 @@ Supported Entity Operations:
 - Admin: Administrative operations for all entities
 """
 
+# Import standard library helper for deferred namespace module loading
+import importlib
+
 # Import Flask core components for application creation
 from flask import Flask
 from flask_restx import Api
@@ -40,19 +44,39 @@ from flask_restx import Api
 # Import application extensions for database, authentication, and security
 from app.extensions import db, bcrypt, jwt
 
-# Import API namespace modules for different entity types
-# Regular user-facing endpoints
-from app.api.v1.users import api as users_ns
-from app.api.v1.places import api as places_ns
-from app.api.v1.amenities import api as amenities_ns
-from app.api.v1.reviews import api as reviews_ns
-from app.api.v1.auth import api as auth_ns
-
-# Administrative endpoints requiring elevated privileges
-from app.api.v1.admin_users import api as admin_users_ns
-from app.api.v1.admin_places import api as admin_places_ns
-from app.api.v1.admin_amenities import api as admin_amenities_ns
-from app.api.v1.admin_reviews import api as admin_reviews_ns
+# Import centralized API error handlers
+from app.api.v1.errors import register_error_handlers
+
+# Import the orjson-backed JSON provider and RESTx representation
+from app.utils.orjson_provider import OrjsonProvider, output_json
+
+# Import the early admin check for admin-only URL prefixes
+from app.utils.jwt_cache import admin_gate
+from app.utils.jwt_keys import install_jwt_key_cache
+
+# API namespaces registered by the factory, as (module path, attribute, URL prefix).
+# Modules are imported lazily inside create_app() so that importing the `app`
+# package (e.g. during pytest collection) does not pull in every endpoint module.
+NAMESPACES = (
+    # Regular user-facing endpoints
+    ('app.api.v1.users', 'api', '/api/v1/users'),
+    ('app.api.v1.places', 'api', '/api/v1/places'),
+    ('app.api.v1.amenities', 'api', '/api/v1/amenities'),
+    ('app.api.v1.reviews', 'api', '/api/v1/reviews'),
+    ('app.api.v1.auth', 'api', '/api/v1/auth'),
+
+    # Administrative endpoints requiring elevated privileges
+    ('app.api.v1.admin_users', 'api', '/api/v1/admin/users'),
+    ('app.api.v1.admin_places', 'api', '/api/v1/admin/places'),
+    ('app.api.v1.admin_amenities', 'api', '/api/v1/admin/amenities'),
+    ('app.api.v1.admin_reviews', 'api', '/api/v1/admin/reviews'),
+)
+
+# URL prefixes reserved to admins, rejected for other callers before dispatch.
+# Admin places and reviews are not listed: owners and authors may use them too.
+ADMIN_ONLY_PREFIXES = (
+    '/api/v1/admin/users',
+)
 
 
 def create_app(config_class="config.DevelopmentConfig"):
@@ -128,6 +152,9 @@ def create_app(config_class="config.DevelopmentConfig"):
     # This allows environment-specific settings (database URLs, secrets, etc.)
     app.config.from_object(config_class)
 
+    # Parse request bodies and serialize jsonify() output with orjson
+    app.json = OrjsonProvider(app)
+
     # Define authorization configuration for Swagger documentation
     # This enables the "Authorize" button in Swagger UI for JWT token input
     authorizations = {
@@ -149,6 +176,9 @@ def create_app(config_class="config.DevelopmentConfig"):
         security='Bearer'               # Default security scheme for endpoints
     )
 
+    # Render resource results with orjson instead of the stdlib json module
+    api.representations['application/json'] = output_json
+
     # Initialize Flask extensions with the application instance
     # bcrypt: Secure password hashing for user authentication
     bcrypt.init_app(app)
@@ -156,37 +186,23 @@ def create_app(config_class="config.DevelopmentConfig"):
     # JWT: JSON Web Token handling for stateless authentication
     jwt.init_app(app)
 
+    # Resolve the JWT signing/verification keys once instead of per token
+    install_jwt_key_cache(app, jwt)
+
     # SQLAlchemy: Database ORM for data persistence and relationships
     db.init_app(app)
 
-    # Register API namespaces for user-facing endpoints
-    # Users namespace: Registration, profile management, authentication
-    api.add_namespace(users_ns, path='/api/v1/users')
-
-    # Places namespace: Property listings, search, and basic management
-    api.add_namespace(places_ns, path="/api/v1/places")
-
-    # Amenities namespace: Feature listings and basic operations
-    api.add_namespace(amenities_ns, path="/api/v1/amenities")
-
-    # Reviews namespace: User feedback and rating operations
-    api.add_namespace(reviews_ns, path="/api/v1/reviews")
-
-    # Authentication namespace: Login, token management, protected resource testing
-    api.add_namespace(auth_ns, path="/api/v1/auth")
-
-    # Register API namespaces for administrative endpoints
-    # Admin Users namespace: User management, role assignment, account administration
-    api.add_namespace(admin_users_ns, path='/api/v1/admin/users')
-
-    # Admin Places namespace: Property management, owner verification, place administration
-    api.add_namespace(admin_places_ns, path="/api/v1/admin/places")
+    # Register API-wide error handlers (ValueError -> 400, database errors -> 500)
+    register_error_handlers(api)
 
-    # Admin Amenities namespace: Feature management, system-wide amenity operations
-    api.add_namespace(admin_amenities_ns, path="/api/v1/admin/amenities")
+    # Reject non-admin callers of admin-only endpoints before Flask-RESTX dispatch
+    app.before_request(admin_gate(ADMIN_ONLY_PREFIXES))
 
-    # Admin Reviews namespace: Review moderation, content management, user feedback oversight
-    api.add_namespace(admin_reviews_ns, path="/api/v1/admin/reviews")
+    # Register every API namespace declared in NAMESPACES
+    # Each endpoint module is imported on first use and its namespace mounted at its URL prefix
+    for module_name, attribute, path in NAMESPACES:
+        namespace = getattr(importlib.import_module(module_name), attribute)
+        api.add_namespace(namespace, path=path)
 
     # Return the fully configured Flask application instance
     # The app is now ready for deployment or testing with all components initialized
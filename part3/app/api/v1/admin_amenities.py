@@ -1,16 +1,21 @@
 # Import necessary modules for admin amenity management functionality
-from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask_restx import Namespace, Resource
 from app.services import facade
+from app.api.v1.models import register_models, amenity_model
+from app.api.v1.serializers import AmenityOut
+from app.api.v1.responses import no_content
+from app.services.exceptions import NotFoundError
+from app.utils.jwt_cache import admin_required
+from app.utils.validation import PayloadSchema
 
 # Create Flask-RESTx namespace for admin amenity operations
 api = Namespace('admin', description='Admin operations')
 
-# Define data model for input validation and Swagger documentation
-amenity_model = api.model('Amenity', {
-    # Required field: amenity name
-    'name': fields.String(required=True, description='Name of the amenity')
-})
+# Attach the shared amenity model referenced by this namespace
+register_models(api, amenity_model)
+
+# Payload validator compiled once at import (amenity_model only documents the API)
+amenity_schema = PayloadSchema({'name': str}, required=('name',))
 
 
 @api.route('/amenities/')
@@ -28,11 +33,11 @@ class AdminAmenityCreate(Resource):
         post(): Create new amenity (admin only)
     """
 
-    @api.expect(amenity_model)
+    @api.expect(amenity_model, validate=False)
     @api.response(201, 'Amenity successfully created')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @admin_required
     def post(self):
         """
         Create a new amenity as an admin.
@@ -63,35 +68,23 @@ class AdminAmenityCreate(Resource):
                 "error": "Admin privileges required"
             }
         """
-        # Get current user identity and claims from JWT token
-        current_user = get_jwt_identity()
-        claims = get_jwt()
-
-        # Check admin privileges
-        if not claims.get('is_admin'):
-            return {'error': 'Admin privileges required'}, 403
-
         # Extract amenity data from request payload
         amenity_data = api.payload
 
         try:
+            # Keep only the typed 'name' field; anything malformed is a 400
+            amenity_data = amenity_schema.validate(amenity_data)
+
             # Create amenity through facade with validation
             new_amenity = facade.create_amenity(amenity_data)
 
             # Return created amenity data
-            return {
-                'id': new_amenity.id,
-                'name': new_amenity.name
-            }, 201
+            return AmenityOut.of(new_amenity), 201
 
         except ValueError as e:
             # Handle business validation errors with specific error message
             return {'error': str(e)}, 400
 
-        except Exception as e:
-            # Handle unexpected errors with generic error message
-            return {'error': 'Internal server error'}, 500
-
 
 @api.route('/amenities/<amenity_id>')
 class AdminAmenityModify(Resource):
@@ -113,7 +106,7 @@ class AdminAmenityModify(Resource):
     @api.response(200, 'Amenity retrieved successfully')
     @api.response(404, 'Amenity not found')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @admin_required
     def get(self, amenity_id):
         """
         Retrieve a specific amenity by its ID. Only admins can access this endpoint.
@@ -143,11 +136,6 @@ class AdminAmenityModify(Resource):
                 "error": "Admin privileges required"
             }
         """
-        # Check admin privileges from JWT token claims
-        claims = get_jwt()
-        if not claims.get('is_admin'):
-            return {'error': 'Admin privileges required'}, 403
-
         try:
             # Retrieve amenity from facade using provided ID
             amenity = facade.get_amenity(amenity_id)
@@ -157,17 +145,14 @@ class AdminAmenityModify(Resource):
             return {'error': 'Amenity not found'}, 404
 
         # Return amenity data with ID and name
-        return {
-            'id': amenity.id,
-            'name': amenity.name
-        }, 200
+        return AmenityOut.of(amenity), 200
 
-    @api.expect(amenity_model, validate=True)
+    @api.expect(amenity_model, validate=False)
     @api.response(200, 'Amenity updated successfully')
     @api.response(404, 'Amenity not found')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @admin_required
     def put(self, amenity_id):
         """
         Update a specific amenity. Only admins can update amenities.
@@ -201,40 +186,31 @@ class AdminAmenityModify(Resource):
                 "error": "Amenity not found"
             }
         """
-        # Check admin privileges from JWT token claims
-        claims = get_jwt()
-        if not claims.get('is_admin'):
-            return {'error': 'Admin privileges required'}, 403
-
         # Extract amenity data from request payload
         amenity_api = api.payload
 
         try:
+            # Keep only the typed 'name' field; anything malformed is a 400
+            amenity_api = amenity_schema.validate(amenity_api)
+
             # Attempt to update amenity with new data through facade
             amenity_data = facade.update_amenity(amenity_id, amenity_api)
 
-            # Check if amenity was found and updated
-            if not amenity_data:
-                return {'error': 'Amenity not found'}, 404
-
             # Return updated amenity data
-            return {
-                'id': amenity_data.id,
-                'name': amenity_data.name
-            }, 200
+            return AmenityOut.of(amenity_data), 200
+
+        except NotFoundError:
+            # Handle case where amenity doesn't exist
+            return {'error': 'Amenity not found'}, 404
 
         except ValueError as e:
             # Handle business validation errors with specific error message
             return {'error': str(e)}, 400
 
-        except (ValueError, KeyError):
-            # Handle cases where amenity doesn't exist
-            return {'error': 'Amenity not found'}, 404
-
     @api.response(204, 'Amenity deleted successfully')
     @api.response(404, 'Amenity not found')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @admin_required
     def delete(self, amenity_id):
         """
         Delete a specific amenity. Only admins can delete amenities.
@@ -259,26 +235,13 @@ class AdminAmenityModify(Resource):
                 "error": "Amenity not found"
             }
         """
-        # Check admin privileges from JWT token claims
-        claims = get_jwt()
-        if not claims.get('is_admin'):
-            return {'error': 'Admin privileges required'}, 403
-
-        try:
-            # Verify amenity exists before attempting deletion
-            amenity = facade.get_amenity(amenity_id)
-
-        except (ValueError, KeyError):
-            # Handle case where amenity doesn't exist
-            return {'error': 'Amenity not found'}, 404
-
         try:
-            # Attempt to delete amenity through facade
+            # Delete amenity through facade (database errors reach the SQLAlchemyError handler)
             facade.delete_amenity(amenity_id)
 
             # Return empty response with 204 status on successful deletion
-            return '', 204
+            return no_content()
 
-        except Exception:
-            # Handle unexpected errors during deletion
-            return {'error': 'Internal server error'}, 500
+        except ValueError:
+            # Handle case where amenity doesn't exist
+            return {'error': 'Amenity not found'}, 404
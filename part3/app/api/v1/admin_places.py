@@ -1,56 +1,118 @@
 # Import necessary modules for admin place management functionality
-from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask_restx import Namespace, Resource
 from app.services import facade
+from app.utils.jwt_cache import cached_jwt_required, current_principal
+from app.api.v1.models import (
+    register_models,
+    place_amenity_model,
+    place_user_model,
+    admin_place_update_model,
+    admin_place_response_model,
+    admin_place_update_response_model,
+)
 
 # Create namespace for admin place operations
 api = Namespace('admin', description='Admin operations')
 
-# Define amenity model used within places
-amenity_model = api.model('PlaceAmenity', {
-    'id': fields.String(description='Amenity ID'),
-    'name': fields.String(description='Name of the amenity')
-})
-
-# Define user model linked to places
-user_model = api.model('PlaceUser', {
-    'id': fields.String(description='User ID'),
-    'first_name': fields.String(description='First name of the owner'),
-    'last_name': fields.String(description='Last name of the owner'),
-    'email': fields.String(description='Email of the owner')
-})
-
-# Define review model associated with places
-review_model = api.model('PlaceReview', {
-    'id': fields.String(description='Review ID'),
-    'text': fields.String(description='Text of the review'),
-    'rating': fields.Integer(description='Rating of the place (1-5)'),
-    'user_id': fields.String(description='ID of the user')
-})
-
-# Define main model representing a place
-place_model = api.model('Place', {
-    'title': fields.String(required=True, description='Title of the place'),
-    'description': fields.String(description='Description of the place'),
-    'price': fields.Float(required=True, description='Price per night'),
-    'latitude': fields.Float(required=True, description='Latitude of the place'),
-    'longitude': fields.Float(required=True, description='Longitude of the place'),
-    'owner_id': fields.String(required=True, description='ID of the owner'),
-    'max_person': fields.Integer(required=True, description='Maximum number of persons allowed'),
-    'owner': fields.Nested(user_model, description='Owner of the place'),
-    'amenities': fields.List(fields.Nested(amenity_model), description='List of amenities'),
-})
-
-# Define place update model with optional fields
-place_update_model = api.model('Place', {
-    'title': fields.String(required=False, description='Title of the place'),
-    'description': fields.String(description='Description of the place'),
-    'price': fields.Float(required=False, description='Price per night'),
-    'latitude': fields.Float(required=False, description='Latitude of the place'),
-    'longitude': fields.Float(required=False, description='Longitude of the place'),
-    'max_person': fields.Integer(required=False, description='Maximum number of persons allowed'),
-    'amenities': fields.List(fields.Nested(amenity_model), description='List of amenities'),
-})
+# Attach the shared place models referenced by this namespace
+register_models(api, place_amenity_model, place_user_model, admin_place_update_model,
+                admin_place_response_model, admin_place_update_response_model)
+
+
+def _serialize_place(place):
+    """
+    Build the JSON-ready representation of a place with its owner and amenities.
+
+    Built by hand instead of marshal(): RESTX marshalling walks the model
+    field by field for every response, while this is one dict literal.
+    admin_place_response_model documents the same shape for Swagger.
+
+    Args:
+        place (Place): The place instance, with owner and amenities loaded
+
+    Returns:
+        dict: Place attributes, owner summary and amenity (id, name) pairs
+    """
+    # Owner is loaded together with the place by facade.get_place()
+    owner = place.owner
+    return {
+        'id': place.id,
+        'title': place.title,
+        'description': place.description,
+        'price': place.price,
+        'latitude': place.latitude,
+        'longitude': place.longitude,
+        'owner_id': place.owner_id,
+        'max_person': place.max_person,
+        'owner': {
+            'id': owner.id,
+            'first_name': owner.first_name,
+            'last_name': owner.last_name,
+            'email': owner.email
+        },
+        'amenities': [{'id': amenity.id, 'name': amenity.name} for amenity in place.amenities]
+    }
+
+
+def _serialize_updated_place(place):
+    """
+    Build the JSON-ready representation of an updated place.
+
+    Same shape as admin_place_update_response_model: place attributes and the
+    amenity names, without the owner summary.
+
+    Args:
+        place (Place): The updated place instance
+
+    Returns:
+        dict: Place attributes and amenity names
+    """
+    return {
+        'id': place.id,
+        'title': place.title,
+        'description': place.description,
+        'price': place.price,
+        'latitude': place.latitude,
+        'longitude': place.longitude,
+        'owner_id': place.owner_id,
+        'max_person': place.max_person,
+        'amenities': [amenity.name for amenity in place.amenities]
+    }
+
+
+def _authorize_place(place_id):
+    """
+    Load a place on behalf of the current caller, enforcing admin-or-owner access.
+
+    Non-admin callers are checked with a single-column owner lookup first, so a
+    foreign or missing place is rejected without loading it. Must run inside a
+    request already verified by @cached_jwt_required.
+
+    Args:
+        place_id (str): The UUID of the place
+
+    Returns:
+        tuple: (place, None) when access is granted,
+               or (None, (error_body, status_code)) for 404/403
+    """
+    # Read caller identity and admin flag verified by @cached_jwt_required
+    user_id, is_admin = current_principal()
+
+    # Non-admins: only the place owner is allowed, decided before loading the place
+    if not is_admin:
+        owner_id = facade.get_place_owner_id(place_id)
+        if owner_id is None:
+            return None, ({'error': 'Place not found'}, 404)
+        if owner_id != user_id:
+            return None, ({'error': 'Unauthorized action'}, 403)
+
+    try:
+        # Load the full place (owner and amenities eagerly loaded)
+        return facade.get_place(place_id), None
+
+    except (ValueError, KeyError):
+        # Handle case where place doesn't exist
+        return None, ({'error': 'Place not found'}, 404)
 
 
 @api.route('/places/<place_id>')
@@ -71,10 +133,10 @@ class AdminPlaceModify(Resource):
         delete(place_id): Delete specific place (admin or owner)
     """
 
-    @api.response(200, 'Place retrieved successfully')
+    @api.response(200, 'Place retrieved successfully', admin_place_response_model)
     @api.response(404, 'Place not found')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @cached_jwt_required
     def get(self, place_id):
         """
         Retrieve a place by its ID. Only admins or the owner can view.
@@ -120,53 +182,20 @@ class AdminPlaceModify(Resource):
                 "error": "Unauthorized action"
             }
         """
-        # Get current user identity and claims from JWT token
-        current_user = get_jwt_identity()
-        claims = get_jwt()
+        # Resolve the place and check the caller may access it (admin or owner)
+        place, error = _authorize_place(place_id)
+        if error:
+            return error
 
-        # Extract admin status and user ID for authorization
-        is_admin = claims.get('is_admin', False)
-        user_id = current_user
+        # Return the place with its owner and amenities, built without RESTx marshalling
+        return _serialize_place(place), 200
 
-        try:
-            # Retrieve place from facade using provided ID
-            place = facade.get_place(place_id)
-
-        except (ValueError, KeyError):
-            # Handle case where place doesn't exist
-            return {'error': 'Place not found'}, 404
-
-        # Check authorization: only admin or place owner can access
-        if not is_admin and place.owner.id != user_id:
-            return {'error': 'Unauthorized action'}, 403
-
-        # Return complete place data including nested owner and amenities
-        return {
-            'id': place.id,
-            'title': place.title,
-            'description': place.description,
-            'price': place.price,
-            'latitude': place.latitude,
-            'longitude': place.longitude,
-            'owner_id': place.owner.id,
-            'max_person': place.max_person,
-            'owner': {
-                'id': place.owner.id,
-                'first_name': place.owner.first_name,
-                'last_name': place.owner.last_name,
-                'email': place.owner.email
-            },
-            'amenities': [
-                {'id': a.id, 'name': a.name} for a in place.amenities
-            ]
-        }, 200
-
-    @api.expect(place_update_model)
-    @api.response(200, 'Place updated successfully')
+    @api.expect(admin_place_update_model)
+    @api.response(200, 'Place updated successfully', admin_place_update_response_model)
     @api.response(404, 'Place not found')
     @api.response(403, 'Unauthorized action')
     @api.response(400, 'Invalid input data')
-    @jwt_required()
+    @cached_jwt_required
     def put(self, place_id):
         """
         Update a place by its ID. Only admins or the owner can update.
@@ -214,58 +243,24 @@ class AdminPlaceModify(Resource):
                 "error": "Invalid input data"
             }
         """
-        # Get current user identity and claims from JWT token
-        current_user = get_jwt_identity()
-        claims = get_jwt()
-
-        # Extract admin status and user ID for authorization
-        is_admin = claims.get('is_admin', False)
-        user_id = current_user
-
-        try:
-            # Verify place exists before attempting update
-            place = facade.get_place(place_id)
-
-        except (ValueError, KeyError):
-            # Handle case where place doesn't exist
-            return {'error': 'Place not found'}, 404
-
-        # Check authorization: only admin or place owner can update
-        if not is_admin and place.owner.id != user_id:
-            return {'error': 'Unauthorized action'}, 403
+        # Resolve the place and check the caller may update it (admin or owner)
+        place, error = _authorize_place(place_id)
+        if error:
+            return error
 
         # Extract place data from request payload
         place_api = api.payload
 
-        try:
-            # Attempt to update place with new data through facade
-            place_data = facade.update_place(place_id, place_api)
-
-            # Return updated place data with amenity names
-            return {
-                'id': place_data.id,
-                'title': place_data.title,
-                'description': place_data.description,
-                'price': place_data.price,
-                'latitude': place_data.latitude,
-                'longitude': place_data.longitude,
-                'owner_id': place_data.owner.id,
-                'max_person': place_data.max_person,
-                'amenities': [amenity.name for amenity in place_data.amenities]
-            }, 200
-
-        except ValueError as e:
-            # Handle business validation errors with specific error message
-            return {'error': str(e)}, 400
-
-        except Exception as e:
-            # Handle unexpected errors with detailed error information
-            return {'error': 'Internal server error', 'details': str(e)}, 500
+        # Update the already-loaded place; validation errors become 400 via the API error handler
+        place_data = facade.update_place_obj(place, place_api)
+
+        # Return the updated place (amenity names only), built without RESTx marshalling
+        return _serialize_updated_place(place_data), 200
 
     @api.response(204, 'Place deleted successfully')
     @api.response(404, 'Place not found')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @cached_jwt_required
     def delete(self, place_id):
         """
         Delete a place by its ID. Only admins or the owner can delete.
@@ -290,33 +285,20 @@ class AdminPlaceModify(Resource):
                 "error": "Place not found"
             }
         """
-        # Get current user identity and claims from JWT token
-        current_user = get_jwt_identity()
-        claims = get_jwt()
-
-        # Extract admin status and user ID for authorization
-        is_admin = claims.get('is_admin', False)
-        user_id = current_user
+        # Identify the caller from the verified token
+        user_id, is_admin = current_principal()
 
         try:
-            # Verify place exists before attempting deletion
-            place = facade.get_place(place_id)
+            # Delete in one statement gated on ownership (unless admin)
+            facade.delete_place_if_owner(place_id, user_id, is_admin)
 
-        except (ValueError, KeyError):
+        except ValueError:
             # Handle case where place doesn't exist
             return {'error': 'Place not found'}, 404
 
-        # Check authorization: only admin or place owner can delete
-        if not is_admin and place.owner.id != user_id:
+        except PermissionError:
+            # Caller is neither admin nor the owner of the place
             return {'error': 'Unauthorized action'}, 403
 
-        try:
-            # Attempt to delete place through facade
-            facade.delete_place(place_id)
-
-            # Return empty response with 204 status on successful deletion
-            return '', 204
-
-        except Exception:
-            # Handle unexpected errors during deletion
-            return {'error': 'Internal server error'}, 500
+        # Return empty response with 204 status on successful deletion
+        return '', 204
@@ -1,25 +1,74 @@
 # Import necessary modules for admin review management functionality
-from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
-from flask import request
+from flask_restx import Namespace, Resource
 from app.services import facade
+from app.services.exceptions import NotFoundError
+from app.api.v1.models import register_models, admin_review_update_model
+from app.utils.jwt_cache import cached_jwt_required, current_principal
+from app.utils.validation import PayloadSchema
 
 # Create RESTx namespace for admin review operations
 api = Namespace('admin', description='Admin operations')
 
-# Define Review model for input validation and Swagger documentation
-review_model = api.model('Review', {
-    'text': fields.String(required=True, description='Text of the review'),
-    'rating': fields.Integer(required=True, description='Rating of the place (1-5)'),
-    'user_id': fields.String(required=True, description='ID of the user'),
-    'place_id': fields.String(required=True, description='ID of the place')
-})
+# Attach the shared review models referenced by this namespace
+register_models(api, admin_review_update_model)
 
-# Define review update model with optional fields
-review_update_model = api.model('Review', {
-    'text': fields.String(required=False, description='Text of the review'),
-    'rating': fields.Integer(required=False, description='Rating of the place (1-5)'),
-})
+# Payload validator compiled once at import (the shared model only documents the API)
+review_update_schema = PayloadSchema({'text': str, 'rating': int})
+
+
+def _serialize_review(review):
+    """
+    Build the JSON-ready representation of a review.
+
+    A single flat dict literal shared by every handler that returns a review,
+    so each response costs one function call and one dict build. Author and
+    place are emitted from the foreign key columns, so the related rows are
+    never lazy-loaded.
+
+    Args:
+        review (Review): The review instance to serialize
+
+    Returns:
+        dict: Review ID, text, rating, and the IDs of its author and place
+    """
+    return {
+        'id': review.id,
+        'text': review.text,
+        'rating': review.rating,
+        'user_id': review.user_id,
+        'place_id': review.place_id
+    }
+
+
+def _authorize_review(review_id):
+    """
+    Load a review on behalf of the current caller, enforcing admin-or-author access.
+
+    Must run inside a request already verified by @cached_jwt_required.
+
+    Args:
+        review_id (str): The UUID of the review
+
+    Returns:
+        tuple: (review, None) when access is granted,
+               or (None, (error_body, status_code)) for 404/403
+    """
+    # Read caller identity and admin flag verified by @cached_jwt_required
+    user_id, is_admin = current_principal()
+
+    try:
+        # Retrieve review from facade using provided ID
+        review = facade.get_review(review_id)
+
+    except (ValueError, KeyError):
+        # Handle case where review doesn't exist
+        return None, ({'error': 'Review not found'}, 404)
+
+    # Check authorization: only admin or review author can proceed
+    if not is_admin and review.user_id != user_id:
+        return None, ({'error': 'Unauthorized action'}, 403)
+
+    return review, None
 
 
 @api.route('/reviews/<review_id>')
@@ -43,7 +92,7 @@ class AdminReviewResource(Resource):
     @api.response(200, 'Review retrieved successfully')
     @api.response(404, 'Review not found')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @cached_jwt_required
     def get(self, review_id):
         """
         Retrieve a review by its ID. Only admins or the review's author can view it.
@@ -76,41 +125,20 @@ class AdminReviewResource(Resource):
                 "error": "Unauthorized action"
             }
         """
-        # Get current user identity and claims from JWT token
-        current_user = get_jwt_identity()
-        claims = get_jwt()
-
-        # Extract admin status and user ID for authorization
-        is_admin = claims.get('is_admin', False)
-        user_id = current_user
-
-        try:
-            # Retrieve review from facade using provided ID
-            review = facade.get_review(review_id)
-
-        except (ValueError, KeyError):
-            # Handle case where review doesn't exist
-            return {'error': 'Review not found'}, 404
-
-        # Check authorization: only admin or review author can access
-        if not is_admin and review.user.id != user_id:
-            return {'error': 'Unauthorized action'}, 403
+        # Resolve the review and check the caller may access it (admin or author)
+        review, error = _authorize_review(review_id)
+        if error:
+            return error
 
         # Return review data with associated user and place IDs
-        return {
-            'id': review.id,
-            'text': review.text,
-            'rating': review.rating,
-            'user_id': review.user.id,
-            'place_id': review.place.id
-        }, 200
-
-    @api.expect(review_update_model)
+        return _serialize_review(review), 200
+
+    @api.expect(admin_review_update_model, validate=False)
     @api.response(200, 'Review updated successfully')
     @api.response(404, 'Review not found')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @cached_jwt_required
     def put(self, review_id):
         """
         Update a review by its ID. Only admins or the review's author can update.
@@ -149,54 +177,35 @@ class AdminReviewResource(Resource):
                 "error": "Invalid input data"
             }
         """
-        # Get current user identity and claims from JWT token
-        current_user = get_jwt_identity()
-        claims = get_jwt()
-
-        # Extract admin status and user ID for authorization
-        is_admin = claims.get('is_admin', False)
-        user_id = current_user
+        # Identify the caller from the verified token
+        user_id, is_admin = current_principal()
 
         try:
-            # Verify review exists before attempting update
-            review = facade.get_review(review_id)
+            # Keep only known, correctly typed fields from the request body
+            review_api = review_update_schema.validate(api.payload)
 
-        except (ValueError, KeyError):
+            # Update in one statement gated on authorship (unless admin)
+            review_data = facade.update_review_if_author(review_id, review_api, user_id, is_admin)
+
+        except NotFoundError:
             # Handle case where review doesn't exist
             return {'error': 'Review not found'}, 404
 
-        # Check authorization: only admin or review author can update
-        if not is_admin and review.user.id != user_id:
+        except PermissionError:
+            # Caller is neither admin nor the author of the review
             return {'error': 'Unauthorized action'}, 403
 
-        # Extract review data from request payload
-        review_api = api.payload
-
-        try:
-            # Attempt to update review with new data through facade
-            review_data = facade.update_review(review_id, review_api)
-
-            # Return updated review data
-            return {
-                'id': review_data.id,
-                'text': review_data.text,
-                'rating': review_data.rating,
-                'place_id': review_data.place.id,
-                'user_id': review_data.user.id
-            }, 200
-
         except ValueError as e:
-            # Handle business validation errors with specific error message
+            # Payload failed schema validation
             return {'error': str(e)}, 400
 
-        except Exception as e:
-            # Handle unexpected errors with detailed error information
-            return {'error': 'Internal server error', 'details': str(e)}, 500
+        # Return updated review data
+        return _serialize_review(review_data), 200
 
     @api.response(200, 'Review deleted successfully')
     @api.response(404, 'Review not found')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @cached_jwt_required
     def delete(self, review_id):
         """
         Delete a review by its ID. Only admins or the review's author can delete.
@@ -227,40 +236,19 @@ class AdminReviewResource(Resource):
                 "error": "Review not found"
             }
         """
-        # Get current user identity and claims from JWT token
-        current_user = get_jwt_identity()
-        claims = get_jwt()
-
-        # Extract admin status and user ID for authorization
-        is_admin = claims.get('is_admin', False)
-        user_id = current_user
+        # Identify the caller from the verified token
+        user_id, is_admin = current_principal()
 
         try:
-            # Verify review exists before attempting deletion
-            review = facade.get_review(review_id)
+            # Delete in one statement gated on authorship (unless admin)
+            facade.delete_review_if_author(review_id, user_id, is_admin)
 
-        except (ValueError, KeyError):
+        except ValueError:
             # Handle case where review doesn't exist
             return {'error': 'Review not found'}, 404
 
-        # Check authorization: only admin or review author can delete
-        if not is_admin and review.user.id != user_id:
+        except PermissionError:
+            # Caller is neither admin nor the author of the review
             return {'error': 'Unauthorized action'}, 403
 
-        try:
-            # Attempt to delete review through facade
-            review_data = facade.delete_review(review_id)
-
-            # Check if deletion was successful
-            if not review_data:
-                return {'error': 'Review not found'}, 404
-            else:
-                return {'message': 'Review successfully deleted'}, 200
-
-        except ValueError as e:
-            # Handle business validation errors with specific error message
-            return {'error': str(e)}, 400
-
-        except Exception as e:
-            # Handle unexpected errors with detailed error information
-            return {'error': 'Internal server error', 'details': str(e)}, 500
+        return {'message': 'Review successfully deleted'}, 200
@@ -1,28 +1,42 @@
 # Import necessary modules for admin user management functionality
-from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask_restx import Namespace, Resource
 from app.services import facade
-
-# Create RESTx namespace for admin user operations
+from app.api.v1.responses import (
+    error_body,
+    etag_header,
+    is_not_modified,
+    json_response,
+    no_content,
+    not_modified,
+    version_tag,
+)
+from app.api.v1.serializers import user_to_dict
+from app.api.v1.models import (
+    register_models,
+    admin_user_model,
+    admin_user_update_model,
+    admin_user_batch_model,
+)
+from app.services.exceptions import EmailAlreadyRegistered, NotFoundError
+from app.utils.validation import PayloadSchema
+
+# Create RESTx namespace for admin user operations.
+# Every route is admin-only: create_app() rejects other callers of
+# /api/v1/admin/users before dispatch (see ADMIN_ONLY_PREFIXES).
 api = Namespace('admin', description='Admin operations')
 
-# Define user model for validation and Swagger documentation
-user_model = api.model('User', {
-    'first_name': fields.String(required=True, description='First name of the user'),
-    'last_name': fields.String(required=True, description='Last name of the user'),
-    'email': fields.String(required=True, description='Email of the user'),
-    'password': fields.String(required=True, description='Password of the user'),
-    'is_admin': fields.Boolean(required=True, description='Admin status')
-})
-
-# Define user update model with optional fields
-user_update_model = api.model('User', {
-    'first_name': fields.String(required=False, description='First name of the user'),
-    'last_name': fields.String(required=False, description='Last name of the user'),
-    'email': fields.String(required=False, description='Email of the user'),
-    'password': fields.String(required=False, description='Password of the user'),
-    'is_admin': fields.Boolean(required=False, description='Admin status')
-})
+# Attach the shared user models referenced by this namespace
+register_models(api, admin_user_model, admin_user_update_model, admin_user_batch_model)
+
+# Payload validators compiled once at import (the shared models only document the API)
+user_schema = PayloadSchema(
+    {'first_name': str, 'last_name': str, 'email': str, 'password': str, 'is_admin': bool},
+    required=('first_name', 'last_name', 'email', 'password', 'is_admin'))
+user_update_schema = PayloadSchema(
+    {'first_name': str, 'last_name': str, 'email': str, 'password': str, 'is_admin': bool})
+
+# Error bodies encoded once at import
+_USER_NOT_FOUND = error_body('User not found')
 
 
 @api.route('/users/<user_id>')
@@ -44,9 +58,9 @@ class AdminUserResource(Resource):
     """
 
     @api.response(200, 'User retrieved successfully')
+    @api.response(304, 'User not modified since the version in If-None-Match')
     @api.response(404, 'User not found')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
     def get(self, user_id):
         """
         Retrieve a user by their ID. Only admins can view users.
@@ -61,7 +75,8 @@ class AdminUserResource(Resource):
             Authorization: Bearer <jwt_token> (with admin privileges)
 
         Returns:
-            dict: User data without password (200),
+            dict: User data without password and a weak ETag header (200),
+                  or an empty response when If-None-Match names the current version (304),
                   or error message for access denied (403),
                   or user not found (404)
 
@@ -79,34 +94,29 @@ class AdminUserResource(Resource):
                 "error": "Admin privileges required"
             }
         """
-        # Check admin privileges from JWT token claims
-        claims = get_jwt()
-        if not claims.get('is_admin'):
-            return {'error': 'Admin privileges required'}, 403
+        # Read only the user's version first
+        updated_at = facade.get_user_meta(user_id)
+        if updated_at is None:
+            return json_response(_USER_NOT_FOUND, 404)
 
-        try:
-            # Retrieve user from facade using provided ID
-            user = facade.get_user(user_id)
+        # Client already holds this version: skip loading and serializing the user
+        tag = version_tag(user_id, updated_at)
+        if is_not_modified(tag):
+            return not_modified(tag)
 
-        except (ValueError, KeyError):
-            # Handle case where user doesn't exist
-            return {'error': 'User not found'}, 404
-
-        # Return user data excluding password for security
-        return {
-            'id': user.id,
-            'first_name': user.first_name,
-            'last_name': user.last_name,
-            'email': user.email,
-            'is_admin': user.is_admin
-        }, 200
-
-    @api.expect(user_update_model)
+        # Retrieve user from facade using provided ID
+        user = facade.get_user_or_none(user_id)
+        if user is None:
+            return json_response(_USER_NOT_FOUND, 404)
+
+        # Return user data excluding password for security, tagged with its version
+        return user_to_dict(user), 200, {'ETag': etag_header(tag)}
+
+    @api.expect(admin_user_update_model, validate=False)
     @api.response(200, 'User updated successfully')
     @api.response(404, 'User not found')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
     def put(self, user_id):
         """
         Update a user by their ID. Only admins can update users.
@@ -148,61 +158,27 @@ class AdminUserResource(Resource):
                 "error": "Email is already in use"
             }
         """
-        # Get current user identity and claims from JWT token
-        current_user = get_jwt_identity()
-        claims = get_jwt()
-
-        # Extract user data from request payload
-        user_api = api.payload
-
-        # Check admin privileges
-        if not claims.get('is_admin'):
-            return {'error': 'Admin privileges required'}, 403
-
-        # Validate email uniqueness if email is being updated
-        email = user_api.get('email')
-        if email:
-            # Clean and normalize email address
-            email = email.strip().lower()
-
-            # Check if email is already in use by another user
-            existing_user = facade.get_user_by_email(email)
-            if existing_user and str(existing_user.id) != user_id:
-                return {'error': 'Email is already in use'}, 400
-
         try:
-            # Verify user exists before attempting update
-            user = facade.get_user(user_id)
+            # Keep only known, correctly typed fields from the request body
+            user_api = user_update_schema.validate(api.payload)
 
-        except (ValueError, KeyError):
-            # Handle case where user doesn't exist
-            return {'error': 'User not found'}, 404
+            # Update in a single statement; existence and email uniqueness are checked by the database
+            user_data = facade.update_user_atomic(user_id, user_api)
 
-        try:
-            # Attempt to update user with new data through facade
-            user_data = facade.update_user(user_id, user_api)
-
-            # Return updated user data excluding password
-            return {
-                'id': user_data.id,
-                'first_name': user_data.first_name,
-                'last_name': user_data.last_name,
-                'email': user_data.email,
-                'is_admin': user_data.is_admin
-            }, 200
+        except NotFoundError:
+            # Handle case where user doesn't exist
+            return json_response(_USER_NOT_FOUND, 404)
 
         except ValueError as e:
-            # Handle business validation errors with specific error message
+            # Handle business validation errors (invalid or already used email)
             return {'error': str(e)}, 400
 
-        except Exception as e:
-            # Handle unexpected errors with generic error message
-            return {'error': 'Internal server error'}, 500
+        # Return updated user data excluding password
+        return user_to_dict(user_data), 200
 
     @api.response(204, 'User deleted successfully')
     @api.response(404, 'User not found')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
     def delete(self, user_id):
         """
         Delete a user by their ID. Only admins can delete users.
@@ -227,29 +203,16 @@ class AdminUserResource(Resource):
                 "error": "User not found"
             }
         """
-        # Check admin privileges from JWT token claims
-        claims = get_jwt()
-        if not claims.get('is_admin'):
-            return {'error': 'Admin privileges required'}, 403
-
-        try:
-            # Verify user exists before attempting deletion
-            user = facade.get_user(user_id)
-
-        except (ValueError, KeyError):
-            # Handle case where user doesn't exist
-            return {'error': 'User not found'}, 404
+        # Verify user exists before attempting deletion
+        if facade.get_user_or_none(user_id) is None:
+            return json_response(_USER_NOT_FOUND, 404)
 
         try:
-            # Attempt to delete user through facade
+            # Delete user through facade (the user is already in the session identity map)
             facade.delete_user(user_id)
 
             # Return empty response with 204 status on successful deletion
-            return '', 204
-
-        except (ValueError, KeyError):
-            # Handle case where user doesn't exist during deletion
-            return {'error': 'User not found'}, 404
+            return no_content()
 
         except Exception:
             # Handle unexpected errors during deletion
@@ -271,11 +234,10 @@ class AdminUserCreate(Resource):
         post(): Create new user account (admin only)
     """
 
-    @api.expect(user_model, validate=True)
+    @api.expect(admin_user_model, validate=False)
     @api.response(201, 'User successfully created')
     @api.response(400, 'Invalid input or email already registered')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
     def post(self):
         """
         Create a new user. Only admins can create users.
@@ -313,38 +275,19 @@ class AdminUserCreate(Resource):
                 "error": "Email already registered"
             }
         """
-        # Get current user identity and claims from JWT token
-        current_user = get_jwt_identity()
-        claims = get_jwt()
-
-        # Check admin privileges
-        if not claims.get('is_admin'):
-            return {'error': 'Admin privileges required'}, 403
-
         try:
-            # Extract user data from request payload
-            user_data = api.payload
-
-            # Clean and validate email address
-            email = user_data.get('email')
-            if email:
-                email = email.strip().lower()
-
-            # Check if email is already registered
-            if facade.get_user_by_email(email):
-                return {'error': 'Email already registered'}, 400
+            # Keep only known, correctly typed fields from the request body
+            user_data = user_schema.validate(api.payload)
 
-            # Create new user through facade with validation
+            # Create new user through facade; duplicate emails are rejected by the unique index
             new_user = facade.create_user(user_data)
 
             # Return created user data excluding password for security
-            return {
-                'id': new_user.id,
-                'first_name': new_user.first_name,
-                'last_name': new_user.last_name,
-                'email': new_user.email,
-                'is_admin': new_user.is_admin
-            }, 201
+            return user_to_dict(new_user), 201
+
+        except EmailAlreadyRegistered:
+            # Email already belongs to another account
+            return {'error': 'Email already registered'}, 400
 
         except ValueError as e:
             # Handle business validation errors with specific error message
@@ -353,3 +296,57 @@ class AdminUserCreate(Resource):
         except Exception as e:
             # Handle unexpected errors with generic error message
             return {'error': 'Internal server error'}, 500
+
+
+@api.route('/users/batch')
+class AdminUserBatch(Resource):
+    """
+    Resource for admin bulk user lookup.
+
+    Lets admin interfaces that display many users fetch them in a single request
+    instead of calling GET /users/<user_id> once per user.
+
+    Attributes:
+        None
+
+    Methods:
+        post(): Retrieve several users by ID (admin only)
+    """
+
+    @api.expect(admin_user_batch_model, validate=True)
+    @api.response(200, 'Users retrieved successfully')
+    @api.response(400, 'Invalid input data')
+    @api.response(403, 'Unauthorized action')
+    def post(self):
+        """
+        Retrieve several users by their IDs. Only admins can view users.
+
+        Users are loaded with one IN query per 100 IDs. Unknown IDs are skipped,
+        so the response may contain fewer users than requested.
+
+        Expected Input:
+            - ids (list[str]): IDs of the users to retrieve
+
+        Headers Required:
+            Authorization: Bearer <jwt_token> (with admin privileges)
+
+        Returns:
+            list: User data without passwords, in request order (200),
+                  or error message for access denied (403)
+
+        Example Success Response:
+            [
+                {
+                    "id": "12345",
+                    "first_name": "John",
+                    "last_name": "Doe",
+                    "email": "john.doe@example.com",
+                    "is_admin": false
+                }
+            ]
+        """
+        # Load all requested users in chunked IN queries
+        users = facade.get_users_by_ids(api.payload['ids'])
+
+        # Return user data excluding passwords
+        return [user_to_dict(user) for user in users], 200
@@ -1,16 +1,58 @@
 # Import necessary modules for amenity management functionality
-from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask import request
+from flask_restx import Namespace, Resource
 from app.services import facade
+from app.api.v1.models import register_models, amenity_model
+from app.api.v1.serializers import AmenityOut
+from app.api.v1.responses import (
+    compressed_json_response,
+    content_tag,
+    encode_json,
+    error_body,
+    etag_header,
+    is_not_modified,
+    json_response,
+    no_content,
+    not_modified,
+    version_tag,
+)
+from app.services.exceptions import NotFoundError
+from app.utils.jwt_cache import admin_required
+from app.utils.validation import PayloadSchema
 
 # Create Flask-RESTx namespace for amenity operations
 api = Namespace('amenities', description='Amenity operations')
 
-# Define data model for input validation and Swagger documentation
-amenity_model = api.model('Amenity', {
-    # Required field: amenity name
-    'name': fields.String(required=True, description='Name of the amenity')
-})
+# Amenities are read-mostly: let clients and proxies reuse a GET for 30 seconds
+_CACHE_CONTROL = 'public, max-age=30'
+
+# Error responses documented on every admin write, declared once for all handlers
+_ADMIN_WRITE_RESPONSES = {400: 'Invalid input data', 403: 'Admin privileges required'}
+
+# Payload validator compiled once at import (amenity_model only documents the API)
+amenity_schema = PayloadSchema({'name': str}, required=('name',))
+
+# Error bodies encoded once at import
+_AMENITY_NOT_FOUND = error_body('Amenity not found')
+
+# Attach the shared amenity model referenced by this namespace
+register_models(api, amenity_model)
+
+
+def _amenity_row(row):
+    """
+    orjson default hook turning a projected (id, name) row into an amenity object.
+
+    Rows are not serialized natively by orjson, so it calls this hook for each
+    one while encoding the list: no intermediate list of dicts is built first.
+
+    Args:
+        row (Row): A row from facade.list_amenities_projected()
+
+    Returns:
+        dict: The amenity as {'id': ..., 'name': ...}
+    """
+    return {'id': row[0], 'name': row[1]}
 
 
 @api.route('/')
@@ -30,11 +72,9 @@ class AmenityList(Resource):
         get(): Retrieve all amenities
     """
 
-    @api.expect(amenity_model)
-    @api.response(201, 'Amenity successfully created')
-    @api.response(400, 'Invalid input data')
-    @api.response(403, 'Admin privileges required')
-    @jwt_required()
+    @api.expect(amenity_model, validate=False)
+    @api.doc(responses={201: 'Amenity successfully created', **_ADMIN_WRITE_RESPONSES})
+    @admin_required
     def post(self):
         """
         Create a new amenity. Only admins can create amenities.
@@ -66,33 +106,27 @@ class AmenityList(Resource):
                 "error": "Admin privileges required"
             }
         """
-        # Check admin privileges from JWT token claims
-        claims = get_jwt()
-        if not claims.get('is_admin', False):
-            return {'error': 'Admin privileges required'}, 403
-
-        # Extract amenity data from request payload
-        amenity_data = api.payload
+        # Parse the body once (orjson via the app's JSON provider; cached on the request)
+        amenity_data = request.get_json(cache=True)
 
         try:
-            # Call facade to create new amenity with validation
+            # Keep only the typed 'name' field; anything malformed is a 400
+            amenity_data = amenity_schema.validate(amenity_data)
+
+            # Call facade to create new amenity (database errors reach the SQLAlchemyError handler)
             new_amenity = facade.create_amenity(amenity_data)
 
             # Return created amenity data with success status
-            return {
-                'id': new_amenity.id,
-                'name': new_amenity.name
-            }, 201
+            return AmenityOut.of(new_amenity), 201
 
         except ValueError as e:
             # Handle business validation errors with specific error message
             return {'error': str(e)}, 400
 
-        except Exception as e:
-            # Handle unexpected errors with generic error message
-            return {'error': 'Internal server error'}, 500
-
-    @api.response(200, 'List of amenities retrieved successfully')
+    @api.doc(responses={
+        200: 'List of amenities retrieved successfully',
+        304: 'List not modified since the version in If-None-Match',
+    })
     def get(self):
         """
         Retrieve all amenities.
@@ -101,7 +135,9 @@ class AmenityList(Resource):
         No authentication is required for this operation.
 
         Returns:
-            list: List of amenities with their IDs and names (200)
+            list: List of amenities with their IDs and names and a weak ETag
+                  computed from the encoded body (200),
+                  or an empty response when If-None-Match names the current list (304)
 
         Example Response:
             [
@@ -110,11 +146,20 @@ class AmenityList(Resource):
                 {"id": "3", "name": "Parking"}
             ]
         """
-        # Retrieve all amenities from the facade layer
-        amenities = facade.get_all_amenities()
+        # Read (id, name) rows in one projected query, without building ORM instances
+        rows = facade.list_amenities_projected()
+
+        # Encode the rows in one orjson pass; its hash identifies this version of the catalog
+        body = encode_json(rows, default=_amenity_row)
+        tag = content_tag(body)
 
-        # Return list of amenities with ID and name for each
-        return [{'id': a.id, 'name': a.name} for a in amenities], 200
+        # Client already holds this version: send no body
+        if is_not_modified(tag):
+            return not_modified(tag)
+
+        # Return the encoded list directly (gzipped once per version), bypassing RESTx marshalling
+        return compressed_json_response(
+            body, tag, headers={'ETag': etag_header(tag), 'Cache-Control': _CACHE_CONTROL})
 
 
 @api.route('/<amenity_id>')
@@ -135,8 +180,11 @@ class AmenityResource(Resource):
         delete(amenity_id): Delete specific amenity (admin only)
     """
 
-    @api.response(200, 'Amenity retrieved successfully')
-    @api.response(404, 'Amenity not found')
+    @api.doc(responses={
+        200: 'Amenity retrieved successfully',
+        304: 'Amenity not modified since the version in If-None-Match',
+        404: 'Amenity not found',
+    })
     def get(self, amenity_id):
         """
         Retrieve a specific amenity by its ID.
@@ -148,7 +196,8 @@ class AmenityResource(Resource):
             amenity_id (str): Unique identifier of the amenity
 
         Returns:
-            dict: Amenity data with ID and name (200),
+            dict: Amenity data with ID and name and a weak ETag header (200),
+                  or an empty response when If-None-Match names the current version (304),
                   or error message if amenity not found (404)
 
         Example Success Response:
@@ -162,22 +211,26 @@ class AmenityResource(Resource):
                 "error": "Amenity not found"
             }
         """
-        # Retrieve amenity from facade using provided ID
-        amenity = facade.get_amenity(amenity_id)
-
-        # Check if amenity exists
-        if not amenity:
-            return {'error': 'Amenity not found'}, 404
-
-        # Return amenity data with ID and name
-        return {'id': amenity.id, 'name': amenity.name}, 200
-
-    @api.expect(amenity_model)
-    @api.response(200, 'Amenity updated successfully')
-    @api.response(404, 'Amenity not found')
-    @api.response(400, 'Invalid input data')
-    @api.response(403, 'Admin privileges required')
-    @jwt_required()
+        try:
+            # Retrieve amenity from facade using provided ID
+            amenity = facade.get_amenity(amenity_id)
+        except ValueError:
+            # Unknown ID: facade.get_amenity() raises rather than returning None
+            return json_response(_AMENITY_NOT_FOUND, 404)
+
+        # Tag the amenity with its last modification time instead of hashing the body
+        tag = version_tag(amenity.id, amenity.updated_at)
+        if is_not_modified(tag):
+            return not_modified(tag)
+
+        # Return amenity data with ID and name, tagged with its version
+        return AmenityOut.of(amenity), 200, {
+            'ETag': etag_header(tag), 'Cache-Control': _CACHE_CONTROL}
+
+    @api.expect(amenity_model, validate=False)
+    @api.doc(responses={
+        200: 'Amenity updated successfully', 404: 'Amenity not found', **_ADMIN_WRITE_RESPONSES})
+    @admin_required
     def put(self, amenity_id):
         """
         Update a specific amenity. Only admins can update amenities.
@@ -212,40 +265,30 @@ class AmenityResource(Resource):
                 "error": "Amenity not found"
             }
         """
-        # Check admin privileges from JWT token claims
-        claims = get_jwt()
-        if not claims.get('is_admin', False):
-            return {'error': 'Admin privileges required'}, 403
-
-        # Extract updated amenity data from request payload
-        amenity_api = api.payload
+        # Parse the body once (orjson via the app's JSON provider; cached on the request)
+        amenity_api = request.get_json(cache=True)
 
         try:
+            # Keep only the typed 'name' field; anything malformed is a 400
+            amenity_api = amenity_schema.validate(amenity_api)
+
             # Call facade to update amenity with new data
             amenity_data = facade.update_amenity(amenity_id, amenity_api)
 
-            # Check if amenity was found and updated
-            if not amenity_data:
-                return {'error': 'Amenity not found'}, 404
-
             # Return updated amenity data
-            return {
-                'id': amenity_data.id,
-                'name': amenity_data.name
-            }, 200
+            return AmenityOut.of(amenity_data), 200
+
+        except NotFoundError:
+            # Handle case where amenity doesn't exist
+            return json_response(_AMENITY_NOT_FOUND, 404)
 
         except ValueError as e:
             # Handle business validation errors
             return {'error': str(e)}, 400
 
-        except (ValueError, KeyError):
-            # Handle cases where amenity doesn't exist
-            return {'error': 'Amenity not found'}, 404
-
-    @api.response(204, 'Amenity deleted successfully')
-    @api.response(404, 'Amenity not found')
-    @api.response(403, 'Admin privileges required')
-    @jwt_required()
+    @api.doc(responses={
+        204: 'Amenity deleted successfully', 404: 'Amenity not found', 403: 'Admin privileges required'})
+    @admin_required
     def delete(self, amenity_id):
         """
         Delete a specific amenity. Only admins can delete amenities.
@@ -271,22 +314,13 @@ class AmenityResource(Resource):
                 "error": "Amenity not found"
             }
         """
-        # Check admin privileges from JWT token claims
-        claims = get_jwt()
-        if not claims.get('is_admin', False):
-            return {'error': 'Admin privileges required'}, 403
-
         try:
-            # Call facade to delete amenity by ID
+            # Call facade to delete amenity by ID (database errors reach the SQLAlchemyError handler)
             facade.delete_amenity(amenity_id)
 
             # Return empty response with 204 status on successful deletion
-            return '', 204
+            return no_content()
 
         except ValueError:
             # Handle case where amenity doesn't exist
-            return {'error': 'Amenity not found'}, 404
-
-        except Exception:
-            # Handle unexpected errors during deletion
-            return {'error': 'Internal server error'}, 500
+            return json_response(_AMENITY_NOT_FOUND, 404)
@@ -1,7 +1,8 @@
 # Import necessary modules for authentication functionality
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity, get_jwt
+from flask_jwt_extended import create_access_token
 from app.services import facade
+from app.utils.jwt_cache import cached_jwt_required, current_principal
 
 # Create namespace for authentication operations
 api = Namespace('auth', description='Authentication operations')
@@ -60,11 +61,11 @@ class Login(Resource):
             # Extract login data from the request payload
             login_data = api.payload
 
-            # Search for user with the provided email address
-            user = facade.get_user_by_email(login_data['email'])
+            # Look up the user and verify the password (recent logins skip bcrypt)
+            user = facade.authenticate(login_data['email'], login_data['password'])
 
-            # Verify password if user exists
-            if user and user.verify_password(login_data['password']):
+            # Issue a token if the credentials are valid
+            if user is not None:
                 # Create JWT access token with user identity and admin status
                 access_token = create_access_token(
                     identity=str(user.id),
@@ -99,7 +100,7 @@ class ProtectedResource(Resource):
         get(): Return greeting message for authenticated user with admin status
     """
 
-    @jwt_required()
+    @cached_jwt_required
     def get(self):
         """
         Return a greeting message for the authenticated user.
@@ -122,14 +123,8 @@ class ProtectedResource(Resource):
         Raises:
             401: If JWT token is missing, invalid, or expired
         """
-        # Extract current user ID from JWT token identity
-        current_user_id = get_jwt_identity()
-
-        # Get additional claims from JWT token
-        claims = get_jwt()
-
-        # Extract admin status from token claims (default to False if not present)
-        is_admin = claims.get('is_admin', False)
+        # Read user ID and admin status (False if absent) from the token, decoded once
+        current_user_id, is_admin = current_principal()
 
         # Return personalized greeting with user info
         return {
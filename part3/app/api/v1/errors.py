@@ -0,0 +1,51 @@
+# Import necessary modules for centralized API error handling
+from flask import current_app
+from sqlalchemy.exc import SQLAlchemyError
+from app.extensions import db
+from app.services.exceptions import NotFoundError
+
+
+def register_error_handlers(api):
+    """
+    Register the API-wide error handlers on a Flask-RESTX Api instance.
+
+    Handlers registered on an Api (or on any of its namespaces) apply to every
+    resource it serves, so handlers no longer need their own broad try/except
+    blocks for these cases:
+
+    - NotFoundError: the targeted entity does not exist, returned as
+      {'error': <message>} with status 404
+    - ValueError: business validation failures raised by the facade and models,
+      returned as {'error': <message>} with status 400
+    - SQLAlchemyError: database failures; the session is rolled back, the
+      traceback is logged once here, and a generic 500 is returned without
+      leaking exception details to the client
+
+    HTTP errors (abort(), malformed JSON) and JWT errors keep their existing
+    handling; any other unexpected exception still produces Flask-RESTX's
+    default 500 response.
+
+    Args:
+        api (flask_restx.Api): The API to attach the handlers to
+
+    Example:
+        api = Api(app)
+        register_error_handlers(api)
+    """
+
+    @api.errorhandler(NotFoundError)
+    def handle_not_found(error):
+        """Translate missing-entity errors into a 404 response."""
+        return {'error': str(error)}, 404
+
+    @api.errorhandler(ValueError)
+    def handle_value_error(error):
+        """Translate business validation errors into a 400 response."""
+        return {'error': str(error)}, 400
+
+    @api.errorhandler(SQLAlchemyError)
+    def handle_database_error(error):
+        """Roll back the failed transaction, log it, and return a generic 500."""
+        db.session.rollback()
+        current_app.logger.exception(error)
+        return {'error': 'Internal server error'}, 500
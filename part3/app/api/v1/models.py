@@ -0,0 +1,205 @@
+# Shared Flask-RESTX models for the v1 API.
+#
+# Models are built once here as plain flask_restx.Model objects and imported by
+# the namespaces that use them, instead of each endpoint module calling
+# api.model() with the same name. Namespaces attach the models they reference
+# with register_models() so Swagger can resolve them.
+from flask_restx import Model, fields
+
+
+def register_models(namespace, *models):
+    """
+    Register shared models on a namespace for Swagger documentation.
+
+    Args:
+        namespace (flask_restx.Namespace): The namespace using the models
+        *models (flask_restx.Model): The models it references, including nested ones
+
+    Example:
+        register_models(api, place_amenity_model, admin_place_update_model)
+    """
+    # Attach each model under its own name; the model objects themselves are shared
+    for model in models:
+        namespace.add_model(model.name, model)
+
+
+# ==================== PLACE MODELS ====================
+
+# Define amenity model used within a place response
+place_amenity_model = Model('PlaceAmenity', {
+    'id': fields.String(description='Amenity ID'),
+    'name': fields.String(description='Name of the amenity')
+})
+
+# Define user model linked to a place (owner information)
+place_user_model = Model('PlaceUser', {
+    'id': fields.String(description='User ID'),
+    'first_name': fields.String(description='First name of the owner'),
+    'last_name': fields.String(description='Last name of the owner'),
+    'email': fields.String(description='Email of the owner')
+})
+
+# Define review model associated with a place
+place_review_model = Model('PlaceReview', {
+    'id': fields.String(description='Review ID'),
+    'text': fields.String(description='Text of the review'),
+    'rating': fields.Integer(description='Rating of the place (1-5)'),
+    'user_id': fields.String(description='ID of the user')
+})
+
+# Define main model representing a complete place with all relationships
+place_model = Model('Place', {
+    'title': fields.String(required=True, description='Title of the place'),
+    'description': fields.String(required=True, description='Description of the place'),
+    'price': fields.Float(required=True, description='Price per night'),
+    'latitude': fields.Float(required=True, description='Latitude of the place'),
+    'longitude': fields.Float(required=True, description='Longitude of the place'),
+    'owner_id': fields.String(required=True, description='ID of the owner'),
+    'max_person': fields.Integer(required=True, description='Maximum number of persons allowed'),
+    'owner': fields.Nested(place_user_model, description='Owner of the place'),
+    'amenities': fields.List(fields.Nested(place_amenity_model), description='List of amenities'),
+    'reviews': fields.List(fields.Nested(place_review_model), description='List of reviews')
+})
+
+# Define input model for place creation requests
+place_input_model = Model('PlaceInput', {
+    'title': fields.String(required=True, description='Title of the place'),
+    'description': fields.String(required=False, description='Description of the place'),
+    'price': fields.Float(required=True, description='Price per night'),
+    'latitude': fields.Float(required=True, description='Latitude of the place'),
+    'longitude': fields.Float(required=True, description='Longitude of the place'),
+    'max_person': fields.Integer(required=True, description='Maximum number of persons allowed'),
+    'amenities': fields.List(fields.String, description='List of amenity names')
+})
+
+# Define input model for place update requests (all fields optional)
+place_update_model = Model('PlaceUpdateInput', {
+    'title': fields.String(required=False, description='Title of the place'),
+    'description': fields.String(required=False, description='Description of the place'),
+    'price': fields.Float(required=False, description='Price per night'),
+    'latitude': fields.Float(required=False, description='Latitude of the place'),
+    'longitude': fields.Float(required=False, description='Longitude of the place'),
+    'max_person': fields.Integer(required=False, description='Maximum number of persons allowed'),
+    'amenities': fields.List(fields.String, description='List of amenity names')
+})
+
+# Define admin place update model with optional fields
+admin_place_update_model = Model('AdminPlaceUpdate', {
+    'title': fields.String(required=False, description='Title of the place'),
+    'description': fields.String(description='Description of the place'),
+    'price': fields.Float(required=False, description='Price per night'),
+    'latitude': fields.Float(required=False, description='Latitude of the place'),
+    'longitude': fields.Float(required=False, description='Longitude of the place'),
+    'max_person': fields.Integer(required=False, description='Maximum number of persons allowed'),
+    'amenities': fields.List(fields.Nested(place_amenity_model), description='List of amenities'),
+})
+
+# Define admin response model for a single place, with nested owner and amenities
+admin_place_response_model = Model('AdminPlaceResponse', {
+    'id': fields.String(description='Place ID'),
+    'title': fields.String(description='Title of the place'),
+    'description': fields.String(description='Description of the place'),
+    'price': fields.Float(description='Price per night'),
+    'latitude': fields.Float(description='Latitude of the place'),
+    'longitude': fields.Float(description='Longitude of the place'),
+    'owner_id': fields.String(description='ID of the owner'),
+    'max_person': fields.Integer(description='Maximum number of persons allowed'),
+    # Documentation only: the handler builds this response by hand and never marshals it
+    'owner': fields.Nested(place_user_model, description='Owner of the place'),
+    'amenities': fields.List(fields.Nested(place_amenity_model), description='List of amenities'),
+})
+
+# Define admin response model for an updated place, listing amenities by name
+admin_place_update_response_model = Model('AdminPlaceUpdateResponse', {
+    'id': fields.String(description='Place ID'),
+    'title': fields.String(description='Title of the place'),
+    'description': fields.String(description='Description of the place'),
+    'price': fields.Float(description='Price per night'),
+    'latitude': fields.Float(description='Latitude of the place'),
+    'longitude': fields.Float(description='Longitude of the place'),
+    'owner_id': fields.String(description='ID of the owner'),
+    'max_person': fields.Integer(description='Maximum number of persons allowed'),
+    'amenities': fields.List(fields.String, description='Names of the amenities'),
+})
+
+
+# ==================== USER MODELS ====================
+
+# Define main user model for creation requests and complete user data
+user_model = Model('User', {
+    'first_name': fields.String(required=True, description='First name of the user'),
+    'last_name': fields.String(required=True, description='Last name of the user'),
+    'email': fields.String(required=True, description='Email of the user'),
+    'password': fields.String(required=True, description='Password of the user'),
+    'is_admin': fields.Boolean(description='Admin status')
+})
+
+# Define user update model for partial updates (all fields optional)
+user_update_model = Model('UserUpdate', {
+    'first_name': fields.String(required=False, description='First name of the user'),
+    'last_name': fields.String(required=False, description='Last name of the user'),
+    'email': fields.String(required=False, description='Email of the user'),
+    'password': fields.String(required=False, description='Password of the user')
+})
+
+# Define admin user creation model (admin status must be explicit)
+admin_user_model = Model('AdminUser', {
+    'first_name': fields.String(required=True, description='First name of the user'),
+    'last_name': fields.String(required=True, description='Last name of the user'),
+    'email': fields.String(required=True, description='Email of the user'),
+    'password': fields.String(required=True, description='Password of the user'),
+    'is_admin': fields.Boolean(required=True, description='Admin status')
+})
+
+# Define admin user update model with optional fields
+admin_user_update_model = Model('AdminUserUpdate', {
+    'first_name': fields.String(required=False, description='First name of the user'),
+    'last_name': fields.String(required=False, description='Last name of the user'),
+    'email': fields.String(required=False, description='Email of the user'),
+    'password': fields.String(required=False, description='Password of the user'),
+    'is_admin': fields.Boolean(required=False, description='Admin status')
+})
+
+# Define batch lookup model listing the requested user IDs
+admin_user_batch_model = Model('AdminUserBatch', {
+    'ids': fields.List(fields.String, required=True, description='IDs of the users to retrieve')
+})
+
+
+# ==================== REVIEW MODELS ====================
+
+# Define main review model for complete review data with all relationships
+review_model = Model('Review', {
+    'text': fields.String(required=True, description='Text of the review'),
+    'rating': fields.Integer(required=True, description='Rating of the place (1-5)'),
+    'user_id': fields.String(required=True, description='ID of the user'),
+    'place_id': fields.String(required=True, description='ID of the place')
+})
+
+# Define input model for review creation requests
+review_input_model = Model('ReviewInput', {
+    'text': fields.String(required=True, description='Text of the review'),
+    'rating': fields.Integer(required=True, description='Rating of the place (1-5)'),
+    'place_id': fields.String(required=True, description='ID of the place')
+})
+
+# Define update model for review modifications (all fields optional)
+review_update_model = Model('ReviewUpdate', {
+    'text': fields.String(required=False, description='Text of the review'),
+    'rating': fields.Integer(required=False, description='Rating of the place (1-5)'),
+})
+
+# Define admin review update model with optional fields
+admin_review_update_model = Model('AdminReviewUpdate', {
+    'text': fields.String(required=False, description='Text of the review'),
+    'rating': fields.Integer(required=False, description='Rating of the place (1-5)'),
+})
+
+
+# ==================== AMENITY MODELS ====================
+
+# Define amenity model shared by the public and admin amenity namespaces
+amenity_model = Model('Amenity', {
+    # Required field: amenity name
+    'name': fields.String(required=True, description='Name of the amenity')
+})
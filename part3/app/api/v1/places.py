@@ -1,78 +1,192 @@
 # Import necessary modules for Flask API functionality
+from collections import defaultdict
+from numbers import Real
 from flask import request, current_app as app
-from flask_restx import Namespace, Resource, fields
+from flask_restx import Namespace, Resource
 from app.extensions import db
 from app.models.user import User
 from app.models.place import Place
 from app.models.amenity import Amenity
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from app.services import facade
+from app.services.exceptions import NotFoundError
+from app.api.v1.responses import (
+    compressed_json_response,
+    content_tag,
+    encode_json,
+    error_body,
+    etag_header,
+    is_not_modified,
+    json_response,
+    not_modified,
+    version_tag,
+)
+from app.utils.cache import TTLCache
+from app.utils.jwt_cache import cached_jwt_required, current_principal
+from app.utils.validation import PayloadSchema
+from app.api.v1.models import (
+    register_models,
+    place_amenity_model,
+    place_user_model,
+    place_review_model,
+    place_model,
+    place_input_model,
+    place_update_model,
+)
 
 
 # Create a namespace for place-related operations in the API
 api = Namespace('places', description='Place operations')
 
 
-# Define amenity model used within a place response
-amenity_model = api.model('PlaceAmenity', {
-    'id': fields.String(description='Amenity ID'),
-    'name': fields.String(description='Name of the amenity')
-})
-
-
-# Define user model linked to a place (owner information)
-user_model = api.model('PlaceUser', {
-    'id': fields.String(description='User ID'),
-    'first_name': fields.String(description='First name of the owner'),
-    'last_name': fields.String(description='Last name of the owner'),
-    'email': fields.String(description='Email of the owner')
-})
-
-
-# Define review model associated with a place
-review_model = api.model('PlaceReview', {
-    'id': fields.String(description='Review ID'),
-    'text': fields.String(description='Text of the review'),
-    'rating': fields.Integer(description='Rating of the place (1-5)'),
-    'user_id': fields.String(description='ID of the user')
-})
-
-
-# Define main model representing a complete place with all relationships
-place_model = api.model('Place', {
-    'title': fields.String(required=True, description='Title of the place'),
-    'description': fields.String(required=True, description='Description of the place'),
-    'price': fields.Float(required=True, description='Price per night'),
-    'latitude': fields.Float(required=True, description='Latitude of the place'),
-    'longitude': fields.Float(required=True, description='Longitude of the place'),
-    'owner_id': fields.String(required=True, description='ID of the owner'),
-    'max_person': fields.Integer(required=True, description='Maximum number of persons allowed'),
-    'owner': fields.Nested(user_model, description='Owner of the place'),
-    'amenities': fields.List(fields.Nested(amenity_model), description='List of amenities'),
-    'reviews': fields.List(fields.Nested(review_model), description='List of reviews')
-})
-
-# Define input model for place creation requests
-place_input_model = api.model('PlaceInput', {
-    'title': fields.String(required=True, description='Title of the place'),
-    'description': fields.String(required=False, description='Description of the place'),
-    'price': fields.Float(required=True, description='Price per night'),
-    'latitude': fields.Float(required=True, description='Latitude of the place'),
-    'longitude': fields.Float(required=True, description='Longitude of the place'),
-    'max_person': fields.Integer(required=True, description='Maximum number of persons allowed'),
-    'amenities': fields.List(fields.String, description='List of amenity names')
-})
-
-# Define input model for place update requests (all fields optional)
-place_update_model = api.model('PlaceUpdateInput', {
-    'title': fields.String(required=False, description='Title of the place'),
-    'description': fields.String(required=False, description='Description of the place'),
-    'price': fields.Float(required=False, description='Price per night'),
-    'latitude': fields.Float(required=False, description='Latitude of the place'),
-    'longitude': fields.Float(required=False, description='Longitude of the place'),
-    'max_person': fields.Integer(required=False, description='Maximum number of persons allowed'),
-    'amenities': fields.List(fields.String, description='List of amenity names')
-})
+# Attach the shared place models referenced by this namespace
+register_models(api, place_amenity_model, place_user_model, place_review_model,
+                place_model, place_input_model, place_update_model)
+
+# Payload validators compiled once at import (the shared models only document the API)
+PLACE_FIELDS = {
+    'title': str,
+    'description': (str, type(None)),
+    'price': Real,
+    'latitude': Real,
+    'longitude': Real,
+    'max_person': int,
+    'amenities': list,
+}
+place_schema = PayloadSchema(
+    PLACE_FIELDS, required=('title', 'price', 'latitude', 'longitude', 'max_person'))
+place_update_schema = PayloadSchema(PLACE_FIELDS)
+
+# Clients may reuse place representations for 30 seconds, then revalidate with If-None-Match
+_CACHE_CONTROL = 'private, max-age=30'
+
+# Error bodies encoded once at import
+_PLACE_NOT_FOUND = error_body('Place not found')
+
+# Encoded place listing and its tag, keyed by facade.get_places_version(). The
+# short TTL bounds staleness from writes handled by other worker processes.
+_listing_bodies = TTLCache(maxsize=1, ttl=5)
+
+
+def _range_error(data):
+    """
+    Check the numeric bounds of a validated place payload before any database work.
+
+    Valid payloads pass a single chained comparison; only invalid ones are
+    examined field by field to pick the message. The messages match the
+    facade's own checks, which remain in place for other callers. Absent
+    fields (partial updates) are treated as valid.
+
+    Args:
+        data (dict): Payload already validated by place_schema or place_update_schema
+
+    Returns:
+        str or None: The error message, or None when every bound holds
+    """
+    price = data.get('price', 0)
+    latitude = data.get('latitude', 0)
+    longitude = data.get('longitude', 0)
+    max_person = data.get('max_person', 1)
+
+    # Common case: everything in range, one expression
+    if price >= 0 and max_person >= 1 and -90 <= latitude <= 90 and -180 <= longitude <= 180:
+        return None
+
+    # Invalid payload: report the first offending field
+    if price < 0:
+        return "Price must be a non-negative number."
+    if max_person < 1:
+        return "Max person must be greater than 0."
+    if not -90 <= latitude <= 90:
+        return "Latitude must be between -90 and 90 degrees."
+    return "Longitude must be between -180 and 180 degrees."
+
+
+def _serialize_place_row(row, amenities):
+    """
+    Build the listing representation of a place from a plain row.
+
+    Defined once at module level and called per row by PlaceList.get. The row
+    comes from PlaceRepository.get_listing_rows(), so building the dict is
+    one tuple unpack with no ORM attribute access. Timestamps are left as
+    datetime objects: orjson writes them in ISO 8601 itself, with the same
+    output as isoformat() for these naive UTC values.
+
+    Args:
+        row (Row): Place and owner columns, in get_listing_rows() order
+        amenities (list[dict]): The place's amenities as {'id', 'name'} dicts
+
+    Returns:
+        dict: The place with owner details and amenities
+    """
+    (place_id, title, description, price, latitude, longitude, max_person, owner_id,
+     user_id, first_name, last_name, email, created_at, updated_at) = row
+    return {
+        'id': place_id,
+        'title': title,
+        'description': description,
+        'price': price,
+        'latitude': latitude,
+        'longitude': longitude,
+        'max_person': max_person,
+        'owner_id': owner_id,
+        # Include owner details if the owner row exists
+        'owner': {
+            'id': user_id,
+            'first_name': first_name,
+            'last_name': last_name,
+            'email': email
+        } if user_id is not None else None,
+        'amenities': amenities,
+        'created_at': created_at,
+        'updated_at': updated_at
+    }
+
+
+def _listing_response(body, tag):
+    """
+    Answer a place listing request from an encoded body and its tag.
+
+    Args:
+        body (bytes): The encoded listing
+        tag (str): content_tag(body)
+
+    Returns:
+        flask.Response: An empty 304 when If-None-Match names the tag,
+                        otherwise the body (gzip-compressed when accepted)
+    """
+    # Client already holds this listing: send headers only
+    if is_not_modified(tag):
+        return not_modified(tag)
+
+    # Send the list with its ETag
+    return compressed_json_response(
+        body, tag, headers={'ETag': etag_header(tag), 'Cache-Control': _CACHE_CONTROL})
+
+
+def _clean_amenity_names(raw_names):
+    """
+    Validate, strip and deduplicate the amenity names of a place payload in one pass.
+
+    Each name is stripped once; repeated names are dropped (first occurrence
+    wins) so the facade never resolves the same name twice.
+
+    Args:
+        raw_names (list): The 'amenities' list from the request body
+
+    Returns:
+        tuple: (names, None) with the distinct stripped names in request order,
+               or (None, error_message) for the first invalid entry
+    """
+    stripped = []
+    for name in raw_names:
+        # Only non-blank strings are accepted
+        clean = name.strip() if isinstance(name, str) else ''
+        if not clean:
+            return None, f'Invalid amenity name: {name}'
+        stripped.append(clean)
+
+    # dict.fromkeys keeps the first occurrence of each name, in order
+    return list(dict.fromkeys(stripped)), None
 
 
 @api.route('/')
@@ -88,11 +202,11 @@ class PlaceList(Resource):
     The facade pattern is used to delegate business logic to the service layer.
     """
 
-    @api.expect(place_input_model)
+    @api.expect(place_input_model, validate=False)
     @api.response(201, 'Place successfully created')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @cached_jwt_required
     def post(self):
         """
         Create a new place.
@@ -104,27 +218,35 @@ class PlaceList(Resource):
         Returns:
             dict: Created place data with status 201, or error with appropriate status
         """
-        # Extract user ID from JWT token
-        user_id = get_jwt_identity()
+        # Extract user ID from the token verified (or cached) by the decorator
+        user_id, _ = current_principal()
+
+        # Parse the body with orjson (app JSON provider); malformed JSON yields None, not an exception
+        data = request.get_json(silent=True)
+        if not data:
+            return {'error': 'Missing or invalid JSON body'}, 400
+
+        try:
+            # Keep only known, correctly typed fields (numbers must be numbers, etc.)
+            data = place_schema.validate(data)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+
+        # Reject out-of-range values before touching the database
+        error = _range_error(data)
+        if error:
+            return {'error': error}, 400
+
+        # Validate, strip and deduplicate amenity names (defaults to empty list)
+        amenity_names, error = _clean_amenity_names(data.get("amenities", []))
+        if error:
+            return {'error': error}, 400
 
         # Retrieve user object from database using the ID
         user = facade.get_user_by_id(user_id)
         if not user:
             return {'error': 'User not found'}, 404
 
-        # Parse JSON data from request body
-        data = request.get_json()
-        if not data:
-            return {'error': 'Missing JSON body'}, 400
-
-        # Extract amenity names from request data (defaults to empty list)
-        amenity_names = data.get("amenities", [])
-
-        # Validate amenity names format and content
-        for name in amenity_names:
-            if not isinstance(name, str) or not name.strip():
-                return {'error': f'Invalid amenity name: {name}'}, 400
-
         try:
             # Prepare place data dictionary for facade layer
             place_data = {
@@ -136,24 +258,8 @@ class PlaceList(Resource):
                 'max_person': data.get("max_person")
             }
 
-            # Process amenities: retrieve existing or create new ones
-            amenity_ids = []
-            for name in amenity_names:
-                # Clean amenity name by removing whitespace
-                name = name.strip()
-
-                # Try to find existing amenity by name
-                amenity_list = facade.get_amenity_by_name(name)
-
-                if amenity_list and len(amenity_list) > 0:
-                    # Use existing amenity (first match)
-                    amenity = amenity_list[0]
-                else:
-                    # Create new amenity if it doesn't exist
-                    amenity = facade.create_amenity({'name': name})
-
-                # Collect amenity ID for place creation
-                amenity_ids.append(amenity.id)
+            # Resolve all amenity names at once: one lookup query, one insert for missing ones
+            amenity_ids = [amenity.id for amenity in facade.get_or_create_amenities(amenity_names)]
 
             # Add amenity IDs to place data if any amenities were processed
             if amenity_ids:
@@ -186,54 +292,53 @@ class PlaceList(Resource):
         }, 201
 
     @api.response(200, 'List of places retrieved successfully')
+    @api.response(304, 'Places not modified since the version in If-None-Match')
     def get(self):
         """
         Retrieve all places from the database.
 
         Returns a comprehensive list of all places with their associated
         owner information, amenities, and metadata including timestamps.
+        The ETag is a hash of the encoded body, so it also changes when an
+        owner or an amenity shown in the listing is modified; clients sending
+        it back in If-None-Match get an empty 304 instead of the list.
+        The encoded body and its tag are kept for up to 5 seconds under the
+        facade's listing version, so repeated reads skip the queries and the
+        encoding until a write through this process changes the version.
 
         Returns:
             list: List of place dictionaries with complete information
         """
+        # Reuse the body encoded for the current listing version, if any
+        version = facade.get_places_version()
+        cached = _listing_bodies.get(version)
+        if cached is not None:
+            body, tag = cached
+            return _listing_response(body, tag)
+
         try:
-            # Retrieve all places from the database via facade
-            places = facade.get_all_places()
-
-            # Build comprehensive response with place details
-            return [{
-                'id': place.id,
-                'title': place.title,
-                'description': place.description,
-                'price': place.price,
-                'latitude': place.latitude,
-                'longitude': place.longitude,
-                'max_person': place.max_person,
-                'owner_id': place.owner_id,
-                # Include owner details if available
-                'owner': {
-                    'id': place.owner.id,
-                    'first_name': place.owner.first_name,
-                    'last_name': place.owner.last_name,
-                    'email': place.owner.email
-                } if place.owner else None,
-                # Include amenity details if available
-                'amenities': [
-                    {
-                        'id': amenity.id,
-                        'name': amenity.name
-                    } for amenity in place.amenities
-                ] if place.amenities else [],
-                # Include timestamp information if available
-                'created_at': place.created_at.isoformat() if hasattr(place, 'created_at') and place.created_at else None,
-                'updated_at': place.updated_at.isoformat() if hasattr(place, 'updated_at') and place.updated_at else None
-            } for place in places], 200
+            # Retrieve plain rows for places (with owners) and amenity links: no ORM objects
+            place_rows, amenity_links = facade.get_all_places_rows()
+
+            # Group amenities by place in a single pass over the links
+            amenities_by_place = defaultdict(list)
+            for place_id, amenity_id, name in amenity_links:
+                amenities_by_place[place_id].append({'id': amenity_id, 'name': name})
+
+            # Encode with orjson, bypassing RESTx marshalling, and tag the exact bytes
+            body = encode_json([_serialize_place_row(row, amenities_by_place.get(row[0], []))
+                                for row in place_rows])
+            tag = content_tag(body)
 
         except Exception as e:
             # Log retrieval errors for debugging
             app.logger.error(f"Error retrieving places: {e}")
             return {'error': 'Failed to retrieve places'}, 500
 
+        # Remember the encoded listing under the version it was built for
+        _listing_bodies.set(version, (body, tag))
+        return _listing_response(body, tag)
+
 
 @api.route('/<place_id>')
 class PlaceResource(Resource):
@@ -250,25 +355,43 @@ class PlaceResource(Resource):
     """
 
     @api.response(200, 'Place retrieved successfully')
+    @api.response(304, 'Place not modified since the version in If-None-Match')
     @api.response(404, 'Place not found')
     def get(self, place_id):
         """
         Retrieve a specific place by its ID.
 
+        The response carries a weak ETag derived from the place's ID and
+        updated_at; a matching If-None-Match is answered with an empty 304
+        after a single-column read, without loading the place.
+
         Args:
             place_id (str): Unique identifier of the place
 
         Returns:
             dict: Place data or error message with appropriate status
         """
-        # Retrieve place from database using facade
-        place = facade.get_place(place_id)
+        # Read only the place's version first
+        updated_at = facade.get_place_meta(place_id)
+        if updated_at is None:
+            return json_response(_PLACE_NOT_FOUND, 404)
 
-        # Check if place exists
-        if not place:
-            return {'error': 'Place not found'}, 404
+        # Client already holds this version: skip loading and serializing the place
+        tag = version_tag(place_id, updated_at)
+        if is_not_modified(tag):
+            return not_modified(tag)
+
+        try:
+            # Retrieve place from database using facade
+            place = facade.get_place(place_id)
+        except ValueError:
+            # Deleted between the version read and the load
+            return json_response(_PLACE_NOT_FOUND, 404)
+
+        # Tag the instance actually served: it may come from another worker's older cache entry
+        tag = version_tag(place.id, place.updated_at)
 
-        # Return place data
+        # Return place data tagged with its version
         return {
             'id': place.id,
             'title': place.title,
@@ -276,16 +399,16 @@ class PlaceResource(Resource):
             'price': place.price,
             'latitude': place.latitude,
             'longitude': place.longitude,
-            'owner_id': place.owner.id,
+            'owner_id': place.owner_id,
             'max_person': place.max_person
-        }, 200
+        }, 200, {'ETag': etag_header(tag), 'Cache-Control': _CACHE_CONTROL}
 
-    @api.expect(place_update_model)
+    @api.expect(place_update_model, validate=False)
     @api.response(200, 'Place updated successfully')
     @api.response(404, 'Place not found')
     @api.response(403, 'Unauthorized action')
     @api.response(400, 'Invalid input data')
-    @jwt_required()
+    @cached_jwt_required
     def put(self, place_id):
         """
         Update an existing place.
@@ -299,91 +422,78 @@ class PlaceResource(Resource):
         Returns:
             dict: Updated place data or error message with appropriate status
         """
-        # Parse JSON data from request body
-        place_data = request.get_json()
-
-        # Extract current user information from JWT
-        current_user = get_jwt_identity()
-        claims = get_jwt()
+        # Parse the body with orjson (app JSON provider); malformed JSON yields None, not an exception
+        place_data = request.get_json(silent=True)
 
-        # Validate request contains data
-        if not place_data:
-            return {'error': 'Missing JSON body'}, 400
+        # Read the caller's ID and admin flag once, from the verified token
+        current_user, is_admin = current_principal()
 
-        try:
-            # Retrieve existing place from database
-            place = facade.get_place(place_id)
-        except ValueError:
-            return {'error': 'Place not found'}, 404
-
-        # Check user authorization (owner or admin)
-        is_admin = claims.get('is_admin', False)
-        if not is_admin and place.owner.id != current_user:
-            return {'error': 'Unauthorized action'}, 403
+        # Validate request contains a JSON object (scalars such as 5 or true are rejected too)
+        if not place_data or not isinstance(place_data, dict):
+            return {'error': 'Missing or invalid JSON body'}, 400
 
         # Prevent modification of owner_id field
         if 'owner_id' in place_data:
             return {'error': 'You cannot modify owner_id'}, 400
 
-        # Handle amenities update if provided in request
-        if 'amenities' in place_data:
-            amenity_names = place_data.get('amenities', [])
-
-            # Validate amenity names format
-            for name in amenity_names:
-                if not isinstance(name, str) or not name.strip():
-                    return {'error': f'Invalid amenity name: {name}'}, 400
-
-            # Process amenities: retrieve existing or create new ones
-            amenity_ids = []
-            for name in amenity_names:
-                # Clean amenity name
-                name = name.strip()
+        try:
+            # Keep only known, correctly typed fields (numbers must be numbers, etc.)
+            place_data = place_update_schema.validate(place_data)
+        except ValueError as e:
+            return {'error': str(e)}, 400
 
-                # Try to find existing amenity
-                amenity_list = facade.get_amenity_by_name(name)
+        # Reject out-of-range values before any database work
+        error = _range_error(place_data)
+        if error:
+            return {'error': error}, 400
 
-                if amenity_list and len(amenity_list) > 0:
-                    # Use existing amenity
-                    amenity = amenity_list[0]
-                else:
-                    # Create new amenity if it doesn't exist
-                    amenity = facade.create_amenity({'name': name})
+        # Validate, strip and deduplicate amenity names if provided
+        if 'amenities' in place_data:
+            amenity_names, error = _clean_amenity_names(place_data['amenities'])
+            if error:
+                return {'error': error}, 400
 
-                # Convert to format expected by facade (dictionary with id key)
-                amenity_ids.append({'id': amenity.id})
+        try:
+            # Load the place once, checking existence and authorization (owner or admin)
+            place = facade.get_place_if_owner(place_id, current_user, is_admin)
+        except NotFoundError:
+            return {'error': 'Place not found'}, 404
+        except PermissionError:
+            return {'error': 'Unauthorized action'}, 403
 
-            # Replace amenity names with formatted amenity objects
-            place_data['amenities'] = amenity_ids
+        # Resolve amenity names only for authorized callers, in the format expected by the facade
+        if 'amenities' in place_data:
+            try:
+                place_data['amenities'] = [
+                    {'id': amenity.id} for amenity in facade.get_or_create_amenities(amenity_names)]
+            except ValueError as e:
+                return {'error': str(e)}, 400
 
         try:
-            # Update place using facade layer
-            updated_place = facade.update_place(place_id, place_data)
-
-            # Return updated place data
-            return {
-                'id': updated_place.id,
-                'title': updated_place.title,
-                'description': updated_place.description,
-                'price': updated_place.price,
-                'latitude': updated_place.latitude,
-                'longitude': updated_place.longitude,
-                'owner_id': updated_place.owner.id,
-                'max_person': updated_place.max_person,
-                'amenities': [{'id': a.id, 'name': a.name} for a in updated_place.amenities]
-            }, 200
-
+            # Update the already-loaded place (no second lookup); only the write is guarded
+            updated_place = facade.update_place_obj(place, place_data)
         except ValueError as e:
-            # Handle business logic validation errors
+            # Handle business logic validation errors; database failures reach the
+            # SQLAlchemyError handler, which rolls back and hides the details
             return {'error': str(e)}, 400
-        except Exception as e:
-            # Handle unexpected errors
-            return {'error': 'Internal server error', 'details': str(e)}, 500
+
+        # Return updated place data
+        return {
+            'id': updated_place.id,
+            'title': updated_place.title,
+            'description': updated_place.description,
+            'price': updated_place.price,
+            'latitude': updated_place.latitude,
+            'longitude': updated_place.longitude,
+            'owner_id': updated_place.owner_id,
+            'max_person': updated_place.max_person,
+            'amenities': [{'id': a.id, 'name': a.name} for a in updated_place.amenities]
+        }, 200
 
     @api.response(204, 'Place deleted successfully')
     @api.response(403, 'Unauthorized action')
     @api.response(404, 'Place not found')
-    @jwt_required()
+    @cached_jwt_required
     def delete(self, place_id):
         """
         Delete a place.
@@ -397,31 +507,20 @@ class PlaceResource(Resource):
         Returns:
             Empty response with status 204 on success, or error message
         """
-        # Extract current user information from JWT
-        current_user = get_jwt_identity()
-        claims = get_jwt()
+        # Read the caller's ID and admin flag once, from the verified token
+        current_user, is_admin = current_principal()
 
         try:
-            # Retrieve place to verify existence and get owner information
-            place = facade.get_place(place_id)
+            # Delete in one statement gated on ownership (unless admin); the place is never loaded
+            facade.delete_place_if_owner(place_id, current_user, is_admin)
+
         except ValueError:
+            # Handle case where place doesn't exist
             return {'error': 'Place not found'}, 404
 
-        # Check user authorization (owner or admin)
-        is_admin = claims.get('is_admin', False)
-        if not is_admin and place.owner.id != current_user:
+        except PermissionError:
+            # Caller is neither admin nor the owner of the place
             return {'error': 'Unauthorized action'}, 403
 
-        try:
-            # Delete place using facade layer
-            facade.delete_place(place_id)
-
-            # Return empty response with success status
-            return '', 204
-
-        except ValueError as e:
-            # Handle business logic errors
-            return {'error': str(e)}, 400
-        except Exception as e:
-            # Handle unexpected errors
-            return {'error': 'Internal server error', 'details': str(e)}, 500
+        # Return empty response with success status
+        return '', 204
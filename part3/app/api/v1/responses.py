@@ -0,0 +1,233 @@
+# Import compression and the hash function used for content-based entity tags
+import gzip
+import hashlib
+
+# Import the JSON library used for the application's responses
+import orjson
+
+# Import Flask's response class to bypass Flask-RESTX representation handling
+from flask import Response, request
+from werkzeug.http import quote_etag
+
+# Import the process-local expiring cache
+from app.utils.cache import TTLCache
+
+# Gzip-compressed bodies keyed by their content tag: a stable body is compressed
+# once and served many times. Bodies below GZIP_MIN_SIZE are sent uncompressed.
+_gzip_bodies = TTLCache(maxsize=64, ttl=300)
+GZIP_MIN_SIZE = 1024
+
+
+def error_body(message):
+    """
+    Encode an error payload once, for reuse as a constant response body.
+
+    Args:
+        message (str): The error message
+
+    Returns:
+        bytes: {"error": message} as JSON, with the trailing newline RESTx emits
+
+    Example:
+        _USER_NOT_FOUND = error_body('User not found')
+    """
+    return orjson.dumps({'error': message}, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def json_response(body, status, headers=None):
+    """
+    Build a JSON response from an already encoded body.
+
+    Resources may return a Response directly, in which case Flask-RESTX skips
+    its representation step, so a pre-encoded constant is sent as-is without
+    building or serializing a dict per request. A new Response is created on
+    every call because responses are mutable and must not be shared.
+
+    Args:
+        body (bytes): Encoded JSON document
+        status (int): HTTP status code
+        headers (dict, optional): Extra response headers (ETag, Cache-Control...)
+
+    Returns:
+        flask.Response: The JSON response
+
+    Example:
+        return json_response(_USER_NOT_FOUND, 404)
+    """
+    return Response(body, status=status, headers=headers, mimetype='application/json')
+
+
+def encode_json(data, default=None):
+    """
+    Encode data with orjson, with the trailing newline RESTx emits.
+
+    Args:
+        data (object): JSON-serializable data
+        default (callable, optional): Called by orjson for each value it cannot
+            serialize natively (e.g. database rows), returning a serializable value
+
+    Returns:
+        bytes: The encoded JSON document
+
+    Example:
+        body = encode_json(rows, default=lambda row: {'id': row[0], 'name': row[1]})
+    """
+    return orjson.dumps(data, default=default, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def render_json(data, status=200):
+    """
+    Encode data with orjson and return it as a JSON response.
+
+    For hot endpoints returning plain dicts and lists: the body is encoded
+    directly, and returning a Response skips Flask-RESTX's representation
+    and marshalling steps.
+
+    Args:
+        data (object): JSON-serializable data
+        status (int): HTTP status code
+
+    Returns:
+        flask.Response: The JSON response
+
+    Example:
+        return render_json([{'id': a.id, 'name': a.name} for a in amenities])
+    """
+    return json_response(encode_json(data), status)
+
+
+def compressed_json_response(body, tag, status=200, headers=None):
+    """
+    Build a JSON response, gzip-compressed when the client accepts it.
+
+    The compressed bytes are cached under the body's content tag, so
+    repeated requests for an unchanged body cost a cache lookup instead of
+    a compression pass. Every response carries Vary: Accept-Encoding so
+    shared caches keep the two encodings apart.
+
+    Args:
+        body (bytes): Encoded JSON document
+        tag (str): Tag returned by content_tag(body)
+        status (int): HTTP status code
+        headers (dict, optional): Extra response headers
+
+    Returns:
+        flask.Response: The JSON response, possibly with Content-Encoding: gzip
+
+    Example:
+        return compressed_json_response(body, tag, headers={'ETag': etag_header(tag)})
+    """
+    headers = dict(headers or {}, Vary='Accept-Encoding')
+
+    # Small bodies and clients without gzip support get the raw bytes
+    if len(body) < GZIP_MIN_SIZE or not request.accept_encodings['gzip']:
+        return json_response(body, status, headers)
+
+    # Compress each distinct body only once (mtime=0 keeps the output deterministic)
+    compressed = _gzip_bodies.get(tag)
+    if compressed is None:
+        compressed = gzip.compress(body, mtime=0)
+        _gzip_bodies.set(tag, compressed)
+
+    headers['Content-Encoding'] = 'gzip'
+    return json_response(compressed, status, headers)
+
+
+def no_content():
+    """
+    Build an empty 204 response.
+
+    Returns:
+        flask.Response: A response with status 204 and no body
+
+    Example:
+        facade.delete_user(user_id)
+        return no_content()
+    """
+    return Response(status=204)
+
+
+def version_tag(entity_id, updated_at):
+    """
+    Build the entity tag identifying one version of a stored entity.
+
+    Every write bumps the entity's updated_at column, so its ID and
+    updated_at (to the microsecond) identify the representation without
+    serializing or hashing the body.
+
+    Args:
+        entity_id (str): ID of the entity
+        updated_at (datetime): Last modification time of the entity
+
+    Returns:
+        str: The unquoted tag
+
+    Example:
+        tag = version_tag(user_id, updated_at)
+    """
+    return f'{entity_id}-{int(updated_at.timestamp() * 1_000_000)}'
+
+
+def content_tag(body):
+    """
+    Build an entity tag from the bytes of an encoded body.
+
+    For collections, which have no single updated_at: the tag changes
+    whenever any element is added, removed or modified. BLAKE2b with an
+    8-byte digest is fast on short bodies and collisions are negligible
+    at this size.
+
+    Args:
+        body (bytes): Encoded response body
+
+    Returns:
+        str: The unquoted tag (16 hex characters)
+
+    Example:
+        body = encode_json(items)
+        tag = content_tag(body)
+    """
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def etag_header(tag):
+    """
+    Format a tag as a weak ETag header value.
+
+    Args:
+        tag (str): Tag returned by version_tag()
+
+    Returns:
+        str: The header value, e.g. W/"<tag>"
+    """
+    return quote_etag(tag, weak=True)
+
+
+def is_not_modified(tag):
+    """
+    Tell whether the client's If-None-Match header already names this version.
+
+    Args:
+        tag (str): Tag returned by version_tag()
+
+    Returns:
+        bool: True if a 304 can be returned instead of the body
+    """
+    return request.if_none_match.contains_weak(tag)
+
+
+def not_modified(tag):
+    """
+    Build an empty 304 response carrying the current ETag.
+
+    Args:
+        tag (str): Tag returned by version_tag()
+
+    Returns:
+        flask.Response: A 304 response without body
+
+    Example:
+        if is_not_modified(tag):
+            return not_modified(tag)
+    """
+    return Response(status=304, headers={'ETag': etag_header(tag)})
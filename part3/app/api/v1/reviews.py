@@ -1,34 +1,61 @@
 # Import necessary modules for Flask API functionality
-from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask_restx import Namespace, Resource
 from flask import request
 from app.services import facade
+from app.api.v1.responses import (
+    encode_json,
+    error_body,
+    etag_header,
+    is_not_modified,
+    json_response,
+    not_modified,
+    version_tag,
+)
+from app.api.v1.models import (
+    register_models,
+    review_model,
+    review_input_model,
+    review_update_model,
+)
+from app.utils.jwt_cache import cached_jwt_required, current_principal
+from app.utils.validation import PayloadSchema
 
 
 # Create a namespace for review-related operations in the API
 api = Namespace('reviews', description='Review operations')
 
 
-# Define main review model for complete review data with all relationships
-review_model = api.model('Review', {
-    'text': fields.String(required=True, description='Text of the review'),
-    'rating': fields.Integer(required=True, description='Rating of the place (1-5)'),
-    'user_id': fields.String(required=True, description='ID of the user'),
-    'place_id': fields.String(required=True, description='ID of the place')
-})
+# Attach the shared review models referenced by this namespace
+register_models(api, review_model, review_input_model, review_update_model)
 
-# Define input model for review creation requests
-review_input_model = api.model('ReviewInput', {
-    'text': fields.String(required=True, description='Text of the review'),
-    'rating': fields.Integer(required=True, description='Rating of the place (1-5)'),
-    'place_id': fields.String(required=True, description='ID of the place')
-})
+# Clients may reuse a review for 30 seconds, then revalidate it with If-None-Match
+_CACHE_CONTROL = 'private, max-age=30'
 
-# Define update model for review modifications (all fields optional)
-review_update_model = api.model('ReviewUpdate', {
-    'text': fields.String(required=False, description='Text of the review'),
-    'rating': fields.Integer(required=False, description='Rating of the place (1-5)'),
-})
+# Payload validators compiled once at import (the shared models only document the API)
+review_schema = PayloadSchema(
+    {'text': str, 'rating': int, 'place_id': str},
+    required=('text', 'rating', 'place_id'))
+review_update_schema = PayloadSchema({'text': str, 'rating': int})
+
+# Error bodies encoded once at import
+_REVIEW_NOT_FOUND = error_body('Review not found')
+
+
+def _review_row(row):
+    """
+    orjson default hook turning a projected review row into a review object.
+
+    Rows are not serialized natively by orjson, so it calls this hook for each
+    one while encoding the list: no intermediate list of dicts is built first.
+
+    Args:
+        row (Row): A row from facade.list_reviews_projected()
+
+    Returns:
+        dict: The review as {'id', 'text', 'rating', 'user_id', 'place_id'}
+    """
+    return {'id': row[0], 'text': row[1], 'rating': row[2],
+            'user_id': row[3], 'place_id': row[4]}
 
 
 @api.route('/')
@@ -44,11 +71,11 @@ class ReviewList(Resource):
     users cannot review their own places. Authentication is required for creation.
     """
 
-    @api.expect(review_input_model)
+    @api.expect(review_input_model, validate=False)
     @api.response(201, 'Review successfully created')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @cached_jwt_required
     def post(self):
         """
         Create a new review for a place.
@@ -60,12 +87,12 @@ class ReviewList(Resource):
         Returns:
             dict: Created review data with status 201, or error with appropriate status
         """
-        # Extract current user ID from JWT token
-        current_user = get_jwt_identity()
+        # Read the caller's ID once, from the verified token
+        current_user, _ = current_principal()
 
         try:
-            # Extract review data from request payload
-            review_data = api.payload
+            # Keep only known, correctly typed fields from the request body
+            review_data = review_schema.validate(api.payload)
 
             # Create new review using facade layer (includes business logic validation)
             new_review = facade.create_review(review_data, current_user)
@@ -75,8 +102,8 @@ class ReviewList(Resource):
                 'id': new_review.id,
                 'text': new_review.text,
                 'rating': new_review.rating,
-                'place_id': new_review.place.id,
-                'user_id': new_review.user.id
+                'place_id': new_review.place_id,
+                'user_id': new_review.user_id
             }, 201
 
         except ValueError as e:
@@ -87,6 +114,7 @@ class ReviewList(Resource):
             return {'error': 'Internal server error'}, 500
 
     @api.response(200, 'List of reviews retrieved successfully')
+    @api.response(304, 'List not modified since the version in If-None-Match')
     def get(self):
         """
         Retrieve all reviews from the database.
@@ -95,19 +123,24 @@ class ReviewList(Resource):
         information. This endpoint is publicly accessible for displaying reviews.
 
         Returns:
-            list: List of review dictionaries with complete information
+            list: List of review dictionaries with complete information and a
+                  weak ETag built from the newest updated_at and the review count (200),
+                  or an empty response when If-None-Match names the current list (304)
         """
-        # Retrieve all reviews from database via facade
-        reviews = facade.get_all_reviews()
+        # Identify the listing version from one aggregate query
+        updated_at, count = facade.get_reviews_version()
+        tag = version_tag(f'reviews-{count}', updated_at) if updated_at else 'reviews-0'
+
+        # Client already holds this version: skip reading and encoding the reviews
+        if is_not_modified(tag):
+            return not_modified(tag)
+
+        # Read the exposed columns as plain rows: no Review, User or Place instances
+        rows = facade.list_reviews_projected()
 
-        # Build response list with review details and relationships
-        return [{
-            'id': r.id,
-            'text': r.text,
-            'rating': r.rating,
-            'user_id': r.user.id,
-            'place_id': r.place.id
-        } for r in reviews], 200
+        # Encode the rows in one orjson pass and return them directly, bypassing RESTx marshalling
+        return json_response(encode_json(rows, default=_review_row), 200,
+                             {'ETag': etag_header(tag), 'Cache-Control': _CACHE_CONTROL})
 
 
 @api.route('/<review_id>')
@@ -125,6 +158,7 @@ class ReviewResource(Resource):
     """
 
     @api.response(200, 'Review retrieved successfully')
+    @api.response(304, 'Review not modified since the version in If-None-Match')
     @api.response(404, 'Review not found')
     def get(self, review_id):
         """
@@ -132,6 +166,9 @@ class ReviewResource(Resource):
 
         Returns complete review information including associated user and place IDs.
         This endpoint is publicly accessible for displaying individual reviews.
+        The response carries a weak ETag derived from the review's ID and
+        updated_at; a matching If-None-Match is answered with an empty 304
+        after a single-column read, without loading the review.
 
         Args:
             review_id (str): Unique identifier of the review
@@ -139,28 +176,41 @@ class ReviewResource(Resource):
         Returns:
             dict: Review data or error message with appropriate status
         """
-        # Retrieve review from database using facade
-        review = facade.get_review(review_id)
+        # Read only the review's version first
+        updated_at = facade.get_review_meta(review_id)
+        if updated_at is None:
+            return json_response(_REVIEW_NOT_FOUND, 404)
 
-        # Check if review exists
-        if not review:
-            return {'error': 'Review not found'}, 404
+        # Client already holds this version: skip loading and serializing the review
+        tag = version_tag(review_id, updated_at)
+        if is_not_modified(tag):
+            return not_modified(tag)
 
-        # Return complete review information
+        try:
+            # Retrieve review from database using facade
+            review = facade.get_review(review_id)
+        except ValueError:
+            # Deleted between the version read and the load
+            return json_response(_REVIEW_NOT_FOUND, 404)
+
+        # Tag the instance actually served: it may come from another worker's older cache entry
+        tag = version_tag(review.id, review.updated_at)
+
+        # Return complete review information tagged with its version
         return {
             'id': review.id,
             'text': review.text,
             'rating': review.rating,
-            'user_id': review.user.id,
-            'place_id': review.place.id
-        }, 200
+            'user_id': review.user_id,
+            'place_id': review.place_id
+        }, 200, {'ETag': etag_header(tag), 'Cache-Control': _CACHE_CONTROL}
 
-    @api.expect(review_update_model)
+    @api.expect(review_update_model, validate=False)
     @api.response(200, 'Review updated successfully')
     @api.response(404, 'Review not found')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @cached_jwt_required
     def put(self, review_id):
         """
         Update an existing review.
@@ -175,18 +225,26 @@ class ReviewResource(Resource):
         Returns:
             dict: Updated review data or error message with appropriate status
         """
-        # Extract current user information from JWT
-        current_user = get_jwt_identity()
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
+        # Read the caller's ID and admin flag once, from the verified token
+        current_user, is_admin = current_principal()
 
         # Extract update data from request payload
         review_api = api.payload
 
+        # The body must be a JSON object before any key is looked up
+        if not isinstance(review_api, dict):
+            return {'error': 'Invalid input data'}, 400
+
         # Prevent modification of user_id to maintain data integrity
         if 'user_id' in review_api:
             return {'error': 'You cannot modify user_id'}, 400
 
+        try:
+            # Keep only known, correctly typed fields before touching the database
+            review_api = review_update_schema.validate(review_api)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+
         try:
             # Retrieve existing review from database
             review = facade.get_review(review_id)
@@ -194,7 +252,7 @@ class ReviewResource(Resource):
             return {'error': 'Review not found'}, 404
 
         # Check user authorization (owner or admin)
-        if not is_admin and review.user.id != current_user:
+        if not is_admin and review.user_id != current_user:
             return {'error': 'Unauthorized action'}, 403
 
         try:
@@ -206,21 +264,19 @@ class ReviewResource(Resource):
                 'id': updated_review.id,
                 'text': updated_review.text,
                 'rating': updated_review.rating,
-                'place_id': updated_review.place.id,
-                'user_id': updated_review.user.id
+                'place_id': updated_review.place_id,
+                'user_id': updated_review.user_id
             }, 200
 
         except ValueError as e:
-            # Handle business logic validation errors
+            # Handle business logic validation errors; database failures reach the
+            # SQLAlchemyError handler, which rolls back and hides the details
             return {'error': str(e)}, 400
-        except Exception as e:
-            # Handle unexpected server errors
-            return {'error': 'Internal server error', 'details': str(e)}, 500
 
     @api.response(200, 'Review deleted successfully')
     @api.response(404, 'Review not found')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @cached_jwt_required
     def delete(self, review_id):
         """
         Delete a review.
@@ -235,10 +291,8 @@ class ReviewResource(Resource):
         Returns:
             dict: Success message with status 200, or error message
         """
-        # Extract current user information from JWT
-        current_user = get_jwt_identity()
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
+        # Read the caller's ID and admin flag once, from the verified token
+        current_user, is_admin = current_principal()
 
         try:
             # Retrieve review to verify existence and get owner information
@@ -247,7 +301,7 @@ class ReviewResource(Resource):
             return {'error': 'Review not found'}, 404
 
         # Check user authorization (owner or admin)
-        if not is_admin and review.user.id != current_user:
+        if not is_admin and review.user_id != current_user:
             return {'error': 'Unauthorized action'}, 403
 
         try:
@@ -258,8 +312,5 @@ class ReviewResource(Resource):
             return {'message': 'Review successfully deleted'}, 200
 
         except ValueError as e:
-            # Handle business logic errors
+            # Handle business logic errors; database failures reach the SQLAlchemyError handler
             return {'error': str(e)}, 400
-        except Exception as e:
-            # Handle unexpected server errors
-            return {'error': 'Internal server error', 'details': str(e)}, 500
@@ -0,0 +1,65 @@
+# Import standard library helpers for precompiled attribute access and slotted records
+from dataclasses import dataclass
+from operator import attrgetter
+
+# Public user fields, in response order (the password hash is never exposed)
+USER_FIELDS = ('id', 'first_name', 'last_name', 'email', 'is_admin')
+
+# Fetch all user fields in one C-level call
+_user_values = attrgetter(*USER_FIELDS)
+
+
+def user_to_dict(user):
+    """
+    Serialize a user to its public JSON representation.
+
+    Uses a precompiled attrgetter over USER_FIELDS, so building the response
+    is one call plus dict(zip()) instead of a dict literal with one attribute
+    lookup per field repeated in every handler.
+
+    Args:
+        user (User): The user to serialize
+
+    Returns:
+        dict: id, first_name, last_name, email and is_admin of the user
+
+    Example:
+        return user_to_dict(user), 200
+    """
+    return dict(zip(USER_FIELDS, _user_values(user)))
+
+
+@dataclass
+class AmenityOut:
+    """
+    Public JSON representation of an amenity.
+
+    orjson encodes dataclass instances natively, writing the fields in
+    declaration order straight from the slots, so handlers return an
+    AmenityOut instead of building a dict per amenity.
+
+    Attributes:
+        id (str): ID of the amenity
+        name (str): Name of the amenity
+
+    Example:
+        return AmenityOut.of(amenity), 200
+    """
+
+    __slots__ = ('id', 'name')
+
+    id: str
+    name: str
+
+    @classmethod
+    def of(cls, amenity):
+        """
+        Build the representation of an Amenity instance.
+
+        Args:
+            amenity (Amenity): The amenity to serialize
+
+        Returns:
+            AmenityOut: Its public fields
+        """
+        return cls(amenity.id, amenity.name)
@@ -1,29 +1,19 @@
 # Import necessary modules for Flask API functionality
-from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask_restx import Namespace, Resource
 from app.services import facade
+from app.api.v1.models import register_models, user_model, user_update_model
+from app.utils.jwt_cache import cached_jwt_required, current_principal
 
 
 # Create a namespace for user-related operations in the API
 api = Namespace('users', description='User operations')
 
 
-# Define main user model for creation requests and complete user data
-user_model = api.model('User', {
-    'first_name': fields.String(required=True, description='First name of the user'),
-    'last_name': fields.String(required=True, description='Last name of the user'),
-    'email': fields.String(required=True, description='Email of the user'),
-    'password': fields.String(required=True, description='Password of the user'),
-    'is_admin': fields.Boolean(description='Admin status')
-})
+# Attach the shared user models referenced by this namespace
+register_models(api, user_model, user_update_model)
 
-# Define user update model for partial updates (all fields optional)
-user_update_model = api.model('UserUpdate', {
-    'first_name': fields.String(required=False, description='First name of the user'),
-    'last_name': fields.String(required=False, description='Last name of the user'),
-    'email': fields.String(required=False, description='Email of the user'),
-    'password': fields.String(required=False, description='Password of the user')
-})
+# Keys of a listed user, in the column order of facade.list_users_projected()
+_USER_LIST_KEYS = ('id', 'first_name', 'last_name', 'email')
 
 
 @api.route('/')
@@ -87,16 +77,11 @@ class UserList(Resource):
         Returns:
             list: List of user dictionaries with basic information
         """
-        # Retrieve all users from database via facade
-        users = facade.get_all_users()
+        # Read only the public columns of every user (no ORM instances)
+        rows = facade.list_users_projected()
 
-        # Build response list excluding sensitive information
-        return [{
-            'id': u.id,
-            'first_name': u.first_name,
-            'last_name': u.last_name,
-            'email': u.email
-        } for u in users], 200
+        # Pair each row with the shared key tuple: no attribute lookups per user
+        return [dict(zip(_USER_LIST_KEYS, row)) for row in rows], 200
 
 
 @api.route('/<user_id>')
@@ -148,7 +133,7 @@ class UserResource(Resource):
     @api.response(404, 'User not found')
     @api.response(400, 'Invalid input data')
     @api.response(403, 'Unauthorized action')
-    @jwt_required()
+    @cached_jwt_required
     def put(self, user_id):
         """
         Update an existing user's information.
@@ -163,8 +148,8 @@ class UserResource(Resource):
         Returns:
             dict: Updated user data or error message with appropriate status
         """
-        # Extract current user ID from JWT token
-        current_user = get_jwt_identity()
+        # Read the caller's ID once, from the verified token
+        current_user, _ = current_principal()
 
         # Verify user is authorized to modify this account
         if current_user != user_id:
@@ -200,7 +185,7 @@ class UserResource(Resource):
     @api.response(204, 'User deleted successfully')
     @api.response(403, 'Unauthorized action')
     @api.response(404, 'User not found')
-    @jwt_required()
+    @cached_jwt_required
     def delete(self, user_id):
         """
         Delete a user account.
@@ -214,12 +199,11 @@ class UserResource(Resource):
         Returns:
             Empty response with status 204 on success, or error message
         """
-        # Extract current user information from JWT
-        current_user = get_jwt_identity()
-        jwt_data = get_jwt()
+        # Read the caller's ID and admin flag once, from the verified token
+        current_user, is_admin = current_principal()
 
         # Check authorization: user can delete own account or admin can delete any
-        if current_user != user_id and not jwt_data.get("is_admin", False):
+        if current_user != user_id and not is_admin:
             return {'error': 'Unauthorized action'}, 403
 
         try:
@@ -1,5 +1,6 @@
 # Import necessary modules for amenity model functionality
 from app.extensions import db, bcrypt
+from sqlalchemy.orm import relationship
 import uuid
 from .base_model import BaseModel
 
@@ -31,8 +32,12 @@ class Amenity(BaseModel):
     id = db.Column(db.String(36), primary_key=True,
                    default=lambda: str(uuid.uuid4()))
 
-    # Amenity name: required, maximum 50 characters
-    name = db.Column(db.String(50), nullable=False)
+    # Amenity name: required, unique (as in tables.sql), maximum 50 characters
+    name = db.Column(db.String(50), nullable=False, unique=True)
+
+    # Many-to-many: Amenity can be offered by multiple places (mirror of Place.amenities)
+    places = relationship('Place', secondary='place_amenity',
+                          back_populates='amenities')
 
     def __init__(self, name: str):
         """
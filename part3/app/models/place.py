@@ -94,7 +94,7 @@ class Place(BaseModel):
 
     # Many-to-many: Place can have multiple amenities, amenities can be in multiple places
     amenities = relationship('Amenity', secondary=place_amenity,
-                             lazy='subquery', backref=db.backref('places', lazy=True))
+                             lazy='subquery', back_populates='places')
 
     def __init__(self, title, description, price, latitude, longitude, owner, max_person=None):
         """
@@ -117,7 +117,7 @@ class User(BaseModel):
                 "Invalid is_admin flag: must be a boolean (True or False).")
 
         # Normalize and validate email format using regex pattern
-        email = email.strip().lower()
+        email = self.normalize_email(email)
         if not re.fullmatch(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,7}', email):
             raise ValueError("Invalid email: must be a valid email address.")
 
@@ -135,6 +135,26 @@ class User(BaseModel):
         # Hash the password immediately for security
         self.hash_password(password)
 
+    @staticmethod
+    def normalize_email(email):
+        """
+        Return the canonical form in which email addresses are stored and looked up.
+
+        Emails are normalized once on write (and on lookup input), so the unique
+        index on users.email compares canonical values and lookups are a plain
+        indexed equality.
+
+        Args:
+            email (str): The email address as provided by the client
+
+        Returns:
+            str: The address without surrounding whitespace, lowercased
+
+        Example:
+            User.normalize_email("  John.Doe@Example.com ")  # "john.doe@example.com"
+        """
+        return email.strip().lower()
+
     def hash_password(self, password):
         """
         Hash the user's password using bcrypt and store it in the password attribute.
@@ -0,0 +1,88 @@
+# Import necessary modules for amenity repository functionality
+from sqlalchemy import select
+from app.extensions import db
+from app.models.amenity import Amenity
+from app.persistence.repository import SQLAlchemyRepository
+
+
+class AmenityRepository(SQLAlchemyRepository):
+    """
+    Specialized repository for Amenity entity data access operations.
+
+    This class extends the generic SQLAlchemyRepository with read paths that
+    select only the columns the API exposes, so listing amenities does not
+    build and track one ORM instance per row.
+
+    Features:
+    - Inherits full CRUD operations from SQLAlchemyRepository
+    - Projected (id, name) listing for read-only endpoints
+    - Batched lookup by name and batched insert for place amenity lists
+
+    Database Table:
+    - Operates on the 'amenities' table through the Amenity SQLAlchemy model
+    """
+
+    def __init__(self):
+        """
+        Initialize the AmenityRepository with the Amenity model.
+
+        Passes the Amenity model class to the parent SQLAlchemyRepository constructor,
+        binding this repository to the amenities table.
+        """
+        # Call parent constructor with Amenity model to establish database connection
+        super().__init__(Amenity)
+
+    def get_all_projected(self):
+        """
+        Retrieve the ID and name of every amenity.
+
+        Issues SELECT id, name FROM amenities and returns the raw rows, skipping
+        ORM hydration and identity-map bookkeeping.
+
+        Returns:
+            list[Row]: Rows exposing .id and .name (also indexable as tuples)
+        """
+        # Read only the two exposed columns in one query
+        return db.session.execute(select(Amenity.id, Amenity.name)).all()
+
+    def get_by_names(self, names):
+        """
+        Retrieve the amenities whose name is in a list, in a single query.
+
+        Issues SELECT ... FROM amenities WHERE name IN (...) instead of one
+        query per name.
+
+        Args:
+            names (Iterable[str]): Exact (already normalized) amenity names
+
+        Returns:
+            list[Amenity]: Matching amenities, in no particular order
+        """
+        # Nothing to look up: skip the round trip
+        names = list(names)
+        if not names:
+            return []
+
+        # One IN query for the whole batch
+        return db.session.execute(
+            select(Amenity).where(Amenity.name.in_(names))
+        ).scalars().all()
+
+    def add_all(self, amenities):
+        """
+        Insert several amenities in one transaction.
+
+        Args:
+            amenities (list[Amenity]): New amenity instances
+
+        Raises:
+            Exception: Database-specific exceptions with automatic rollback
+        """
+        try:
+            # Flush all inserts together and commit once
+            db.session.add_all(amenities)
+            db.session.commit()
+        except Exception:
+            # Rollback transaction on any error to maintain consistency
+            db.session.rollback()
+            raise
@@ -0,0 +1,256 @@
+# Import necessary modules for place repository functionality
+from sqlalchemy import delete, insert, literal, select
+from sqlalchemy.orm import joinedload, selectinload
+from app.extensions import db
+from app.models.amenity import Amenity
+from app.models.place import Place, place_amenity
+from app.models.review import Review
+from app.models.user import User
+from app.persistence.repository import SQLAlchemyRepository
+
+
+class PlaceRepository(SQLAlchemyRepository):
+    """
+    Specialized repository for Place entity data access operations.
+
+    This class extends the generic SQLAlchemyRepository with Place-specific queries
+    that control how related rows are loaded. Detail views serialize the owner and
+    every amenity of a place, so loading them lazily costs one extra SELECT for the
+    owner plus one per relationship access; the queries here fetch them up front.
+
+    Features:
+    - Inherits full CRUD operations from SQLAlchemyRepository
+    - Single-place lookup and full listing with owner and amenities eagerly loaded
+    - Row-level listing queries (no ORM instances) for read-only endpoints
+    - Place creation with all amenity links written by one INSERT ... SELECT
+    - Owner ID and updated_at lookups that read a single column
+      (authorization checks and conditional GETs)
+    - Conditional DELETE restricted to the place's owner
+
+    Database Table:
+    - Operates on the 'places' table through the Place SQLAlchemy model
+    - Joins 'users' for the owner and reads 'place_amenity'/'amenities' in one extra SELECT
+    """
+
+    def __init__(self):
+        """
+        Initialize the PlaceRepository with the Place model.
+
+        Passes the Place model class to the parent SQLAlchemyRepository constructor,
+        binding this repository to the places table.
+        """
+        # Call parent constructor with Place model to establish database connection
+        super().__init__(Place)
+
+    def get_place_by_id(self, place_id):
+        """
+        Retrieve a place with its owner and amenities loaded in two queries.
+
+        The owner is fetched through a JOIN on the place SELECT and the amenities
+        through a single SELECT ... WHERE place_id IN (...), so serializing the
+        place afterwards triggers no further lazy loads. Only the id and name
+        columns of each amenity are selected, since that is all place views
+        serialize; other amenity columns load on first access.
+
+        Args:
+            place_id (str): The unique UUID identifier of the place
+
+        Returns:
+            Place or None: The Place instance with owner and amenities populated,
+                           None if no place exists with the specified ID
+
+        Example:
+            place = place_repository.get_place_by_id("12345-67890-abcdef")
+            names = [amenity.name for amenity in place.amenities]  # no extra SELECT
+        """
+        # Eager-load the many-to-one owner via JOIN and the amenities (id, name) via SELECT IN
+        return (self.model.query
+                .options(joinedload(Place.owner),
+                         selectinload(Place.amenities).load_only(Amenity.id, Amenity.name))
+                .filter_by(id=place_id)
+                .one_or_none())
+
+    def get_all_with_relations(self):
+        """
+        Retrieve every place with its owner and amenities loaded in two queries.
+
+        Same loading strategy as get_place_by_id(): owners come through a JOIN
+        and all amenities of all places through one SELECT ... IN, so a listing
+        costs two queries instead of 1 + 2N lazy loads. selectinload avoids the
+        row multiplication a JOIN on the many-to-many table would cause.
+
+        Returns:
+            list[Place]: All places with owner and amenities populated
+        """
+        # Eager-load owners via JOIN and amenities (id, name) via a single SELECT IN
+        return (self.model.query
+                .options(joinedload(Place.owner),
+                         selectinload(Place.amenities).load_only(Amenity.id, Amenity.name))
+                .all())
+
+    def get_listing_rows(self):
+        """
+        Retrieve the listing columns of every place and its owner as plain rows.
+
+        Issues one SELECT over places LEFT JOIN users returning Row tuples, so
+        no Place or User instance is built, tracked in the identity map or
+        fitted with lazy loaders. Columns come in this order: place id, title,
+        description, price, latitude, longitude, max_person, owner_id, owner
+        id, owner first_name, owner last_name, owner email, created_at,
+        updated_at (owner columns are None for a dangling owner_id).
+
+        Returns:
+            list[Row]: One row per place
+        """
+        # Place scalars and owner details in one round trip, without ORM hydration
+        return db.session.execute(
+            select(Place.id, Place.title, Place.description, Place.price,
+                   Place.latitude, Place.longitude, Place.max_person, Place.owner_id,
+                   User.id, User.first_name, User.last_name, User.email,
+                   Place.created_at, Place.updated_at)
+            .outerjoin(User, User.id == Place.owner_id)
+        ).all()
+
+    def get_amenity_links(self):
+        """
+        Retrieve every (place ID, amenity ID, amenity name) link as plain rows.
+
+        Companion to get_listing_rows(): one SELECT over place_amenity JOIN
+        amenities covers the amenities of all places.
+
+        Returns:
+            list[Row]: Rows of (place_id, amenity id, amenity name)
+        """
+        # All links with the two exposed amenity columns in one query
+        return db.session.execute(
+            select(place_amenity.c.place_id, Amenity.id, Amenity.name)
+            .join(Amenity, Amenity.id == place_amenity.c.amenity_id)
+        ).all()
+
+    def add_with_amenities(self, place, amenity_ids):
+        """
+        Insert a new place and its amenity links in one transaction.
+
+        Autoflush is disabled while the place is staged so nothing is sent
+        early; one explicit flush inserts the place (assigning its ID), then a
+        single INSERT INTO place_amenity ... SELECT links every amenity whose
+        ID exists, instead of one SELECT and one association INSERT per
+        amenity. Unknown IDs are dropped by the SELECT, and the whole creation
+        is committed once.
+
+        Args:
+            place (Place): New place instance, without amenities
+            amenity_ids (Iterable[str]): IDs of the amenities to link (duplicates allowed)
+
+        Returns:
+            Place: The persisted place
+
+        Raises:
+            Exception: Database-specific exceptions with automatic rollback
+
+        Example:
+            place_repository.add_with_amenities(place, ["amenity-id-1", "amenity-id-2"])
+        """
+        # Duplicates would violate the association's primary key
+        amenity_ids = list(dict.fromkeys(amenity_ids))
+
+        try:
+            # Stage the place without intermediate autoflushes, then insert it once
+            with db.session.no_autoflush:
+                db.session.add(place)
+            db.session.flush()
+
+            # Link all existing amenities with a single INSERT ... SELECT
+            if amenity_ids:
+                db.session.execute(
+                    insert(place_amenity).from_select(
+                        ['place_id', 'amenity_id'],
+                        select(literal(place.id), Amenity.id).where(Amenity.id.in_(amenity_ids))))
+
+            # One commit for the place and its links
+            db.session.commit()
+            return place
+        except Exception:
+            # Rollback transaction on error to maintain consistency
+            db.session.rollback()
+            raise
+
+    def get_updated_at(self, place_id):
+        """
+        Retrieve only the last modification time of a place.
+
+        Issues SELECT updated_at FROM places WHERE id = :id without building a
+        Place instance, which is all a conditional GET needs to compare versions.
+
+        Args:
+            place_id (str): The unique UUID identifier of the place
+
+        Returns:
+            datetime or None: The place's updated_at, None if the place does not exist
+        """
+        # Read a single column of a single row
+        return db.session.execute(
+            select(Place.updated_at).where(Place.id == place_id)
+        ).scalar_one_or_none()
+
+    def get_owner_id(self, place_id):
+        """
+        Retrieve only the owner ID of a place.
+
+        Issues SELECT owner_id FROM places WHERE id = :id without building a
+        Place instance, which is all an ownership check needs.
+
+        Args:
+            place_id (str): The unique UUID identifier of the place
+
+        Returns:
+            str or None: The owner's user ID, None if the place does not exist
+
+        Example:
+            if place_repository.get_owner_id(place_id) != current_user_id:
+                # Reject before loading the place
+                pass
+        """
+        # Select the single foreign key column; no ORM object is constructed
+        return db.session.execute(
+            select(Place.owner_id).where(Place.id == place_id)
+        ).scalar_one_or_none()
+
+    def delete_if_owner(self, place_id, owner_id=None):
+        """
+        Delete a place, optionally only if owned by owner_id, without loading it.
+
+        The ownership condition is part of every statement's WHERE clause, so
+        checking and deleting happen atomically in one transaction. Rows that
+        reference the place (amenity links and reviews) are removed first,
+        matching the ON DELETE CASCADE rules of the SQL schema.
+
+        Args:
+            place_id (str): The unique UUID identifier of the place
+            owner_id (str, optional): Required owner; None deletes regardless of owner
+
+        Returns:
+            int: Number of deleted places (0 when missing or not owned by owner_id)
+
+        Raises:
+            Exception: Database-specific exceptions with automatic rollback
+        """
+        # Build the WHERE clause: the place itself, restricted to its owner if requested
+        conditions = [Place.id == place_id]
+        if owner_id is not None:
+            conditions.append(Place.owner_id == owner_id)
+        target = select(Place.id).where(*conditions)
+
+        try:
+            # Remove dependent rows of the matching place, then the place itself
+            db.session.execute(
+                delete(place_amenity).where(place_amenity.c.place_id.in_(target)))
+            db.session.execute(delete(Review).where(Review.place_id.in_(target)))
+            deleted = db.session.execute(delete(Place).where(*conditions)).rowcount
+            db.session.commit()
+            return deleted
+        except Exception as e:
+            # Rollback transaction on error to maintain consistency
+            db.session.rollback()
+            # Re-raise exception for upstream handling
+            raise e
@@ -464,6 +464,29 @@ class SQLAlchemyRepository(Repository):
         if not obj:
             raise KeyError("Object not found")
 
+        # Apply changes and commit through the instance-based variant
+        return self.update_obj(obj, data)
+
+    def update_obj(self, obj, data):
+        """
+        Update an already-loaded database record with transaction safety.
+
+        Same as update() but skips the primary key lookup, for callers that
+        already hold the instance (e.g. after an authorization check).
+
+        Args:
+            obj: SQLAlchemy model instance attached to the current session
+            data (dict): Dictionary of attribute names and new values
+
+        Returns:
+            object: Updated SQLAlchemy model instance
+
+        Raises:
+            Exception: Database-specific exceptions with automatic rollback
+
+        Example:
+            updated_user = repository.update_obj(user, {"email": "new@email.com"})
+        """
         try:
             # Update attributes if data is provided as dictionary
             if isinstance(data, dict):
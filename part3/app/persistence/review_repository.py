@@ -0,0 +1,191 @@
+# Import necessary modules for review repository functionality
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import joinedload
+from app.extensions import db
+from app.models.review import Review
+from app.persistence.repository import SQLAlchemyRepository
+
+
+class ReviewRepository(SQLAlchemyRepository):
+    """
+    Specialized repository for Review entity data access operations.
+
+    This class extends the generic SQLAlchemyRepository with Review-specific
+    statements that fold the author check into the SQL itself, so write paths
+    do not need to load a review just to decide whether the caller may touch it.
+
+    Features:
+    - Inherits full CRUD operations from SQLAlchemyRepository
+    - Projected listing returning plain rows for read-only endpoints
+    - Full listing with author and place eagerly loaded
+    - Author ID and updated_at lookups that read a single column
+      (authorization checks and conditional GETs)
+    - Conditional UPDATE and DELETE restricted to the review's author
+
+    Database Table:
+    - Operates on the 'reviews' table through the Review SQLAlchemy model
+    """
+
+    def __init__(self):
+        """
+        Initialize the ReviewRepository with the Review model.
+
+        Passes the Review model class to the parent SQLAlchemyRepository constructor,
+        binding this repository to the reviews table.
+        """
+        # Call parent constructor with Review model to establish database connection
+        super().__init__(Review)
+
+    def get_all_with_relations(self):
+        """
+        Retrieve every review with its author and place loaded in one query.
+
+        Both relationships are many-to-one, so they are fetched through JOINs
+        on the review SELECT instead of one lazy SELECT per review and
+        relationship (1 + 2N queries).
+
+        Returns:
+            list[Review]: All reviews with user and place populated
+        """
+        # Eager-load author and place via JOIN (many-to-one: no row multiplication)
+        return db.session.execute(
+            select(Review).options(joinedload(Review.user), joinedload(Review.place))
+        ).scalars().all()
+
+    def get_all_projected(self):
+        """
+        Retrieve the exposed columns of every review as plain rows.
+
+        Issues SELECT id, text, rating, user_id, place_id FROM reviews and
+        returns Row tuples, skipping ORM hydration and identity-map
+        bookkeeping. The author and place are read from the foreign key
+        columns, so neither relationship is loaded.
+
+        Returns:
+            list[Row]: Rows of (id, text, rating, user_id, place_id)
+        """
+        # Read only the five exposed columns in one query
+        return db.session.execute(
+            select(Review.id, Review.text, Review.rating, Review.user_id, Review.place_id)
+        ).all()
+
+    def get_updated_at(self, review_id):
+        """
+        Retrieve only the last modification time of a review.
+
+        Issues SELECT updated_at FROM reviews WHERE id = :id without building a
+        Review instance, which is all a conditional GET needs to compare versions.
+
+        Args:
+            review_id (str): The unique UUID identifier of the review
+
+        Returns:
+            datetime or None: The review's updated_at, None if the review does not exist
+        """
+        # Read a single column of a single row
+        return db.session.execute(
+            select(Review.updated_at).where(Review.id == review_id)
+        ).scalar_one_or_none()
+
+    def get_listing_version(self):
+        """
+        Retrieve the newest modification time and the number of reviews.
+
+        Issues SELECT max(updated_at), count(*) FROM reviews. Creating or
+        updating a review moves the maximum and deleting one changes the
+        count, so the pair identifies a version of the whole listing without
+        reading any review.
+
+        Returns:
+            tuple: (datetime or None, int), None when there are no reviews
+        """
+        # One aggregate row for the whole table
+        return tuple(db.session.execute(
+            select(func.max(Review.updated_at), func.count()).select_from(Review)
+        ).one())
+
+    def get_author_id(self, review_id):
+        """
+        Retrieve only the author ID of a review.
+
+        Issues SELECT user_id FROM reviews WHERE id = :id without building a
+        Review instance, which is all an authorship check needs.
+
+        Args:
+            review_id (str): The unique UUID identifier of the review
+
+        Returns:
+            str or None: The author's user ID, None if the review does not exist
+        """
+        # Read a single column of a single row
+        return db.session.execute(
+            select(Review.user_id).where(Review.id == review_id)
+        ).scalar_one_or_none()
+
+    def update_if_author(self, review_id, values, user_id=None):
+        """
+        Update a review in a single statement, optionally only if written by user_id.
+
+        Executes UPDATE reviews SET ... WHERE id = :id [AND user_id = :user_id],
+        so existence, authorization and the write happen in one round trip.
+
+        Args:
+            review_id (str): The unique UUID identifier of the review
+            values (dict): Column names mapped to their new values
+            user_id (str, optional): Required author; None updates regardless of author
+
+        Returns:
+            int: Number of updated rows (0 when missing or not authored by user_id)
+
+        Raises:
+            Exception: Database-specific exceptions with automatic rollback
+        """
+        # Build the WHERE clause: the review itself, restricted to its author if requested
+        conditions = [Review.id == review_id]
+        if user_id is not None:
+            conditions.append(Review.user_id == user_id)
+
+        try:
+            # Update and commit in one round trip
+            updated = db.session.execute(
+                update(Review).where(*conditions).values(**values)).rowcount
+            db.session.commit()
+            return updated
+        except Exception as e:
+            # Rollback transaction on error to maintain consistency
+            db.session.rollback()
+            # Re-raise exception for upstream handling
+            raise e
+
+    def delete_if_author(self, review_id, user_id=None):
+        """
+        Delete a review in a single statement, optionally only if written by user_id.
+
+        Executes DELETE FROM reviews WHERE id = :id [AND user_id = :user_id], so
+        the authorization check and the deletion happen atomically.
+
+        Args:
+            review_id (str): The unique UUID identifier of the review
+            user_id (str, optional): Required author; None deletes regardless of author
+
+        Returns:
+            int: Number of deleted rows (0 when missing or not authored by user_id)
+
+        Raises:
+            Exception: Database-specific exceptions with automatic rollback
+        """
+        # Build the WHERE clause: the review itself, restricted to its author if requested
+        conditions = [Review.id == review_id]
+        if user_id is not None:
+            conditions.append(Review.user_id == user_id)
+
+        try:
+            # Delete and commit in one round trip
+            deleted = db.session.execute(delete(Review).where(*conditions)).rowcount
+            db.session.commit()
+            return deleted
+        except Exception as e:
+            # Rollback transaction on error to maintain consistency
+            db.session.rollback()
+            # Re-raise exception for upstream handling
+            raise e
@@ -1,4 +1,6 @@
 # Import necessary modules for user repository functionality
+from sqlalchemy import select, update
+from app.extensions import db
 from app.models.user import User
 from app.persistence.repository import SQLAlchemyRepository
 
@@ -88,6 +90,24 @@ class UserRepository(SQLAlchemyRepository):
         # Query User table filtering by email field, return first match or None
         return self.model.query.filter_by(email=email).first()
 
+    def get_user_for_login(self, email):
+        """
+        Retrieve a user by email with every column read from the database.
+
+        Same lookup as get_user_by_email(), but the row overwrites the state of
+        an instance already present in the session (for example one re-attached
+        from a facade cache), so the password hash and admin flag used to issue
+        a token are always the committed ones.
+
+        Args:
+            email (str): The normalized email address to search for
+
+        Returns:
+            User or None: The User model instance if found, None otherwise
+        """
+        # Refresh any identity-mapped instance from the returned row
+        return self.model.query.filter_by(email=email).populate_existing().first()
+
     def get_user_by_id(self, user_id):
         """
         Retrieve a user by their unique identifier.
@@ -120,3 +140,92 @@ class UserRepository(SQLAlchemyRepository):
         """
         # Delegate to parent class get() method for primary key lookup
         return self.model.query.get(user_id)
+
+    def get_updated_at(self, user_id):
+        """
+        Retrieve only the last modification time of a user.
+
+        Issues SELECT updated_at FROM users WHERE id = :id without building a
+        User instance, which is all a conditional GET needs to compare versions.
+
+        Args:
+            user_id (str): The unique UUID identifier of the user
+
+        Returns:
+            datetime or None: The user's updated_at, None if the user does not exist
+        """
+        # Read a single column of a single row
+        return db.session.execute(
+            select(User.updated_at).where(User.id == user_id)
+        ).scalar_one_or_none()
+
+    def get_all_projected(self):
+        """
+        Retrieve the public columns of every user as plain rows.
+
+        Issues SELECT id, first_name, last_name, email FROM users and returns
+        Row tuples, skipping ORM hydration and identity-map bookkeeping.
+        Password hashes and admin flags are never read.
+
+        Returns:
+            list[Row]: Rows of (id, first_name, last_name, email)
+        """
+        # Read only the four exposed columns in one query
+        return db.session.execute(
+            select(User.id, User.first_name, User.last_name, User.email)
+        ).all()
+
+    def get_users_in(self, user_ids):
+        """
+        Retrieve every user whose ID is in the given collection, in one query.
+
+        Issues SELECT ... FROM users WHERE id IN (...). Loaded users land in the
+        session's identity map, so later get() calls for the same IDs within the
+        request are answered without touching the database.
+
+        Args:
+            user_ids (Iterable[str]): The user IDs to load
+
+        Returns:
+            list[User]: The matching users, in no particular order
+
+        Example:
+            users = user_repository.get_users_in(["id-1", "id-2"])
+        """
+        # Single IN query for the whole collection
+        return self.model.query.filter(User.id.in_(list(user_ids))).all()
+
+    def update_fields(self, user_id, values):
+        """
+        Update columns of a user with a single UPDATE statement.
+
+        Issues UPDATE users SET ... WHERE id = :id without loading the user
+        first; a missing user simply matches no row. Uniqueness of the email
+        column is enforced by the database and surfaces as IntegrityError.
+
+        Args:
+            user_id (str): The unique UUID identifier of the user
+            values (dict): Column names mapped to their new values
+
+        Returns:
+            int: Number of updated rows (0 if the user does not exist)
+
+        Raises:
+            sqlalchemy.exc.IntegrityError: If the new email is already in use
+            Exception: Other database exceptions, after rollback
+
+        Example:
+            if not user_repository.update_fields(user_id, {'first_name': 'Jane'}):
+                # No such user
+        """
+        try:
+            # Update and commit in one round trip
+            updated = db.session.execute(
+                update(User).where(User.id == user_id).values(**values)).rowcount
+            db.session.commit()
+            return updated
+        except Exception as e:
+            # Rollback transaction on error to maintain consistency
+            db.session.rollback()
+            # Re-raise exception for upstream handling
+            raise e
@@ -0,0 +1,25 @@
+# Business exceptions raised by the facade.
+#
+# Both subclass ValueError so callers (and the API-wide ValueError handler)
+# that predate them keep treating them as validation failures.
+
+
+class NotFoundError(ValueError):
+    """
+    Raised when the entity targeted by an operation does not exist.
+
+    Example:
+        try:
+            facade.update_user_atomic(user_id, data)
+        except NotFoundError:
+            return {'error': 'User not found'}, 404
+    """
+
+
+class EmailAlreadyRegistered(ValueError):
+    """
+    Raised when a write would give a user an email address already in use.
+
+    Detected from the unique constraint on users.email rather than from a
+    preliminary lookup, so it also covers concurrent requests.
+    """
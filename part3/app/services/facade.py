@@ -1,11 +1,23 @@
 # Import necessary modules for facade service layer functionality
-from app.persistence.repository import SQLAlchemyRepository
 from app.persistence.user_repository import UserRepository
+from app.persistence.place_repository import PlaceRepository
+from app.persistence.review_repository import ReviewRepository
+from app.persistence.amenity_repository import AmenityRepository
 from app.models.user import User
 from app.models.amenity import Amenity
 from app.models.place import Place
 from app.models.review import Review
+from app.extensions import bcrypt, db
+from app.services.exceptions import EmailAlreadyRegistered, NotFoundError
+from app.utils.cache import TTLCache
+from app.utils.request_memo import clear_request_memo, request_memoize
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
+import hashlib
+import hmac
+import itertools
 import re
+import secrets
 
 
 class HBnBFacade:
@@ -61,17 +73,86 @@ class HBnBFacade:
 
         Repository Configuration:
         - UserRepository: Specialized repository with email-based lookup capabilities
-        - SQLAlchemyRepository instances: Generic repositories for other domain entities
+        - PlaceRepository: Specialized repository loading owner and amenities eagerly
+        - ReviewRepository: Specialized repository with author-scoped deletes
+        - AmenityRepository: Specialized repository with projected listings
         - All repositories configured with appropriate SQLAlchemy models
         - Transaction management handled at repository level
         """
         # Initialize specialized user repository with email lookup capabilities
         self.user_repo = UserRepository()
 
-        # Initialize generic SQLAlchemy repositories for other domain entities
-        self.place_repo = SQLAlchemyRepository(Place)
-        self.review_repo = SQLAlchemyRepository(Review)
-        self.amenity_repo = SQLAlchemyRepository(Amenity)
+        # Initialize specialized place repository with eager-loading lookups
+        self.place_repo = PlaceRepository()
+
+        # Initialize specialized review repository with author-scoped statements
+        self.review_repo = ReviewRepository()
+
+        # Initialize specialized amenity repository with projected listings
+        self.amenity_repo = AmenityRepository()
+
+        # Short-lived read caches for single-entity lookups, keyed by UUID
+        # Entries expire after 5 seconds and are dropped on every update/delete
+        self._place_cache = TTLCache(maxsize=4096, ttl=5)
+        self._review_cache = TTLCache(maxsize=4096, ttl=5)
+
+        # Amenities rarely change: keep them for a minute (also dropped on update/delete)
+        self._amenity_cache = TTLCache(maxsize=4096, ttl=60)
+
+        # Version of the data shown by place listings, replaced after every write to a
+        # place, a user (owner details) or an amenity; next() on a count is atomic
+        self._places_versions = itertools.count(1)
+        self._places_version = 0
+
+        # Users looked up by ID or email, shared across requests for 30 seconds
+        # (the lifetime of a cached JWT verification); dropped on every user write
+        self._user_cache = TTLCache(maxsize=5000, ttl=30)
+        self._user_id_by_email = TTLCache(maxsize=5000, ttl=30)
+
+        # Recent successful logins, keyed by an HMAC of (user ID, stored hash, password)
+        # under a per-process random key, so a password change orphans every entry
+        self._login_key = secrets.token_bytes(32)
+        self._login_cache = TTLCache(maxsize=1024, ttl=30)
+
+        # Recent failed logins under the same keys, so repeating a wrong password
+        # does not buy another bcrypt run
+        self._failed_login_cache = TTLCache(maxsize=4096, ttl=30)
+
+    def _from_cache(self, cache, obj_id):
+        """
+        Return a cached entity attached to the current session, or None.
+
+        Cached instances come from an earlier request's session, so they are
+        re-attached with session.merge(load=False), which copies their loaded
+        state without emitting a SELECT. Entries whose attributes were expired
+        by a commit, or modified but not yet flushed, are discarded instead.
+
+        Args:
+            cache (TTLCache): Cache holding the detached instances
+            obj_id (str): UUID key of the entity
+
+        Returns:
+            object or None: Session-bound instance, or None on a cache miss
+        """
+        # Look up the entity; a miss falls through to the repository
+        obj = cache.get(obj_id)
+        if obj is None:
+            return None
+
+        # Skip instances expired by a commit or modified by their own session
+        state = inspect(obj)
+        if state.expired_attributes or state.modified:
+            cache.pop(obj_id, None)
+            return None
+
+        try:
+            # Attach a copy to this request's session without querying the database
+            return db.session.merge(obj, load=False)
+
+        except InvalidRequestError:
+            # The instance changed concurrently; fall back to a fresh load
+            cache.pop(obj_id, None)
+            return None
 
     # ==================== USER MANAGEMENT OPERATIONS ====================
 
@@ -96,7 +177,8 @@ class HBnBFacade:
 
         Raises:
             ValueError: If user data fails model validation (invalid email, short password, etc.)
-            Exception: Database-specific exceptions for constraint violations or connection issues
+            EmailAlreadyRegistered: If the email violates the unique constraint on users.email
+            Exception: Database-specific exceptions for other constraint violations or connection issues
 
         Example:
             user_data = {
@@ -111,8 +193,14 @@ class HBnBFacade:
         # Create User instance with validation (constructor handles password hashing)
         user = User(**user_data)
 
-        # Persist user to database through repository
-        self.user_repo.add(user)
+        try:
+            # Persist user; the unique index on users.email rejects duplicates atomically
+            self.user_repo.add(user)
+        except IntegrityError:
+            raise EmailAlreadyRegistered("Email already registered")
+
+        # Email lookups memoized earlier in this request may now be stale
+        clear_request_memo()
 
         return user
 
@@ -146,6 +234,48 @@ class HBnBFacade:
 
         return user
 
+    def get_user_or_none(self, user_id):
+        """
+        Retrieve a user by ID, returning None instead of raising when it is missing.
+
+        Lets callers branch on a missing user without raising and catching an
+        exception on that path. The lookup goes through the session identity map
+        first, so repeated calls in one request cost at most one query.
+
+        Args:
+            user_id (str): UUID of the user to retrieve
+
+        Returns:
+            User or None: The user instance, or None if no user has this ID
+
+        Example:
+            user = facade.get_user_or_none(user_id)
+            if user is None:
+                return {'error': 'User not found'}, 404
+        """
+        # Primary key lookup; None when the user does not exist
+        return self.user_repo.get(user_id)
+
+    def get_user_meta(self, user_id):
+        """
+        Retrieve the last modification time of a user without loading it.
+
+        Used by conditional GETs to answer 304 Not Modified from a single
+        column read.
+
+        Args:
+            user_id (str): UUID of the user
+
+        Returns:
+            datetime or None: The user's updated_at, None if no user has this ID
+
+        Example:
+            updated_at = facade.get_user_meta(user_id)
+        """
+        # Single-column lookup through the user repository
+        return self.user_repo.get_updated_at(user_id)
+
+    @request_memoize
     def get_user_by_email(self, email):
         """
         Retrieve a user by their email address.
@@ -154,28 +284,101 @@ class HBnBFacade:
         where users log in with their email address. Returns None if no matching
         user is found, allowing calling code to handle authentication failures.
 
+        The result is memoized for the rest of the request, so repeated lookups of
+        the same email cost one query; user writes clear the memo. Found users are
+        also kept for 30 seconds across requests (see get_user_by_id()). That cache
+        is per process and may lag behind writes made by other workers, so
+        authenticate() does not use it.
+
         Args:
-            email (str): Email address to search for (should be normalized)
+            email (str): Email address to search for (normalized before the lookup)
 
         Returns:
             User or None: The matching user instance, or None if not found
 
         Example:
-            user = facade.get_user_by_email("john.doe@example.com")
-            if user and user.verify_password(password):
-                # Authentication successful
-                pass
+            if facade.get_user_by_email("john.doe@example.com"):
+                return {'error': 'Email already registered'}, 400
+        """
+        # Stored emails are normalized, so look up the canonical form
+        email = User.normalize_email(email)
+
+        # Serve the user from the cross-request cache if it still has this email
+        user_id = self._user_id_by_email.get(email)
+        if user_id is not None:
+            user = self._from_cache(self._user_cache, user_id)
+            if user is not None and user.email == email:
+                return user
+
+        # Cache miss: query by email and remember the result (unknown emails are not cached)
+        user = self.user_repo.get_user_by_email(email)
+        if user is not None:
+            self._remember_user(user)
+        return user
+
+    def authenticate(self, email, password):
         """
-        # Delegate to specialized user repository method for email lookup
-        return self.user_repo.get_user_by_email(email)
+        Check login credentials, skipping bcrypt for recently verified ones.
+
+        A bcrypt check costs tens to hundreds of milliseconds by design. The
+        outcome of a check is remembered for 30 seconds under
+        HMAC-SHA256(per-process key, user ID + stored hash + password), so
+        repeated logins with the same credentials only cost the user lookup.
+        Failed checks are remembered the same way, so retrying a wrong password
+        within 30 seconds is refused without running bcrypt again, which keeps
+        password guessing from turning into a CPU drain. The plain password is
+        never stored. The stored hash is read from the database on every call
+        and is part of the key, so once the password changes in any worker,
+        no earlier entry can match.
+
+        Args:
+            email (str): Email address entered by the user
+            password (str): Plain text password entered by the user
+
+        Returns:
+            User or None: The authenticated user, or None if the credentials are invalid
+
+        Example:
+            user = facade.authenticate(login_data['email'], login_data['password'])
+            if user is None:
+                return {'message': 'Invalid credentials'}, 401
+        """
+        # Read the user from the database, never from the per-process user cache:
+        # the password hash and is_admin flag must reflect writes made by any worker
+        user = self.user_repo.get_user_for_login(User.normalize_email(email))
+        if user is None:
+            # Unknown (or deleted) email: nothing to verify
+            return None
+
+        # Derive a cache key bound to the current hash that reveals nothing about the password
+        key = hmac.new(self._login_key, f'{user.id}\0{user.password}\0{password}'.encode(),
+                       hashlib.sha256).digest()
+
+        # Same credentials verified recently against the same stored hash
+        if self._login_cache.get(key):
+            return user
+
+        # Same credentials rejected recently against the same stored hash
+        if self._failed_login_cache.get(key):
+            return None
+
+        # Full bcrypt verification (constant-time comparison inside flask_bcrypt)
+        if not user.verify_password(password):
+            # Remember the failure for the hash it was checked against
+            self._failed_login_cache.set(key, True)
+            return None
+
+        # Remember that these credentials match this hash
+        self._login_cache.set(key, True)
+        return user
 
     def get_user_by_id(self, user_id):
         """
         Alternative method for retrieving users by ID.
 
         Provides the same functionality as get_user() but with a more explicit method name.
-        This method exists for API consistency and may have different error handling
-        in future implementations.
+        Found users are cached across requests for 30 seconds and dropped by every
+        user update or deletion made through this facade.
 
         Args:
             user_id (str): UUID of the user to retrieve
@@ -183,8 +386,77 @@ class HBnBFacade:
         Returns:
             User or None: User instance if found, None otherwise
         """
+        # Serve recently loaded users from the cross-request cache
+        user = self._from_cache(self._user_cache, user_id)
+        if user is not None:
+            return user
+
         # Delegate to user repository's ID-based lookup method
-        return self.user_repo.get_user_by_id(user_id)
+        user = self.user_repo.get_user_by_id(user_id)
+        if user is not None:
+            self._remember_user(user)
+        return user
+
+    def _remember_user(self, user):
+        """
+        Store a loaded user in the ID and email lookup caches.
+
+        Args:
+            user (User): The user just loaded from the database
+        """
+        # Index the instance by ID, and its email by the ID it belongs to
+        self._user_cache.set(user.id, user)
+        self._user_id_by_email.set(user.email, user.id)
+
+    def _forget_user(self, user_id):
+        """
+        Drop a user from the lookup caches after a write.
+
+        Only the ID entry needs removing: email entries point to an ID and are
+        checked against the cached user's current email on every hit.
+
+        Args:
+            user_id (str): UUID of the user that changed
+        """
+        # Next lookup by ID or email reloads the user
+        self._user_cache.pop(user_id, None)
+
+        # Email lookups memoized earlier in this request may now be stale
+        clear_request_memo()
+
+        # Place listings embed owner details
+        self._touch_places()
+
+    def get_users_by_ids(self, user_ids, chunk_size=100):
+        """
+        Retrieve many users by ID with one query per chunk of IDs.
+
+        Replaces one get_user() round trip per ID with ceil(n / chunk_size) IN
+        queries. As a side effect the users are primed in the session's identity
+        map, so subsequent get_user() calls for these IDs in the same request are
+        served without a query.
+
+        Args:
+            user_ids (list[str]): IDs of the users to retrieve; duplicates are ignored
+            chunk_size (int): Maximum number of IDs per IN query
+
+        Returns:
+            list[User]: Users found, in the order of their first appearance in
+                        user_ids; unknown IDs are skipped
+
+        Example:
+            users = facade.get_users_by_ids(["id-1", "id-2", "id-3"])
+        """
+        # Deduplicate while keeping the caller's order
+        ordered_ids = list(dict.fromkeys(user_ids))
+
+        # Load the users chunk by chunk to bound the size of each IN clause
+        found = {}
+        for start in range(0, len(ordered_ids), chunk_size):
+            for user in self.user_repo.get_users_in(ordered_ids[start:start + chunk_size]):
+                found[user.id] = user
+
+        return [found[user_id] for user_id in ordered_ids if user_id in found]
 
     def get_all_users(self):
         """
@@ -211,6 +483,22 @@ class HBnBFacade:
             # Return empty list on any database error to maintain API stability
             return []
 
+    def list_users_projected(self):
+        """
+        Return the public columns of all users as plain rows, without ORM instances.
+
+        For read-only listings: one query returning lightweight Row tuples of
+        (id, first_name, last_name, email).
+
+        Returns:
+            list[Row]: One row per user
+
+        Example:
+            rows = facade.list_users_projected()
+        """
+        # Single projected query through the user repository
+        return self.user_repo.get_all_projected()
+
     def update_user(self, user_id, data):
         """
         Update user attributes with validation and security handling.
@@ -247,9 +535,9 @@ class HBnBFacade:
         if not user:
             raise ValueError("Error ID: The requested ID does not exist.")
 
-        # Validate email format if email is being updated
+        # Normalize and validate email format if email is being updated
         if 'email' in data:
-            email = data['email']
+            email = data['email'] = User.normalize_email(data['email'])
             # Use regex pattern matching for email validation
             if not re.fullmatch(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,7}", email):
                 raise ValueError(
@@ -260,9 +548,73 @@ class HBnBFacade:
             # Hash new password using user's hash_password method
             user.hash_password(data.pop('password'))
 
+        # Cached lookups of this user (and memoized email lookups) are now stale
+        self._forget_user(user_id)
+
         # Apply updates through repository layer
         return self.user_repo.update(user_id, data)
 
+    # User columns an update request may change
+    USER_UPDATE_FIELDS = ('first_name', 'last_name', 'email', 'password', 'is_admin')
+
+    def update_user_atomic(self, user_id, data):
+        """
+        Update a user with one UPDATE statement, relying on the database for checks.
+
+        Unlike update_user(), the user is not loaded first and email uniqueness is
+        not checked with a preliminary lookup: a missing user matches no row and a
+        duplicate email violates the unique constraint on users.email. The updated
+        user is then read back once for the response.
+
+        Args:
+            user_id (str): UUID of the user to update
+            data (dict): Attributes to update; keys outside USER_UPDATE_FIELDS are ignored
+
+        Returns:
+            User: The updated user instance
+
+        Raises:
+            NotFoundError: If no user exists with this ID
+            EmailAlreadyRegistered: If the new email belongs to another user
+            ValueError: If the new email is not a valid address
+
+        Example:
+            user = facade.update_user_atomic(user_id, {"first_name": "Jane"})
+        """
+        # Keep only updatable columns
+        values = {key: value for key, value in data.items() if key in self.USER_UPDATE_FIELDS}
+
+        # Normalize and validate email format if email is being updated
+        if 'email' in values:
+            values['email'] = User.normalize_email(values['email'])
+            if not re.fullmatch(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,7}", values['email']):
+                raise ValueError(
+                    "Invalid email: must be a valid email address.")
+
+        # Store a bcrypt hash, never the plain text password
+        if 'password' in values:
+            values['password'] = bcrypt.generate_password_hash(values['password']).decode('utf-8')
+
+        if values:
+            try:
+                # Existence and email uniqueness are both checked by the UPDATE itself
+                updated = self.user_repo.update_fields(user_id, values)
+            except IntegrityError:
+                raise EmailAlreadyRegistered("Email is already in use")
+
+            if not updated:
+                raise NotFoundError("User not found")
+
+            # Cached lookups of this user (and memoized email lookups) are now stale
+            self._forget_user(user_id)
+
+        # Read the user back (raises NotFoundError if it does not exist)
+        user = self.user_repo.get(user_id)
+        if not user:
+            raise NotFoundError("User not found")
+
+        return user
+
     def delete_user(self, user_id):
         """
         Delete a user entity from the system.
@@ -297,6 +649,9 @@ class HBnBFacade:
         # Perform deletion through repository
         self.user_repo.delete(user_id)
 
+        # Cached lookups of this user (and memoized email lookups) are now stale
+        self._forget_user(user_id)
+
         return True
 
     # ==================== AMENITY MANAGEMENT OPERATIONS ====================
@@ -316,7 +671,7 @@ class HBnBFacade:
             Amenity: The created and persisted amenity instance
 
         Raises:
-            ValueError: If amenity data fails model validation
+            ValueError: If amenity data fails model validation or the name already exists
             Exception: Database-specific exceptions
 
         Example:
@@ -326,8 +681,12 @@ class HBnBFacade:
         # Create Amenity instance with validation (constructor handles name formatting)
         amenity = Amenity(**amenity_data)
 
-        # Persist amenity to database through repository
-        self.amenity_repo.add(amenity)
+        try:
+            # Persist amenity to database through repository
+            self.amenity_repo.add(amenity)
+        except IntegrityError:
+            # amenities.name is unique; the repository already rolled back
+            raise ValueError("Amenity already exists")
 
         return amenity
 
@@ -351,6 +710,11 @@ class HBnBFacade:
             amenity = facade.get_amenity("12345-67890-abcdef")
             print(f"Amenity: {amenity.name}")
         """
+        # Serve recently loaded amenities from the cache
+        amenity = self._from_cache(self._amenity_cache, amenity_id)
+        if amenity is not None:
+            return amenity
+
         # Retrieve amenity from repository by primary key
         amenity = self.amenity_repo.get(amenity_id)
 
@@ -358,6 +722,9 @@ class HBnBFacade:
         if not amenity:
             raise ValueError("Error ID: The requested ID does not exist.")
 
+        # Remember the loaded amenity for subsequent reads
+        self._amenity_cache.set(amenity_id, amenity)
+
         return amenity
 
     def get_amenity_by_name(self, name):
@@ -380,6 +747,56 @@ class HBnBFacade:
         # Use repository's attribute-based query with formatted name
         return self.amenity_repo.get_by_attribute('name', name.strip().title())
 
+    def get_or_create_amenities(self, names):
+        """
+        Resolve amenity names to amenities, creating the missing ones, in two round trips.
+
+        Names are normalized the way the Amenity model stores them (stripped,
+        title case) and deduplicated. Existing amenities are loaded with one
+        IN query and all missing ones are inserted in a single transaction,
+        instead of one lookup (and possibly one insert) per name. The unique
+        constraint on amenities.name settles races with concurrent creators:
+        on a conflict the rows they inserted are read back and reused.
+
+        Args:
+            names (Iterable[str]): Amenity names as entered by the user
+
+        Returns:
+            list[Amenity]: One amenity per distinct name, in order of first appearance
+
+        Raises:
+            ValueError: If a name is empty or longer than 50 characters
+
+        Example:
+            amenities = facade.get_or_create_amenities(["wifi", "Pool", "WiFi"])
+            amenity_ids = [amenity.id for amenity in amenities]  # two IDs
+        """
+        # Normalize like Amenity.__init__ and keep the first occurrence of each name
+        wanted = list(dict.fromkeys(name.strip().title() for name in names))
+
+        # Load every existing amenity in one query (first match wins on duplicates)
+        found = {}
+        for amenity in self.amenity_repo.get_by_names(wanted):
+            found.setdefault(amenity.name, amenity)
+
+        # Create everything that is still missing in a single commit
+        missing = [Amenity(name) for name in wanted if name not in found]
+        if missing:
+            try:
+                self.amenity_repo.add_all(missing)
+                found.update((amenity.name, amenity) for amenity in missing)
+            except IntegrityError:
+                # A concurrent request created some of these names first (amenities.name
+                # is unique): the insert was rolled back, so read the winners' rows instead
+                for amenity in self.amenity_repo.get_by_names(a.name for a in missing):
+                    found.setdefault(amenity.name, amenity)
+                still_missing = [Amenity(name) for name in wanted if name not in found]
+                if still_missing:
+                    self.amenity_repo.add_all(still_missing)
+                    found.update((amenity.name, amenity) for amenity in still_missing)
+
+        return [found[name] for name in wanted]
+
     def get_all_amenities(self):
         """
         Retrieve all amenities in the system.
@@ -402,6 +819,23 @@ class HBnBFacade:
             # Return empty list on any database error
             return []
 
+    def list_amenities_projected(self):
+        """
+        Retrieve the ID and name of every amenity without loading ORM instances.
+
+        Intended for read-only listings that only expose these two fields:
+        a single SELECT id, name query, no per-row object construction.
+
+        Returns:
+            list[Row]: Rows exposing .id and .name
+
+        Example:
+            for row in facade.list_amenities_projected():
+                print(f"Available: {row.name}")
+        """
+        # Select the two exposed columns directly
+        return self.amenity_repo.get_all_projected()
+
     def update_amenity(self, amenity_id, amenity_data):
         """
         Update an existing amenity with validation.
@@ -418,7 +852,8 @@ class HBnBFacade:
             Amenity: The updated amenity instance
 
         Raises:
-            ValueError: If amenity not found or validation fails
+            NotFoundError: If amenity not found
+            ValueError: If validation fails or another amenity already has the name
 
         Example:
             update_data = {"name": "High-Speed WiFi"}
@@ -427,7 +862,7 @@ class HBnBFacade:
         # Verify amenity exists before attempting update
         amenity = self.amenity_repo.get(amenity_id)
         if not amenity:
-            raise ValueError("Error ID: The requested ID does not exist.")
+            raise NotFoundError("Amenity not found")
 
         # Validate name if being updated
         if 'name' in amenity_data:
@@ -435,8 +870,17 @@ class HBnBFacade:
             if not name or len(name) > 50:
                 raise ValueError("Name must be between 1 and 50 characters.")
 
-        # Apply updates through repository layer
-        return self.amenity_repo.update(amenity_id, amenity_data)
+        try:
+            # Apply updates through repository layer
+            amenity = self.amenity_repo.update(amenity_id, amenity_data)
+        except IntegrityError:
+            # amenities.name is unique; the repository already rolled back
+            raise ValueError("Amenity already exists")
+
+        # Drop the cached copy so the next read sees the new name
+        self.invalidate_amenity(amenity_id)
+
+        return amenity
 
     def delete_amenity(self, amenity_id):
         """
@@ -465,8 +909,27 @@ class HBnBFacade:
         # Perform deletion through repository
         self.amenity_repo.delete(amenity_id)
 
+        # Drop the cached copy of the deleted amenity
+        self.invalidate_amenity(amenity_id)
+
         return True
 
+    def invalidate_amenity(self, amenity_id):
+        """
+        Drop an amenity from the read cache used by get_amenity().
+
+        Called by update_amenity() and delete_amenity(); any other code path
+        that changes an amenity outside the facade must call it as well.
+
+        Args:
+            amenity_id (str): UUID of the amenity to forget
+        """
+        # Forget the entry; a missing key is not an error
+        self._amenity_cache.pop(amenity_id, None)
+
+        # Place listings embed amenity names
+        self._touch_places()
+
     # ==================== PLACE MANAGEMENT OPERATIONS ====================
 
     def create_place(self, place_data, current_user):
@@ -553,32 +1016,43 @@ class HBnBFacade:
             max_person=place_data['max_person']
         )
 
-        # Initialize amenities list and process amenity associations
-        place.amenities = []
-        if 'amenities' in place_data:
-            amenities = []
-            for amenity in place_data["amenities"]:
-                # Handle both string IDs and object format for flexibility
-                if isinstance(amenity, dict):
-                    amenity_id = amenity["id"]
-                else:
-                    amenity_id = amenity
-
-                try:
-                    # Retrieve amenity instance and add to collection
-                    new_amenity = self.amenity_repo.get(amenity_id)
-                    if new_amenity:
-                        amenities.append(new_amenity)
-                except:
-                    # Skip invalid amenity IDs silently to allow partial success
-                    continue
-            place.amenities = amenities
-
-        # Persist place to database through repository
-        self.place_repo.add(place)
+        # Accept amenities as plain IDs or {'id': ...} objects for flexibility
+        amenity_ids = [amenity["id"] if isinstance(amenity, dict) else amenity
+                       for amenity in place_data.get("amenities", ())]
+
+        # Persist the place and link its amenities in one transaction;
+        # unknown amenity IDs are skipped silently to allow partial success
+        self.place_repo.add_with_amenities(place, amenity_ids)
+
+        # Cached place listings no longer match the database
+        self._touch_places()
 
         return place
 
+    def get_places_version(self):
+        """
+        Return the current version of the data shown by place listings.
+
+        The value changes after every write made through this facade to a
+        place, a user or an amenity, so callers can key cached listing bodies
+        by it. It is process-local: writes handled by other worker processes
+        are not seen, so such caches must also expire on their own.
+
+        Returns:
+            int: Opaque version number; only compare it for equality
+
+        Example:
+            cached = listing_cache.get(facade.get_places_version())
+        """
+        return self._places_version
+
+    def _touch_places(self):
+        """
+        Give place listings a new version after a write that changes what they show.
+        """
+        # Every value is new, so a cached listing can never match again
+        self._places_version = next(self._places_versions)
+
     def get_place(self, place_id):
         """
         Retrieve a place by its unique identifier.
@@ -599,15 +1073,63 @@ class HBnBFacade:
             place = facade.get_place("12345-67890-abcdef")
             print(f"Place: {place.title} by {place.owner.first_name}")
         """
-        # Retrieve place from repository by primary key
-        place = self.place_repo.get(place_id)
+        # Serve recently loaded places from the short-lived cache
+        place = self._from_cache(self._place_cache, place_id)
+        if place is not None:
+            return place
+
+        # Retrieve place with owner and amenities eagerly loaded (no lazy SELECTs later)
+        place = self.place_repo.get_place_by_id(place_id)
 
         # Validate place exists and raise descriptive error if not found
         if not place:
             raise ValueError("Error ID: The requested ID does not exist.")
 
+        # Remember the loaded place for subsequent reads
+        self._place_cache.set(place_id, place)
+
         return place
 
+    def get_place_meta(self, place_id):
+        """
+        Retrieve the last modification time of a place without loading it.
+
+        Used by conditional GETs to answer 304 Not Modified from a single
+        column read.
+
+        Args:
+            place_id (str): UUID of the place
+
+        Returns:
+            datetime or None: The place's updated_at, None if no place has this ID
+
+        Example:
+            updated_at = facade.get_place_meta(place_id)
+        """
+        # Single-column lookup through the place repository
+        return self.place_repo.get_updated_at(place_id)
+
+    def get_place_owner_id(self, place_id):
+        """
+        Return the owner ID of a place without loading the place itself.
+
+        Used by authorization checks that only need to compare the owner with
+        the current user, so rejected requests never load the place, its owner,
+        or its amenities.
+
+        Args:
+            place_id (str): UUID of the place
+
+        Returns:
+            str or None: Owner's user ID, or None if the place does not exist
+
+        Example:
+            if facade.get_place_owner_id(place_id) != current_user_id:
+                return {'error': 'Unauthorized action'}, 403
+        """
+        # Single-column lookup through the place repository
+        return self.place_repo.get_owner_id(place_id)
+
     def get_all_places(self):
         """
         Return all places in the repository.
@@ -616,7 +1138,7 @@ class HBnBFacade:
         This method loads all places into memory, so consider pagination for large datasets.
 
         Returns:
-            list[Place]: All place instances with relationships
+            list[Place]: All place instances with owner and amenities already loaded
 
         Performance Note:
             Consider implementing pagination in the API layer for large datasets.
@@ -626,8 +1148,26 @@ class HBnBFacade:
             for place in all_places:
                 print(f"{place.title}: ${place.price}/night")
         """
-        # Return all places from repository
-        return self.place_repo.get_all()
+        # Load all places with owners and amenities up front (two queries in total)
+        return self.place_repo.get_all_with_relations()
+
+    def get_all_places_rows(self):
+        """
+        Return the listing data of all places as plain rows, without ORM instances.
+
+        For read-only listings that only serialize columns: two queries return
+        lightweight Row tuples, skipping the per-object hydration and identity
+        map bookkeeping of get_all_places().
+
+        Returns:
+            tuple: (place_rows, amenity_links) as returned by
+                   PlaceRepository.get_listing_rows() and get_amenity_links()
+
+        Example:
+            place_rows, amenity_links = facade.get_all_places_rows()
+        """
+        # One query for places with owners, one for every amenity link
+        return self.place_repo.get_listing_rows(), self.place_repo.get_amenity_links()
 
     def update_place(self, place_id, place_data):
         """
@@ -641,7 +1181,7 @@ class HBnBFacade:
             place_data (dict): Partial or complete update data with same constraints as create
 
         Returns:
-            Place: The updated place instance
+            Place: The updated place instance, reloaded with owner and amenities
 
         Raises:
             ValueError: If place not found or validation fails
@@ -663,6 +1203,66 @@ class HBnBFacade:
         if not place:
             raise ValueError("Error ID: The requested ID does not exist.")
 
+        # Apply the update to the loaded instance
+        return self.update_place_obj(place, place_data)
+
+    def get_place_if_owner(self, place_id, user_id, is_admin):
+        """
+        Load a place for modification, checking that the caller may change it.
+
+        One primary key lookup both checks existence and provides the instance
+        to pass to update_place_obj(), so an update costs a single read of the
+        place instead of an owner lookup followed by a second load.
+
+        Args:
+            place_id (str): UUID of the place
+            user_id (str): ID of the user requesting the change
+            is_admin (bool): Whether the caller may change any place
+
+        Returns:
+            Place: The place instance, attached to the current session
+
+        Raises:
+            NotFoundError: If place not found
+            PermissionError: If the caller is neither admin nor the owner
+
+        Example:
+            place = facade.get_place_if_owner(place_id, user_id, is_admin)
+            updated_place = facade.update_place_obj(place, {"price": 150.00})
+        """
+        # Single primary key lookup (no relationship loads)
+        place = self.place_repo.get(place_id)
+        if place is None:
+            raise NotFoundError("Place not found")
+
+        # Compare the owner FK column; admins may change any place
+        if not is_admin and place.owner_id != user_id:
+            raise PermissionError("Unauthorized action")
+
+        return place
+
+    def update_place_obj(self, place, place_data):
+        """
+        Update an already-loaded Place with validation and relationship management.
+
+        Same rules as update_place(), for callers that already hold the instance
+        (for example after an authorization check), so the place is not queried
+        a second time before the update.
+
+        Args:
+            place (Place): Place instance attached to the current session
+            place_data (dict): Partial or complete update data with same constraints as create
+
+        Returns:
+            Place: The updated place instance, reloaded with owner and amenities
+
+        Raises:
+            ValueError: If validation fails
+
+        Example:
+            place = facade.get_place("12345")
+            updated_place = facade.update_place_obj(place, {"price": 150.00})
+        """
         # Validate updated fields using same rules as creation
         if 'price' in place_data and place_data['price'] < 0:
             raise ValueError("Price must be a non-negative number.")
@@ -673,10 +1273,12 @@ class HBnBFacade:
         if 'longitude' in place_data and not (-180 <= place_data['longitude'] <= 180):
             raise ValueError("Longitude must be between -180 and 180 degrees.")
 
-        # Apply scalar attribute updates
-        for key in ['title', 'description', 'price', 'latitude', 'longitude', 'max_person']:
-            if key in place_data:
-                setattr(place, key, place_data[key])
+        # Collect scalar attribute updates
+        changes = {
+            key: place_data[key]
+            for key in ['title', 'description', 'price', 'latitude', 'longitude', 'max_person']
+            if key in place_data
+        }
 
         # Handle amenity relationship updates
         if 'amenities' in place_data:
@@ -686,12 +1288,18 @@ class HBnBFacade:
                 new_amenity = self.amenity_repo.get(amenity_id)
                 if new_amenity:
                     amenities.append(new_amenity)
-            place.amenities = amenities
+            changes['amenities'] = amenities
 
-        # Persist changes through repository
-        self.place_repo.update(place_id, place)
+        # Persist changes through repository without re-querying the place
+        self.place_repo.update_obj(place, changes)
 
-        return place
+        # Drop the cached copy so readers see the new state
+        self._place_cache.pop(place.id, None)
+        self._touch_places()
+
+        # Reload the committed place with owner and amenities in one round of SELECTs
+        # so serializing the response does not lazy-load each relationship separately
+        return self.place_repo.get_place_by_id(place.id)
 
     def delete_place(self, place_id):
         """
@@ -720,6 +1328,51 @@ class HBnBFacade:
         # Perform deletion through repository
         self.place_repo.delete(place_id)
 
+        # Drop the cached copy of the deleted place
+        self._place_cache.pop(place_id, None)
+        self._touch_places()
+
+        return True
+
+    def delete_place_if_owner(self, place_id, user_id, is_admin):
+        """
+        Delete a place if the caller is an admin or its owner, in one conditional DELETE.
+
+        The ownership check is folded into the DELETE statement, so authorized
+        deletions take a single round trip and cannot race with a concurrent
+        delete. Only when nothing was deleted is a cheap owner_id lookup used to
+        tell a missing place apart from a foreign one.
+
+        Args:
+            place_id (str): UUID of the place to delete
+            user_id (str): ID of the user requesting the deletion
+            is_admin (bool): Whether the caller may delete any place
+
+        Returns:
+            bool: True if deletion succeeded
+
+        Raises:
+            ValueError: If place not found
+            PermissionError: If the caller is neither admin nor the owner
+
+        Example:
+            facade.delete_place_if_owner(place_id, current_user_id, is_admin=False)
+        """
+        # Delete in one statement, restricted to the caller's places for non-admins
+        deleted = self.place_repo.delete_if_owner(
+            place_id, owner_id=None if is_admin else user_id)
+
+        # Nothing deleted: distinguish a missing place from a foreign one
+        if not deleted:
+            if self.place_repo.get_owner_id(place_id) is None:
+                raise ValueError("Place not found")
+            raise PermissionError("Unauthorized action")
+
+        # Drop cached copies of the place and of any of its (now deleted) reviews
+        self._place_cache.pop(place_id, None)
+        self._review_cache.clear()
+        self._touch_places()
+
         return True
 
     # ==================== REVIEW MANAGEMENT OPERATIONS ====================
@@ -771,15 +1424,16 @@ class HBnBFacade:
         if not place:
             raise ValueError("Place does not exist.")
 
-        # Enforce business rule: users cannot review their own places
-        if place.owner.id == user_id:
+        # Enforce business rule: users cannot review their own places (FK column, no owner load)
+        if place.owner_id == user_id:
             raise ValueError("You cannot review your own place")
 
         # Enforce business rule: one review per user per place
         existing_reviews = self.review_repo.get_by_attribute(
             'place_id', review_data['place_id'])
         for existing_review in existing_reviews:
-            if existing_review.user.id == user_id:
+            # Compare the author FK column instead of lazy-loading each author
+            if existing_review.user_id == user_id:
                 raise ValueError("You have already reviewed this place")
 
         # Create Review instance with validated relationships
@@ -818,6 +1472,11 @@ class HBnBFacade:
             review = facade.get_review("12345-67890-abcdef")
             print(f"Review by {review.user.first_name}: {review.text}")
         """
+        # Serve recently loaded reviews from the short-lived cache
+        review = self._from_cache(self._review_cache, review_id)
+        if review is not None:
+            return review
+
         # Retrieve review from repository by primary key
         review = self.review_repo.get(review_id)
 
@@ -825,8 +1484,46 @@ class HBnBFacade:
         if not review:
             raise ValueError("Error ID: The requested ID does not exist.")
 
+        # Remember the loaded review for subsequent reads
+        self._review_cache.set(review_id, review)
+
         return review
 
+    def get_review_meta(self, review_id):
+        """
+        Retrieve the last modification time of a review without loading it.
+
+        Used by conditional GETs to answer 304 Not Modified from a single
+        column read.
+
+        Args:
+            review_id (str): UUID of the review
+
+        Returns:
+            datetime or None: The review's updated_at, None if no review has this ID
+
+        Example:
+            updated_at = facade.get_review_meta(review_id)
+        """
+        # Single-column lookup through the review repository
+        return self.review_repo.get_updated_at(review_id)
+
+    def get_reviews_version(self):
+        """
+        Identify the current version of the review listing without loading it.
+
+        Used by the listing's conditional GET to answer 304 Not Modified from
+        a single aggregate query.
+
+        Returns:
+            tuple: (newest updated_at or None, number of reviews)
+
+        Example:
+            updated_at, count = facade.get_reviews_version()
+        """
+        # Aggregate query through the review repository
+        return self.review_repo.get_listing_version()
+
     def get_all_reviews(self):
         """
         Get all reviews stored in the repository.
@@ -835,14 +1532,30 @@ class HBnBFacade:
         Use with caution for large datasets due to memory implications.
 
         Returns:
-            list[Review]: All review instances with relationships
+            list[Review]: All review instances with author and place already loaded
 
         Example:
             all_reviews = facade.get_all_reviews()
             avg_rating = sum(r.rating for r in all_reviews) / len(all_reviews)
         """
-        # Return all reviews from repository
-        return self.review_repo.get_all()
+        # Load all reviews with their authors and places in one joined query
+        return self.review_repo.get_all_with_relations()
+
+    def list_reviews_projected(self):
+        """
+        Return the exposed columns of all reviews as plain rows, without ORM instances.
+
+        For read-only listings: one query returning lightweight Row tuples of
+        (id, text, rating, user_id, place_id).
+
+        Returns:
+            list[Row]: One row per review
+
+        Example:
+            rows = facade.list_reviews_projected()
+        """
+        # Single projected query through the review repository
+        return self.review_repo.get_all_projected()
 
     def get_reviews_by_place(self, place_id):
         """
@@ -902,12 +1615,95 @@ class HBnBFacade:
         if not review:
             raise ValueError("Error ID: The requested ID does not exist.")
 
+        # Apply the update to the loaded instance
+        return self.update_review_obj(review, review_data)
+
+    def update_review_obj(self, review, review_data):
+        """
+        Update an already-loaded review with validation.
+
+        Same rules as update_review(), for callers that already hold the
+        instance, so the review is not queried a second time before the update.
+
+        Args:
+            review (Review): Review instance attached to the current session
+            review_data (dict): Updated review data (text and/or rating)
+
+        Returns:
+            Review: The updated review instance
+
+        Raises:
+            ValueError: If validation fails
+
+        Example:
+            review = facade.get_review("12345")
+            updated_review = facade.update_review_obj(review, {"rating": 4})
+        """
         # Validate rating if being updated
         if 'rating' in review_data and not (1 <= review_data['rating'] <= 5):
             raise ValueError("Rating must be between 1 and 5.")
 
-        # Apply updates through repository layer
-        return self.review_repo.update(review_id, review_data)
+        # Apply updates through repository layer without re-querying the review
+        self.review_repo.update_obj(review, review_data)
+
+        # Drop the cached copy so readers see the new state
+        self._review_cache.pop(review.id, None)
+
+        return review
+
+    # Review columns an update request may change
+    REVIEW_UPDATE_FIELDS = ('text', 'rating')
+
+    def update_review_if_author(self, review_id, review_data, user_id, is_admin):
+        """
+        Update a review if the caller is an admin or its author, in one conditional UPDATE.
+
+        The authorship check is part of the UPDATE's WHERE clause, so the review
+        and its author are not loaded beforehand. Only when no row is updated is
+        the author ID read to tell a missing review apart from a foreign one.
+
+        Args:
+            review_id (str): UUID of the review to update
+            review_data (dict): Updated review data; keys other than text and rating are ignored
+            user_id (str): ID of the user requesting the update
+            is_admin (bool): Whether the caller may update any review
+
+        Returns:
+            Review: The updated review instance
+
+        Raises:
+            ValueError: If the rating is outside 1-5
+            NotFoundError: If review not found
+            PermissionError: If the caller is neither admin nor the author
+
+        Example:
+            review = facade.update_review_if_author(review_id, {"rating": 4}, user_id, False)
+        """
+        # Keep only updatable columns
+        values = {key: value for key, value in review_data.items()
+                  if key in self.REVIEW_UPDATE_FIELDS}
+
+        # Validate rating if being updated
+        if 'rating' in values and not (1 <= values['rating'] <= 5):
+            raise ValueError("Rating must be between 1 and 5.")
+
+        # Update in one statement, restricted to the caller's reviews for non-admins
+        author = None if is_admin else user_id
+        updated = self.review_repo.update_if_author(review_id, values, user_id=author) if values else 0
+
+        # Nothing updated (or nothing to update): check existence and authorship
+        if not updated:
+            author_id = self.review_repo.get_author_id(review_id)
+            if author_id is None:
+                raise NotFoundError("Review not found")
+            if author is not None and author_id != author:
+                raise PermissionError("Unauthorized action")
+
+        # Drop the cached copy so readers see the new state
+        self._review_cache.pop(review_id, None)
+
+        # Read the review back for the response
+        return self.review_repo.get(review_id)
 
     def delete_review(self, review_id):
         """
@@ -936,4 +1732,41 @@ class HBnBFacade:
         # Perform deletion through repository
         self.review_repo.delete(review_id)
 
+        # Drop the cached copy of the deleted review
+        self._review_cache.pop(review_id, None)
+
+        return True
+
+    def delete_review_if_author(self, review_id, user_id, is_admin):
+        """
+        Delete a review if the caller is an admin or its author, in one conditional DELETE.
+
+        Args:
+            review_id (str): UUID of the review to delete
+            user_id (str): ID of the user requesting the deletion
+            is_admin (bool): Whether the caller may delete any review
+
+        Returns:
+            bool: True if deletion succeeded
+
+        Raises:
+            ValueError: If review not found
+            PermissionError: If the caller is neither admin nor the author
+
+        Example:
+            facade.delete_review_if_author(review_id, current_user_id, is_admin=False)
+        """
+        # Delete in one statement, restricted to the caller's reviews for non-admins
+        deleted = self.review_repo.delete_if_author(
+            review_id, user_id=None if is_admin else user_id)
+
+        # Nothing deleted: distinguish a missing review from a foreign one
+        if not deleted:
+            if self.review_repo.get(review_id) is None:
+                raise ValueError("Review not found")
+            raise PermissionError("Unauthorized action")
+
+        # Drop the cached copy of the deleted review
+        self._review_cache.pop(review_id, None)
+
         return True
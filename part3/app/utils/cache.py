@@ -0,0 +1,119 @@
+# Import standard library modules for thread-safe expiring storage
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Small thread-safe, process-local cache with per-entry expiry.
+
+    Entries are stored alongside an absolute expiry timestamp and are dropped
+    lazily when they are read after that deadline. When the cache is full, the
+    least recently inserted entry is evicted first, which keeps memory bounded
+    without a background cleanup thread.
+
+    This intentionally covers only what the application needs so no third-party
+    caching dependency is required.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept in memory
+        ttl (float): Default lifetime of an entry, in seconds
+
+    Example:
+        cache = TTLCache(maxsize=1000, ttl=30)
+        cache.set('key', 'value')
+        cache.get('key')  # 'value' for the next 30 seconds, then None
+    """
+
+    def __init__(self, maxsize=1024, ttl=30):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of entries kept in memory
+            ttl (float): Default lifetime of an entry, in seconds
+        """
+        # Store configuration for size bound and default lifetime
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        # Map of key -> (value, expires_at), ordered by insertion for eviction
+        self._data = OrderedDict()
+
+        # Re-entrant lock guarding every access to the underlying mapping
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for key, or default if missing or expired.
+
+        Args:
+            key: Hashable cache key
+            default: Value returned when the key is absent or expired
+
+        Returns:
+            The cached value or default
+        """
+        with self._lock:
+            # Look up the entry without raising on absence
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            # Drop the entry lazily once its deadline has passed
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._data[key]
+                return default
+
+            return value
+
+    def set(self, key, value, expires_at=None):
+        """
+        Store value under key.
+
+        Args:
+            key: Hashable cache key
+            value: Value to store
+            expires_at (float, optional): Absolute expiry as a UNIX timestamp;
+                                          capped at now + ttl when provided
+        """
+        # Compute the effective deadline, never exceeding the default lifetime
+        deadline = time.time() + self.ttl
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+
+        with self._lock:
+            # Re-insert so the entry moves to the end of the eviction order
+            self._data.pop(key, None)
+            self._data[key] = (value, deadline)
+
+            # Evict the oldest entries while above capacity
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """
+        Remove key from the cache and return its value, or default.
+
+        Args:
+            key: Hashable cache key
+            default: Value returned when the key is absent
+
+        Returns:
+            The removed value (even if expired) or default
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[0]
+
+    def clear(self):
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        """Return the number of stored entries, including not-yet-purged expired ones."""
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,220 @@
+# Import standard library modules for token hashing and decorator wrapping
+import hashlib
+from functools import wraps
+
+# Import Flask request context helpers
+from flask import Response, current_app, g, request
+
+# Import Flask-JWT-Extended helpers so errors stay identical to @jwt_required()
+from flask_jwt_extended import decode_token
+from flask_jwt_extended.exceptions import (
+    InvalidHeaderError,
+    NoAuthorizationError,
+    WrongTokenError,
+)
+
+# Import the process-local expiring cache
+from app.utils.cache import TTLCache
+
+# Verified access tokens, keyed by the SHA-256 digest of the raw token, mapped to
+# (identity, claims, is_admin). Entries live at most 30 seconds and never outlive
+# the token's own `exp` claim.
+_verified_tokens = TTLCache(maxsize=10000, ttl=30)
+
+# Body of the 403 returned to authenticated non-admin callers (by admin_required
+# and admin_gate), encoded once
+_ADMIN_REQUIRED_BODY = b'{"error":"Admin privileges required"}\n'
+
+
+def _bearer_token():
+    """
+    Extract the raw JWT from the Authorization header.
+
+    Honors the JWT_HEADER_NAME and JWT_HEADER_TYPE settings used by
+    Flask-JWT-Extended so that the same clients keep working.
+
+    Returns:
+        str: The encoded token
+
+    Raises:
+        NoAuthorizationError: If the header is missing
+        InvalidHeaderError: If the header does not match "<type> <token>"
+    """
+    # Read header configuration with Flask-JWT-Extended defaults
+    header_name = current_app.config.get('JWT_HEADER_NAME', 'Authorization')
+    header_type = current_app.config.get('JWT_HEADER_TYPE', 'Bearer')
+
+    # Reject requests that carry no authorization header at all
+    auth_header = request.headers.get(header_name, '').strip()
+    if not auth_header:
+        raise NoAuthorizationError(f'Missing {header_name} Header')
+
+    # Split "Bearer <token>" and validate its shape
+    parts = auth_header.split()
+    if not header_type:
+        if len(parts) != 1:
+            raise InvalidHeaderError(
+                f"Bad {header_name} header. Expected '{header_name}: <JWT>'")
+        return parts[0]
+
+    if len(parts) != 2 or parts[0] != header_type:
+        raise InvalidHeaderError(
+            f"Bad {header_name} header. Expected '{header_name}: {header_type} <JWT>'")
+    return parts[1]
+
+
+def verify_cached_jwt():
+    """
+    Verify the request's access token, reusing recent successful verifications.
+
+    On a cache miss the token is fully decoded (signature, expiry, claims) by
+    Flask-JWT-Extended and, if valid, stored until min(exp, now + 30s).
+    Failed verifications are never cached: the exception propagates so the
+    usual JWT error handlers produce the 401/422 response.
+
+    The admin flag is resolved from the claims once per verification and
+    cached with them, so authorization checks read a ready boolean instead of
+    looking the claim up again on every request.
+
+    Side Effects:
+        Sets flask.g.jwt_identity, flask.g.jwt_claims and flask.g.jwt_is_admin
+        for the current request
+
+    Returns:
+        tuple: (identity, claims, is_admin) of the verified token
+    """
+    # Hash the raw token so cache keys never hold usable credentials
+    token = _bearer_token()
+    key = hashlib.sha256(token.encode()).hexdigest()
+
+    # Serve recently verified tokens straight from the cache
+    cached = _verified_tokens.get(key)
+    if cached is None:
+        # Full verification on miss; raises on invalid or expired tokens
+        claims = decode_token(token)
+
+        # Refuse refresh tokens on endpoints that expect access tokens
+        if claims.get('type') != 'access':
+            raise WrongTokenError('Only non-refresh tokens are allowed')
+
+        # Remember the result, bounded by the token's own expiry
+        identity_claim = current_app.config.get('JWT_IDENTITY_CLAIM', 'sub')
+        cached = (claims.get(identity_claim), claims, bool(claims.get('is_admin', False)))
+        _verified_tokens.set(key, cached, expires_at=claims.get('exp'))
+
+    # Expose identity and claims to the handler for this request only
+    g.jwt_identity, g.jwt_claims, g.jwt_is_admin = cached
+    return cached
+
+
+def cached_jwt_required(fn):
+    """
+    Decorator equivalent to @jwt_required() backed by a short-lived verification cache.
+
+    Handlers decorated with it read the caller from flask.g.jwt_identity and
+    flask.g.jwt_claims instead of get_jwt_identity()/get_jwt().
+
+    Args:
+        fn (callable): The view function or Resource method to protect
+
+    Returns:
+        callable: The wrapped function
+
+    Example:
+        @cached_jwt_required
+        def get(self, place_id):
+            user_id, is_admin = current_principal()
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        # Verify the token (or reuse a cached verification) before the handler runs
+        verify_cached_jwt()
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def admin_required(fn):
+    """
+    Decorator restricting a handler to admins, on top of the cached JWT verification.
+
+    Verifies the token like @cached_jwt_required and answers 403 before the
+    handler runs when the is_admin claim is not set, so handlers no longer
+    repeat the claims check in their bodies.
+
+    Args:
+        fn (callable): The view function or Resource method to protect
+
+    Returns:
+        callable: The wrapped function
+
+    Example:
+        @admin_required
+        def delete(self, user_id):
+            ...
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        # Verify the token (or reuse a cached verification), then check the admin flag
+        _, _, is_admin = verify_cached_jwt()
+        if not is_admin:
+            # Pre-encoded body: no dict built or serialized per rejected call
+            return Response(_ADMIN_REQUIRED_BODY, status=403, mimetype='application/json')
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def current_principal():
+    """
+    Return the caller of the current request as (user_id, is_admin).
+
+    Reads the identity and admin flag stored on flask.g by @cached_jwt_required,
+    so the token is never decoded again and the claims are not consulted.
+
+    Returns:
+        tuple: (user_id, is_admin) where user_id is the token subject (str)
+               and is_admin is the boolean admin claim (False when absent)
+
+    Example:
+        user_id, is_admin = current_principal()
+        if not is_admin and place_owner_id != user_id:
+            return {'error': 'Unauthorized action'}, 403
+    """
+    return g.jwt_identity, g.jwt_is_admin
+
+
+def admin_gate(prefixes):
+    """
+    Build a before_request hook that rejects non-admin callers of admin-only URLs.
+
+    The hook runs before Flask-RESTX dispatches the request, so rejected calls
+    never reach the resource (no payload parsing, no handler frame). Requests
+    whose path does not start with one of the prefixes pass through untouched.
+    Missing or invalid tokens raise the usual JWT errors (401/422); valid
+    non-admin tokens get a pre-encoded 403.
+
+    Args:
+        prefixes (Iterable[str]): URL path prefixes reserved to admins
+
+    Returns:
+        callable: The hook to register with app.before_request()
+
+    Example:
+        app.before_request(admin_gate(('/api/v1/admin/users',)))
+    """
+    # str.startswith accepts a tuple and checks every prefix in C
+    prefixes = tuple(prefixes)
+
+    def gate():
+        # Only guard admin-only URLs; CORS preflights carry no token
+        if not request.path.startswith(prefixes) or request.method == 'OPTIONS':
+            return None
+
+        # Verify the token (or reuse a cached verification) and check the admin flag
+        _, _, is_admin = verify_cached_jwt()
+        if not is_admin:
+            return Response(_ADMIN_REQUIRED_BODY, status=403, mimetype='application/json')
+        return None
+
+    return gate
@@ -0,0 +1,97 @@
+# Import Flask's application proxy to reach the per-app key cache
+from flask import current_app
+
+# Algorithms whose keys are PEM documents that PyJWT would parse on every call
+_ASYMMETRIC_PREFIXES = ('RS', 'ES', 'PS', 'EdDSA')
+
+
+def _load_pem_keys(private_pem, public_pem):
+    """
+    Parse PEM-encoded signing and verification keys into key objects.
+
+    PyJWT accepts cryptography key objects directly and only parses PEM text
+    when it receives a string, so parsed objects skip that work per token.
+
+    Args:
+        private_pem (str): PEM private key, or None when this app only verifies
+        public_pem (str): PEM public key, or None to derive it from the private key
+
+    Returns:
+        tuple: (private_key or None, public_key or None)
+    """
+    # Imported lazily: only asymmetric setups need cryptography
+    from cryptography.hazmat.primitives.serialization import (
+        load_pem_private_key,
+        load_pem_public_key,
+    )
+
+    private_key = load_pem_private_key(private_pem.encode(), password=None) if private_pem else None
+    if public_pem:
+        public_key = load_pem_public_key(public_pem.encode())
+    else:
+        public_key = private_key.public_key() if private_key else None
+    return private_key, public_key
+
+
+def install_jwt_key_cache(app, jwt):
+    """
+    Resolve the JWT signing and verification keys once, at application startup.
+
+    By default Flask-JWT-Extended reads the key from the configuration for
+    every token and hands PyJWT a string; with EdDSA/RSA/ECDSA keys PyJWT then
+    parses the PEM document on every encode and decode. The keys are parsed
+    here once, stored in app.extensions['jwt_key_cache'], and served to
+    Flask-JWT-Extended through its key loader callbacks.
+
+    Args:
+        app (flask.Flask): The application being configured
+        jwt (flask_jwt_extended.JWTManager): The JWT extension instance
+
+    Example:
+        jwt.init_app(app)
+        install_jwt_key_cache(app, jwt)
+    """
+    algorithm = app.config.get('JWT_ALGORITHM', 'HS256')
+
+    if algorithm.startswith(_ASYMMETRIC_PREFIXES):
+        # Asymmetric keys: parse the PEM documents now
+        encode_key, decode_key = _load_pem_keys(
+            app.config.get('JWT_PRIVATE_KEY'), app.config.get('JWT_PUBLIC_KEY'))
+    else:
+        # Shared secret: one bytes object for both directions
+        secret = app.config.get('JWT_SECRET_KEY') or app.config.get('SECRET_KEY')
+        encode_key = decode_key = secret.encode() if isinstance(secret, str) else secret
+
+    # Keys are stored per app, so several apps can share the JWTManager instance
+    app.extensions['jwt_key_cache'] = (encode_key, decode_key)
+
+    # Serve the cached keys to Flask-JWT-Extended (one dict lookup per token)
+    jwt.encode_key_loader(_cached_encode_key)
+    jwt.decode_key_loader(_cached_decode_key)
+
+
+def _cached_encode_key(identity):
+    """
+    Flask-JWT-Extended encode_key_loader returning the pre-parsed signing key.
+
+    Args:
+        identity (object): Identity of the token being created (unused)
+
+    Returns:
+        object: Signing key for the current app
+    """
+    return current_app.extensions['jwt_key_cache'][0]
+
+
+def _cached_decode_key(jwt_header, jwt_data):
+    """
+    Flask-JWT-Extended decode_key_loader returning the pre-parsed verification key.
+
+    Args:
+        jwt_header (dict): Unverified token header (unused)
+        jwt_data (dict): Unverified token payload (unused)
+
+    Returns:
+        object: Verification key for the current app
+    """
+    return current_app.extensions['jwt_key_cache'][1]
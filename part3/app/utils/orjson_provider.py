@@ -0,0 +1,113 @@
+# Import standard library types that orjson does not serialize natively
+import decimal
+
+# Import the C-accelerated JSON library used for parsing and serialization
+import orjson
+
+# Import Flask response helpers and the JSON provider interface
+from flask import make_response
+from flask.json.provider import JSONProvider
+
+# Serialization options shared by the Flask provider and the RESTx representation:
+# allow non-string dict keys (e.g. integer IDs), as the stdlib json module does.
+# OPT_INDENT_2 and OPT_SORT_KEYS are deliberately left out: output stays compact
+# and in insertion order in every environment, including debug mode (this provider
+# and output_json replace the Flask/RESTx paths that pretty-print when debugging).
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    """
+    Serialize objects orjson does not support natively.
+
+    orjson already handles datetime, date, UUID and dataclass instances; this
+    covers the remaining types Flask's default provider accepts.
+
+    Args:
+        obj (object): The value orjson could not serialize
+
+    Returns:
+        str: A JSON-compatible representation of the value
+
+    Raises:
+        TypeError: If the value has no JSON representation
+    """
+    # Decimals are emitted as strings to avoid losing precision
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+
+    # Markup-like objects expose their string form through __html__
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Installing it with `app.json = OrjsonProvider(app)` makes request.get_json()
+    (and therefore flask_restx's api.payload) and jsonify() use orjson's C
+    implementation instead of the stdlib json module.
+
+    Example:
+        app = Flask(__name__)
+        app.json = OrjsonProvider(app)
+    """
+
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize data as a JSON string.
+
+        Args:
+            obj (object): The data to serialize
+            **kwargs: Ignored; accepted for compatibility with the stdlib signature
+
+        Returns:
+            str: The JSON document
+        """
+        return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        """
+        Deserialize a JSON document.
+
+        Args:
+            s (str | bytes): The JSON text or raw request body
+            **kwargs: Ignored; accepted for compatibility with the stdlib signature
+
+        Returns:
+            object: The decoded data
+
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+        return orjson.loads(s)
+
+
+def output_json(data, code, headers=None):
+    """
+    Flask-RESTX representation that renders resource results with orjson.
+
+    Replaces flask_restx's default 'application/json' representation, which
+    serializes with the stdlib json module regardless of the app's JSON provider.
+
+    Args:
+        data (object): The data returned by the resource (after marshalling)
+        code (int): The HTTP status code
+        headers (dict, optional): Extra response headers
+
+    Returns:
+        flask.Response: The JSON response
+
+    Example:
+        api.representations['application/json'] = output_json
+    """
+    # Serialize straight to bytes, keeping the trailing newline RESTx emits
+    body = orjson.dumps(data, default=_default,
+                        option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+    response = make_response(body, code)
+    response.headers.extend(headers or {})
+    response.mimetype = 'application/json'
+    return response
@@ -0,0 +1,52 @@
+# Import standard library helper for decorator wrapping
+from functools import wraps
+
+# Import Flask's per-request storage
+from flask import g, has_app_context
+
+
+def request_memoize(fn):
+    """
+    Decorator caching a function's results for the duration of one request.
+
+    Results are stored on flask.g, which Flask discards when the request's
+    application context ends, so no teardown hook or expiry is needed. Calls
+    made outside an application context are not cached. Arguments must be
+    hashable.
+
+    Args:
+        fn (callable): The function (or method) whose results to memoize
+
+    Returns:
+        callable: The wrapped function
+
+    Example:
+        @request_memoize
+        def get_user_by_email(self, email):
+            ...
+    """
+    @wraps(fn)
+    def wrapper(*args):
+        # No request or app context: nothing to attach the memo to
+        if not has_app_context():
+            return fn(*args)
+
+        # One memo dict per request, keyed by function and arguments
+        memo = g.setdefault('_request_memo', {})
+        key = (fn.__qualname__, args)
+        if key not in memo:
+            memo[key] = fn(*args)
+        return memo[key]
+
+    return wrapper
+
+
+def clear_request_memo():
+    """
+    Forget every memoized result of the current request.
+
+    Call after writes that may change the answer of a memoized lookup.
+    """
+    # Only meaningful inside an application context
+    if has_app_context():
+        g.pop('_request_memo', None)
@@ -0,0 +1,73 @@
+class PayloadSchema:
+    """
+    Minimal request payload validator built once at import time.
+
+    Flask-RESTX's `@api.expect(model, validate=True)` converts the model to a
+    JSON schema and runs the jsonschema validator on every request. For the flat
+    payloads this API accepts, a dictionary of expected Python types is enough:
+    validation becomes one dict lookup and one isinstance() check per field.
+
+    Unknown keys are dropped, so the returned dict only ever contains fields the
+    handler declared and can be passed to the facade as-is.
+
+    Attributes:
+        fields (dict): Field name mapped to its expected type (or tuple of types)
+        required (frozenset): Names of the fields that must be present
+
+    Example:
+        user_schema = PayloadSchema({'email': str, 'is_admin': bool}, required=('email',))
+        data = user_schema.validate(request.get_json())
+    """
+
+    __slots__ = ('fields', 'required')
+
+    def __init__(self, fields, required=()):
+        """
+        Compile a schema from field types.
+
+        Args:
+            fields (dict): Field name mapped to the expected type; use
+                           numbers.Real for numbers (int or float, but not bool)
+            required (Iterable[str]): Names of mandatory fields
+        """
+        # Freeze the definition so every request reuses the same lookups
+        self.fields = dict(fields)
+        self.required = frozenset(required)
+
+    def validate(self, payload):
+        """
+        Validate a decoded JSON payload and keep only declared fields.
+
+        Args:
+            payload (object): The decoded request body
+
+        Returns:
+            dict: The declared fields present in the payload
+
+        Raises:
+            ValueError: If the payload is not an object, a required field is
+                        missing, or a field has the wrong type
+        """
+        # The body must be a JSON object
+        if not isinstance(payload, dict):
+            raise ValueError("Invalid input data")
+
+        # Report every missing mandatory field at once
+        missing = self.required.difference(payload)
+        if missing:
+            raise ValueError(f"Missing required field(s): {', '.join(sorted(missing))}")
+
+        # Keep declared fields after checking their type
+        data = {}
+        for name, value in payload.items():
+            expected = self.fields.get(name)
+            if expected is None:
+                continue
+
+            # bool is a subclass of int: only accept it where a bool is expected
+            if not isinstance(value, expected) or (isinstance(value, bool) and expected is not bool):
+                raise ValueError(f"Invalid value for field '{name}'")
+
+            data[name] = value
+
+        return data
@@ -6,6 +6,23 @@ Supports development mode and default fallback configuration.
 """
 
 import os
+from datetime import timedelta
+
+
+def _read_key(path):
+    """
+    Read a PEM-encoded key file, returning None when no path is configured.
+
+    Args:
+        path (str): Path to the key file, or None
+
+    Returns:
+        str: Key contents, or None
+    """
+    if not path:
+        return None
+    with open(path) as key_file:
+        return key_file.read()
 
 
 class Config:
@@ -14,12 +31,27 @@ class Config:
 
     Attributes:
         SECRET_KEY (str): Secret used for cryptographic operations.
+        JWT_ALGORITHM (str): Token signing algorithm (EdDSA when keys are set, else HS256).
+        BCRYPT_LOG_ROUNDS (int): bcrypt work factor used when hashing passwords.
         DEBUG (bool): Debug mode flag.
     """
     # Clé secrète utilisée pour les sessions et la sécurité (JWT, cookies, etc.)
     SECRET_KEY = os.getenv('SECRET_KEY', 'default_secret_key')
     # JWT utilise SECRET_KEY par défaut, mais on peut l'expliciter
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', SECRET_KEY)
+    # Clés Ed25519 (PEM) pour signer/vérifier les JWT hors ligne avec EdDSA
+    JWT_PRIVATE_KEY = _read_key(os.getenv('JWT_PRIVATE_KEY_FILE'))
+    JWT_PUBLIC_KEY = _read_key(os.getenv('JWT_PUBLIC_KEY_FILE'))
+    # EdDSA dès que des clés sont fournies, sinon HS256 avec JWT_SECRET_KEY
+    JWT_ALGORITHM = os.getenv(
+        'JWT_ALGORITHM', 'EdDSA' if JWT_PRIVATE_KEY else 'HS256')
+    # Aucune tolérance sur l'expiration lors du décodage
+    JWT_DECODE_LEEWAY = 0
+    # Durée de vie courte des jetons d'accès (vérification locale, sans révocation)
+    JWT_ACCESS_TOKEN_EXPIRES = timedelta(
+        minutes=int(os.getenv('JWT_ACCESS_TOKEN_MINUTES', '15')))
+    # Facteur de coût bcrypt (2^n itérations) : 12 par défaut, ajustable selon le matériel
+    BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', '12'))
     # Mode debug désactivé par défaut
     DEBUG = False
 
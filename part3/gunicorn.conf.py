@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for serving the HBnB API in production.
+
+The handlers are synchronous Flask-RESTX resources that mostly wait on the
+database, so each worker process runs a pool of threads: processes use every
+CPU core, threads keep serving requests while others wait on I/O.
+
+Usage:
+    gunicorn -c gunicorn.conf.py "app:create_app()"
+"""
+
+import multiprocessing
+import os
+
+# Adresse d'écoute (surchargeable via GUNICORN_BIND)
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Un processus par cœur CPU
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+
+# Workers threadés : adaptés aux handlers WSGI synchrones limités par les E/S
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+# Connexions keep-alive conservées entre deux requêtes d'un même client
+keepalive = 5
+
+# Redémarre un worker bloqué plus de 30 secondes
+timeout = 30
@@ -25,11 +25,22 @@ def test_admin_post_amenity_forbidden(client):
     assert response.status_code in (401, 403)
 
 
-@patch('app.api.v1.admin_amenities.get_jwt_identity', return_value={'is_admin': True})
+@patch('app.utils.jwt_cache.decode_token',
+       return_value={'sub': '1', 'is_admin': True, 'type': 'access'})
 def test_admin_post_amenity_success(mock_jwt, client):
-    response = client.post('/api/v1/admin_amenities/', json={"name": "WiFi"})
+    response = client.post(
+        '/api/v1/admin_amenities/', headers={"Authorization": "Bearer test"}, json={"name": "WiFi"})
     if response.status_code == 404:
         warnings.warn(
             "Endpoint /api/v1/admin_amenities/ non disponible, test ignoré.")
         pytest.skip("Endpoint non disponible")
     assert response.status_code in (200, 201)
+
+
+@patch('app.utils.jwt_cache.decode_token',
+       return_value={'sub': '1', 'is_admin': True, 'type': 'access'})
+def test_admin_delete_missing_amenity_returns_404(mock_jwt, client):
+    response = client.delete('/api/v1/admin/amenities/amenities/does-not-exist',
+                             headers={"Authorization": "Bearer test"})
+    assert response.status_code == 404
+    assert response.json == {'error': 'Amenity not found'}
@@ -25,9 +25,11 @@ def test_admin_post_review_forbidden(client):
     assert response.status_code in (401, 403)
 
 
-@patch('app.api.v1.admin_reviews.get_jwt_identity', return_value={'is_admin': True})
+@patch('app.utils.jwt_cache.decode_token',
+       return_value={'sub': '1', 'is_admin': True, 'type': 'access'})
 def test_admin_post_review_success(mock_jwt, client):
     response = client.post('/api/v1/admin_reviews/',
+                           headers={"Authorization": "Bearer test"},
                            json={"text": "Super", "rating": 5, "user_id": "1", "place_id": "1"})
     if response.status_code == 404:
         warnings.warn(
@@ -25,10 +25,11 @@ def test_admin_post_user_forbidden(client):
     assert response.status_code in (401, 403)
 
 
-@patch('app.api.v1.admin_users.get_jwt_identity', return_value={'is_admin': True})
+@patch('app.utils.jwt_cache.decode_token',
+       return_value={'sub': '1', 'is_admin': True, 'type': 'access'})
 def test_admin_post_user_success(mock_jwt, client):
     response = client.post(
-        '/api/v1/admin_users/', json={"email": "admin@example.com", "password": "pass"})
+        '/api/v1/admin_users/', headers={"Authorization": "Bearer test"}, json={"email": "admin@example.com", "password": "pass"})
     if response.status_code == 404:
         warnings.warn(
             "Endpoint /api/v1/admin_users/ non disponible, test ignoré.")
@@ -0,0 +1,27 @@
+import pytest
+from app import create_app, db
+from app.models.amenity import Amenity
+from app.persistence.amenity_repository import AmenityRepository
+
+
+@pytest.fixture
+def app():
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.create_all()
+        yield app
+
+
+def test_get_all_projected_returns_id_name_rows(app):
+    amenity = Amenity("Projected Sauna")
+    db.session.add(amenity)
+    db.session.commit()
+
+    rows = AmenityRepository().get_all_projected()
+
+    assert (amenity.id, amenity.name) in [tuple(row) for row in rows]
+    assert all(row._fields == ('id', 'name') for row in rows)
+
+    db.session.delete(amenity)
+    db.session.commit()
@@ -24,3 +24,19 @@ def test_post_amenity_unauthorized(client):
     response = client.post('/api/v1/amenities/', json={"name": "WiFi"})
     # Accepte aussi 201 si l'API ne protège pas la création
     assert response.status_code in (401, 403, 201)
+
+
+def test_get_amenities_not_modified(client):
+    response = client.get('/api/v1/amenities/')
+    etag = response.headers['ETag']
+    assert response.headers['Cache-Control'] == 'public, max-age=30'
+
+    response = client.get('/api/v1/amenities/', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.get_data() == b''
+
+
+def test_get_missing_amenity_returns_404(client):
+    response = client.get('/api/v1/amenities/does-not-exist')
+    assert response.status_code == 404
+    assert response.json == {'error': 'Amenity not found'}
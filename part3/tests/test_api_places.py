@@ -1,5 +1,10 @@
 import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
 from app import create_app
+from app.services import facade
+from app.api.v1.places import _clean_amenity_names, _serialize_place_row
 
 
 @pytest.fixture
@@ -18,3 +23,105 @@ def test_get_places(client):
     response = client.get('/api/v1/places/')
     assert response.status_code == 200
     assert isinstance(response.json, list)
+
+
+def test_serialize_place_row_keeps_key_order():
+    row = ('p1', 'T', None, 10.0, 1.0, 2.0, 3, 'u1',
+           'u1', 'A', 'B', 'a@b.c', None, None)
+    data = _serialize_place_row(row, [{'id': 'a1', 'name': 'Wifi'}])
+    assert list(data) == ['id', 'title', 'description', 'price', 'latitude', 'longitude',
+                          'max_person', 'owner_id', 'owner', 'amenities',
+                          'created_at', 'updated_at']
+    assert data['owner'] == {'id': 'u1', 'first_name': 'A', 'last_name': 'B', 'email': 'a@b.c'}
+    assert data['amenities'] == [{'id': 'a1', 'name': 'Wifi'}]
+
+
+def test_put_foreign_place_is_rejected_before_updating(client):
+    with patch('app.utils.jwt_cache.decode_token',
+               return_value={'sub': '7', 'is_admin': False, 'type': 'access'}), \
+            patch.object(facade, 'get_place_if_owner',
+                         side_effect=PermissionError('Unauthorized action')), \
+            patch.object(facade, 'update_place_obj') as mock_update:
+        response = client.put('/api/v1/places/p1', json={'title': 'x'},
+                              headers={'Authorization': 'Bearer user-token'})
+    assert response.status_code == 403
+    mock_update.assert_not_called()
+
+
+def test_get_places_honors_if_none_match(client):
+    response = client.get('/api/v1/places/')
+    etag = response.headers['ETag']
+
+    response = client.get('/api/v1/places/', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.get_data() == b''
+
+
+def test_get_missing_place_returns_404(client):
+    response = client.get('/api/v1/places/does-not-exist')
+    assert response.status_code == 404
+    assert response.json == {'error': 'Place not found'}
+
+
+def test_post_place_rejects_out_of_range_before_db(client):
+    payload = {'title': 'T', 'price': 10, 'latitude': 100, 'longitude': 0, 'max_person': 2}
+    with patch('app.utils.jwt_cache.decode_token',
+               return_value={'sub': '7', 'is_admin': False, 'type': 'access'}), \
+            patch.object(facade, 'get_user_by_id') as mock_user:
+        response = client.post('/api/v1/places/', json=payload,
+                               headers={'Authorization': 'Bearer user-token'})
+    assert response.status_code == 400
+    assert response.json == {'error': 'Latitude must be between -90 and 90 degrees.'}
+    mock_user.assert_not_called()
+
+
+def test_post_place_rejects_malformed_json(client):
+    with patch('app.utils.jwt_cache.decode_token',
+               return_value={'sub': '7', 'is_admin': False, 'type': 'access'}):
+        response = client.post('/api/v1/places/', data=b'{"title": ',
+                               content_type='application/json',
+                               headers={'Authorization': 'Bearer user-token'})
+    assert response.status_code == 400
+    assert response.json == {'error': 'Missing or invalid JSON body'}
+
+
+def test_clean_amenity_names_strips_and_dedupes():
+    assert _clean_amenity_names([' Wifi', 'Pool', 'Wifi ', 'Pool']) == (['Wifi', 'Pool'], None)
+    assert _clean_amenity_names(['Wifi', '  ']) == (None, 'Invalid amenity name:   ')
+    assert _clean_amenity_names([3]) == (None, 'Invalid amenity name: 3')
+
+
+def test_place_listing_body_is_reused_until_a_write(client):
+    first = client.get('/api/v1/places/')
+    with patch.object(facade, 'get_all_places_rows') as mock_rows:
+        second = client.get('/api/v1/places/')
+    mock_rows.assert_not_called()
+    assert second.get_data() == first.get_data()
+
+    facade._touch_places()
+    with patch.object(facade, 'get_all_places_rows', return_value=([], [])) as mock_rows:
+        third = client.get('/api/v1/places/')
+    mock_rows.assert_called_once()
+    assert third.json == []
+
+
+def test_get_place_etag_matches_served_instance(client):
+    served_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    stale = SimpleNamespace(id='p1', title='Old', description='d', price=1.0, latitude=0.0,
+                            longitude=0.0, owner_id='u1', max_person=1, updated_at=served_at)
+    with patch.object(facade, 'get_place_meta', return_value=datetime(2024, 1, 2, tzinfo=timezone.utc)), \
+            patch.object(facade, 'get_place', return_value=stale):
+        response = client.get('/api/v1/places/p1')
+    assert response.status_code == 200
+    assert response.headers['ETag'] == f'W/"p1-{int(served_at.timestamp() * 1_000_000)}"'
+
+
+@pytest.mark.parametrize('body', [b'5', b'true', b'"text"'])
+def test_put_place_rejects_non_object_body(client, body):
+    with patch('app.utils.jwt_cache.decode_token',
+               return_value={'sub': '7', 'is_admin': False, 'type': 'access'}):
+        response = client.put('/api/v1/places/any-id', data=body,
+                              content_type='application/json',
+                              headers={'Authorization': 'Bearer user-token'})
+    assert response.status_code == 400
+    assert response.json == {'error': 'Missing or invalid JSON body'}
@@ -1,5 +1,15 @@
 import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+import uuid
+from flask_jwt_extended import create_access_token
 from app import create_app
+from app.services import facade
+from app.extensions import db
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
 
 
 @pytest.fixture
@@ -18,3 +28,88 @@ def test_get_reviews(client):
     response = client.get('/api/v1/reviews/')
     assert response.status_code == 200
     assert isinstance(response.json, list)
+
+
+def test_get_review_honors_if_none_match(client):
+    with client.application.app_context():
+        author = User("Etag", "Author", f"author-{uuid.uuid4()}@example.com", "password123")
+        owner = User("Etag", "Owner", f"owner-{uuid.uuid4()}@example.com", "password123")
+        review = Review("Nice stay", 5, author, Place("Tagged", "desc", 50.0, 1.0, 1.0, owner))
+        db.session.add(review)
+        db.session.commit()
+        review_id = review.id
+
+    response = client.get(f'/api/v1/reviews/{review_id}')
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == 'private, max-age=30'
+
+    response = client.get(f'/api/v1/reviews/{review_id}',
+                          headers={'If-None-Match': response.headers['ETag']})
+    assert response.status_code == 304
+
+
+def test_get_missing_review_returns_404(client):
+    response = client.get('/api/v1/reviews/does-not-exist')
+    assert response.status_code == 404
+    assert response.json == {'error': 'Review not found'}
+
+
+def test_post_review_rejects_wrong_types_before_facade(client):
+    with client.application.app_context():
+        token = create_access_token(identity='7', additional_claims={'is_admin': False})
+    payload = {'text': 'Great', 'rating': '5', 'place_id': 'p1'}
+    with patch.object(facade, 'create_review') as mock_create:
+        response = client.post('/api/v1/reviews/', json=payload,
+                               headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == 400
+    assert response.json == {'error': "Invalid value for field 'rating'"}
+    mock_create.assert_not_called()
+
+
+def test_delete_review_of_another_user_is_forbidden(client):
+    with client.application.app_context():
+        author = User("Del", "Author", f"author-{uuid.uuid4()}@example.com", "password123")
+        owner = User("Del", "Owner", f"owner-{uuid.uuid4()}@example.com", "password123")
+        review = Review("Kept", 4, author, Place("Guarded", "desc", 50.0, 1.0, 1.0, owner))
+        db.session.add(review)
+        db.session.commit()
+        review_id = review.id
+
+    with patch('app.utils.jwt_cache.decode_token',
+               return_value={'sub': 'someone-else', 'is_admin': False, 'type': 'access'}):
+        response = client.delete(f'/api/v1/reviews/{review_id}',
+                                 headers={'Authorization': 'Bearer other-token'})
+    assert response.status_code == 403
+    assert response.json == {'error': 'Unauthorized action'}
+
+
+def test_review_listing_honors_if_none_match(client):
+    response = client.get('/api/v1/reviews/')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+
+    with patch.object(facade, 'list_reviews_projected') as mock_rows:
+        response = client.get('/api/v1/reviews/', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    mock_rows.assert_not_called()
+
+
+def test_get_review_etag_matches_served_instance(client):
+    served_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    stale = SimpleNamespace(id='r1', text='Old', rating=3, user_id='u1', place_id='p1',
+                            updated_at=served_at)
+    with patch.object(facade, 'get_review_meta', return_value=datetime(2024, 1, 2, tzinfo=timezone.utc)), \
+            patch.object(facade, 'get_review', return_value=stale):
+        response = client.get('/api/v1/reviews/r1')
+    assert response.status_code == 200
+    assert response.headers['ETag'] == f'W/"r1-{int(served_at.timestamp() * 1_000_000)}"'
+
+
+@pytest.mark.parametrize('body', [b'null', b'5', b'true'])
+def test_put_review_rejects_non_object_body(client, body):
+    with client.application.app_context():
+        token = create_access_token(identity='7', additional_claims={'is_admin': False})
+    response = client.put('/api/v1/reviews/any-id', data=body, content_type='application/json',
+                          headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == 400
+    assert response.json == {'error': 'Invalid input data'}
@@ -0,0 +1,116 @@
+import uuid
+import pytest
+from unittest.mock import patch
+from sqlalchemy import update
+from app import create_app, db
+from app.extensions import bcrypt
+from app.models.user import User
+from app.services import facade
+
+
+@pytest.fixture
+def app():
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.create_all()
+        yield app
+
+
+def test_authenticate_caches_successful_and_failed_checks(app):
+    user = User("Login", "Cache", f"login-{uuid.uuid4()}@example.com", "password123")
+    db.session.add(user)
+    db.session.commit()
+
+    with app.test_request_context():
+        with patch.object(User, 'verify_password', autospec=True,
+                          side_effect=lambda self, password: password == "password123") as mock_verify:
+            assert facade.authenticate(user.email, "wrong") is None
+            assert facade.authenticate(user.email, "password123") is user
+            assert facade.authenticate(user.email, "password123") is user
+            assert facade.authenticate(user.email, "wrong") is None
+            assert facade.authenticate(user.email, "other") is None
+        assert mock_verify.call_count == 3
+
+    db.session.delete(user)
+    db.session.commit()
+
+
+def test_get_or_create_amenities_batches_and_dedupes(app):
+    suffix = uuid.uuid4().hex[:8]
+    existing = facade.create_amenity({'name': f"Sauna {suffix}"})
+
+    amenities = facade.get_or_create_amenities(
+        [f"sauna {suffix}", f"Garden {suffix}", f" garden {suffix} "])
+
+    assert [a.name for a in amenities] == [f"Sauna {suffix}".title(), f"Garden {suffix}".title()]
+    assert amenities[0].id == existing.id
+
+    for amenity in amenities:
+        db.session.delete(amenity)
+    db.session.commit()
+
+
+def test_user_lookups_are_cached_until_updated(app):
+    user = User("Cached", "User", f"cached-{uuid.uuid4()}@example.com", "password123")
+    db.session.add(user)
+    db.session.commit()
+    user_id = user.id
+
+    with app.test_request_context():
+        assert facade.get_user_by_id(user_id).id == user_id
+        with patch.object(facade.user_repo, 'get_user_by_id') as mock_get:
+            assert facade.get_user_by_id(user_id).id == user_id
+        mock_get.assert_not_called()
+
+        facade.update_user_atomic(user_id, {'first_name': 'Renamed'})
+        assert facade.get_user_by_id(user_id).first_name == 'Renamed'
+
+    facade.delete_user(user_id)
+
+
+def test_authenticate_ignores_cached_user_state(app):
+    user = User("Login", "Fresh", f"fresh-{uuid.uuid4()}@example.com", "password123")
+    db.session.add(user)
+    db.session.commit()
+
+    with app.test_request_context():
+        # Loaded (and cached) before another writer changes the row behind the session
+        cached = facade.get_user_by_email(user.email)
+        db.session.execute(update(User).where(User.id == user.id).values(is_admin=True))
+        assert cached.is_admin is False
+        assert facade.authenticate(user.email, "password123").is_admin is True
+        db.session.rollback()
+
+    db.session.delete(user)
+    db.session.commit()
+
+
+def test_authenticate_cache_does_not_survive_password_change(app):
+    user = User("Login", "Rotate", f"rotate-{uuid.uuid4()}@example.com", "password123")
+    db.session.add(user)
+    db.session.commit()
+
+    with app.test_request_context():
+        assert facade.authenticate(user.email, "password123") is user
+        # Another worker changes the password: this process's caches are not told
+        db.session.execute(update(User).where(User.id == user.id)
+                           .values(password=bcrypt.generate_password_hash("newpass456").decode('utf-8')))
+        assert facade.authenticate(user.email, "password123") is None
+        db.session.rollback()
+
+    db.session.delete(user)
+    db.session.commit()
+
+
+def test_update_amenity_rejects_duplicate_name(app):
+    suffix = uuid.uuid4().hex[:8]
+    first = facade.create_amenity({'name': f"Spa {suffix}"})
+    second = facade.create_amenity({'name': f"Gym {suffix}"})
+
+    with pytest.raises(ValueError, match="Amenity already exists"):
+        facade.update_amenity(second.id, {'name': first.name})
+
+    for amenity in (first, second):
+        db.session.delete(db.session.merge(amenity))
+    db.session.commit()
@@ -0,0 +1,88 @@
+import pytest
+from unittest.mock import patch
+from flask import g
+from flask_jwt_extended import create_access_token, decode_token
+from app import create_app
+from app.utils import jwt_cache
+from app.utils.cache import TTLCache
+
+
+@pytest.fixture
+def app():
+    app = create_app()
+    app.config['TESTING'] = True
+    jwt_cache._verified_tokens.clear()
+    yield app
+    jwt_cache._verified_tokens.clear()
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(maxsize=2, ttl=30)
+    cache.set('a', 1)
+    cache.set('b', 2, expires_at=0)
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+
+
+def test_ttl_cache_evicts_oldest_entry():
+    cache = TTLCache(maxsize=2, ttl=30)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.set('c', 3)
+    assert cache.get('a') is None
+    assert cache.get('c') == 3
+
+
+def test_verification_is_cached(app):
+    with app.app_context():
+        token = create_access_token(identity='42', additional_claims={'is_admin': True})
+
+    headers = {'Authorization': f'Bearer {token}'}
+    with patch('app.utils.jwt_cache.decode_token', side_effect=decode_token) as mock_decode:
+        for _ in range(2):
+            with app.test_request_context(headers=headers):
+                jwt_cache.verify_cached_jwt()
+                assert g.jwt_identity == '42'
+                assert g.jwt_claims['is_admin'] is True
+                assert jwt_cache.current_principal() == ('42', True)
+    assert mock_decode.call_count == 1
+
+
+def test_invalid_token_is_not_cached(app):
+    headers = {'Authorization': 'Bearer not-a-jwt'}
+    for _ in range(2):
+        with app.test_request_context(headers=headers):
+            with pytest.raises(Exception):
+                jwt_cache.verify_cached_jwt()
+    assert len(jwt_cache._verified_tokens) == 0
+
+
+def test_admin_required_rejects_non_admin(app):
+    view = jwt_cache.admin_required(lambda: ('ok', 200))
+    headers = {'Authorization': 'Bearer user-token'}
+    with patch('app.utils.jwt_cache.decode_token',
+               return_value={'sub': '7', 'is_admin': False, 'type': 'access'}):
+        with app.test_request_context(headers=headers):
+            response = view()
+            assert response.status_code == 403
+            assert response.get_json() == {'error': 'Admin privileges required'}
+
+    headers = {'Authorization': 'Bearer admin-token'}
+    with patch('app.utils.jwt_cache.decode_token',
+               return_value={'sub': '1', 'is_admin': True, 'type': 'access'}):
+        with app.test_request_context(headers=headers):
+            assert view() == ('ok', 200)
+
+
+def test_admin_gate_only_guards_listed_prefixes(app):
+    gate = jwt_cache.admin_gate(('/api/v1/admin/users',))
+    headers = {'Authorization': 'Bearer gate-token'}
+    with patch('app.utils.jwt_cache.decode_token',
+               return_value={'sub': '7', 'is_admin': False, 'type': 'access'}):
+        with app.test_request_context('/api/v1/admin/users/users/1', headers=headers):
+            response = gate()
+            assert response.status_code == 403
+            assert response.get_json() == {'error': 'Admin privileges required'}
+
+        with app.test_request_context('/api/v1/places/', headers=headers):
+            assert gate() is None
@@ -0,0 +1,12 @@
+from flask_jwt_extended import create_access_token, decode_token
+from app import create_app
+
+
+def test_hs256_keys_are_cached_as_bytes():
+    app = create_app()
+    encode_key, decode_key = app.extensions['jwt_key_cache']
+    assert encode_key == decode_key == app.config['JWT_SECRET_KEY'].encode()
+
+    with app.app_context():
+        token = create_access_token(identity='42')
+        assert decode_token(token)['sub'] == '42'
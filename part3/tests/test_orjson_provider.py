@@ -0,0 +1,43 @@
+import decimal
+import pytest
+from flask import jsonify, request
+from app import create_app
+from app.utils.orjson_provider import OrjsonProvider, output_json
+
+
+@pytest.fixture
+def app():
+    app = create_app()
+    app.config['TESTING'] = True
+    return app
+
+
+def test_app_uses_orjson_provider(app):
+    assert isinstance(app.json, OrjsonProvider)
+
+
+def test_provider_round_trip(app):
+    data = {'name': 'Loft', 'amenities': [{'id': '1'}], 1: decimal.Decimal('9.50')}
+    assert app.json.loads(app.json.dumps(data)) == {
+        'name': 'Loft', 'amenities': [{'id': '1'}], '1': '9.50'}
+
+
+def test_request_payload_is_parsed(app):
+    with app.test_request_context(json={'title': 'Loft'}):
+        assert request.get_json() == {'title': 'Loft'}
+
+
+def test_output_json_representation(app):
+    with app.test_request_context():
+        response = output_json({'id': 'abc'}, 201, {'X-Test': '1'})
+    assert response.status_code == 201
+    assert response.mimetype == 'application/json'
+    assert response.headers['X-Test'] == '1'
+    assert response.get_data() == b'{"id":"abc"}\n'
+
+
+def test_debug_output_is_compact_and_unsorted(app):
+    app.debug = True
+    with app.test_request_context():
+        assert jsonify({'b': 1, 'a': [1, 2]}).get_data() == b'{"b":1,"a":[1,2]}'
+        assert output_json({'b': 1, 'a': 2}, 200).get_data() == b'{"b":1,"a":2}\n'
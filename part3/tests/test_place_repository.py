@@ -0,0 +1,140 @@
+import uuid
+import pytest
+from sqlalchemy import inspect
+from app import create_app, db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.user import User
+from app.persistence.place_repository import PlaceRepository
+
+
+@pytest.fixture
+def app():
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.create_all()
+        yield app
+
+
+def test_get_place_by_id_loads_owner_and_amenities(app):
+    owner = User("Repo", "Owner", f"owner-{uuid.uuid4()}@example.com", "password123")
+    place = Place("Eager Place", "desc", 50.0, 10.0, 10.0, owner)
+    place.amenities = [Amenity("Repo Sauna"), Amenity("Repo Garden")]
+    db.session.add(place)
+    db.session.commit()
+    place_id = place.id
+    db.session.expunge_all()
+
+    loaded = PlaceRepository().get_place_by_id(place_id)
+
+    unloaded = inspect(loaded).unloaded
+    assert 'owner' not in unloaded
+    assert 'amenities' not in unloaded
+    assert sorted(a.name for a in loaded.amenities) == ["Repo Garden", "Repo Sauna"]
+    assert all('created_at' in inspect(a).unloaded for a in loaded.amenities)
+
+    for amenity in loaded.amenities:
+        db.session.delete(amenity)
+    db.session.delete(loaded)
+    db.session.delete(loaded.owner)
+    db.session.commit()
+
+
+def test_get_place_by_id_returns_none_when_missing(app):
+    assert PlaceRepository().get_place_by_id(str(uuid.uuid4())) is None
+
+
+def test_get_owner_id(app):
+    owner = User("Repo", "Owner", f"owner-{uuid.uuid4()}@example.com", "password123")
+    place = Place("Owned Place", "desc", 50.0, 10.0, 10.0, owner)
+    db.session.add(place)
+    db.session.commit()
+
+    repo = PlaceRepository()
+    assert repo.get_owner_id(place.id) == owner.id
+    assert repo.get_owner_id(str(uuid.uuid4())) is None
+
+    db.session.delete(place)
+    db.session.delete(owner)
+    db.session.commit()
+
+
+def test_delete_if_owner_only_deletes_owned_place(app):
+    owner = User("Repo", "Owner", f"owner-{uuid.uuid4()}@example.com", "password123")
+    other = User("Repo", "Other", f"other-{uuid.uuid4()}@example.com", "password123")
+    place = Place("Guarded Place", "desc", 50.0, 10.0, 10.0, owner)
+    db.session.add_all([place, other])
+    db.session.commit()
+    place_id = place.id
+
+    repo = PlaceRepository()
+    assert repo.delete_if_owner(place_id, owner_id=other.id) == 0
+    assert repo.get_owner_id(place_id) == owner.id
+    assert repo.delete_if_owner(place_id, owner_id=owner.id) == 1
+    assert repo.get_owner_id(place_id) is None
+
+    db.session.delete(owner)
+    db.session.delete(other)
+    db.session.commit()
+
+
+def test_get_all_with_relations_loads_owner_and_amenities(app):
+    owner = User("Repo", "Owner", f"owner-{uuid.uuid4()}@example.com", "password123")
+    place = Place("Listed Place", "desc", 50.0, 10.0, 10.0, owner)
+    place.amenities = [Amenity("Repo Hammam")]
+    db.session.add(place)
+    db.session.commit()
+    place_id = place.id
+    db.session.expunge_all()
+
+    loaded = next(p for p in PlaceRepository().get_all_with_relations() if p.id == place_id)
+
+    unloaded = inspect(loaded).unloaded
+    assert 'owner' not in unloaded
+    assert 'amenities' not in unloaded
+
+    for amenity in loaded.amenities:
+        db.session.delete(amenity)
+    db.session.delete(loaded)
+    db.session.delete(loaded.owner)
+    db.session.commit()
+
+
+def test_add_with_amenities_links_existing_ids_only(app):
+    owner = User("Repo", "Owner", f"owner-{uuid.uuid4()}@example.com", "password123")
+    amenity = Amenity(f"Batch {uuid.uuid4()}")
+    db.session.add_all([owner, amenity])
+    db.session.commit()
+
+    place = Place("Batched Place", "desc", 50.0, 10.0, 10.0, owner)
+    PlaceRepository().add_with_amenities(
+        place, [amenity.id, amenity.id, str(uuid.uuid4())])
+
+    assert [a.id for a in place.amenities] == [amenity.id]
+
+    db.session.delete(place)
+    db.session.delete(amenity)
+    db.session.delete(owner)
+    db.session.commit()
+
+
+def test_listing_rows_and_amenity_links(app):
+    owner = User("Row", "Owner", f"owner-{uuid.uuid4()}@example.com", "password123")
+    place = Place("Row Place", "desc", 50.0, 10.0, 10.0, owner)
+    place.amenities = [Amenity(f"Row {uuid.uuid4()}")]
+    db.session.add(place)
+    db.session.commit()
+
+    repo = PlaceRepository()
+    row = next(r for r in repo.get_listing_rows() if r[0] == place.id)
+    assert row[1] == "Row Place"
+    assert tuple(row[8:12]) == (owner.id, "Row", "Owner", owner.email)
+    links = [tuple(link) for link in repo.get_amenity_links() if link[0] == place.id]
+    assert links == [(place.id, place.amenities[0].id, place.amenities[0].name)]
+
+    amenity = place.amenities[0]
+    db.session.delete(place)
+    db.session.delete(amenity)
+    db.session.delete(owner)
+    db.session.commit()
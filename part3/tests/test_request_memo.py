@@ -0,0 +1,34 @@
+from flask import Flask
+from app.utils.request_memo import clear_request_memo, request_memoize
+
+calls = []
+
+
+@request_memoize
+def lookup(key):
+    calls.append(key)
+    return key.upper()
+
+
+def test_results_are_memoized_per_request():
+    app = Flask(__name__)
+    calls.clear()
+
+    with app.test_request_context():
+        assert lookup('a') == 'A'
+        assert lookup('a') == 'A'
+        assert calls == ['a']
+        clear_request_memo()
+        lookup('a')
+        assert calls == ['a', 'a']
+
+    with app.test_request_context():
+        lookup('a')
+    assert calls == ['a', 'a', 'a']
+
+
+def test_no_memo_outside_app_context():
+    calls.clear()
+    lookup('b')
+    lookup('b')
+    assert calls == ['b', 'b']
@@ -0,0 +1,85 @@
+from datetime import datetime
+import gzip
+from app import create_app
+from app.api.v1.responses import (
+    content_tag,
+    encode_json,
+    error_body,
+    etag_header,
+    is_not_modified,
+    json_response,
+    no_content,
+    not_modified,
+    render_json,
+    version_tag,
+)
+from app.api.v1 import responses
+
+
+def test_json_response_sends_prebuilt_body():
+    with create_app().test_request_context():
+        response = json_response(error_body('User not found'), 404)
+    assert response.status_code == 404
+    assert response.mimetype == 'application/json'
+    assert response.get_json() == {'error': 'User not found'}
+
+
+def test_no_content():
+    with create_app().test_request_context():
+        response = no_content()
+    assert response.status_code == 204
+    assert response.get_data() == b''
+
+
+def test_conditional_get_helpers():
+    tag = version_tag('42', datetime(2024, 1, 1, 12, 0, 0, 123456))
+    assert version_tag('42', datetime(2024, 1, 1, 12, 0, 0, 123457)) != tag
+
+    app = create_app()
+    with app.test_request_context(headers={'If-None-Match': etag_header(tag)}):
+        assert is_not_modified(tag)
+        response = not_modified(tag)
+        assert response.status_code == 304
+        assert response.headers['ETag'] == etag_header(tag)
+    with app.test_request_context():
+        assert not is_not_modified(tag)
+
+
+def test_render_json():
+    with create_app().test_request_context():
+        response = render_json([{'id': '1', 'name': 'Wifi'}], 201)
+    assert response.status_code == 201
+    assert response.get_data() == b'[{"id":"1","name":"Wifi"}]\n'
+
+
+def test_content_tag_follows_body():
+    body = encode_json([{'id': '1', 'name': 'Wifi'}])
+    assert content_tag(body) == content_tag(encode_json([{'id': '1', 'name': 'Wifi'}]))
+    assert content_tag(body) != content_tag(encode_json([{'id': '1', 'name': 'Pool'}]))
+
+
+def test_encode_json_default_hook():
+    class Row:
+        def __init__(self, *values):
+            self.values = values
+
+    body = encode_json([Row('1', 'Wifi')], default=lambda row: {'id': row.values[0], 'name': row.values[1]})
+    assert body == b'[{"id":"1","name":"Wifi"}]\n'
+
+
+def test_compressed_json_response_gzips_large_bodies_once():
+    body = responses.encode_json([{'id': str(i), 'name': 'Amenity'} for i in range(100)])
+    tag = responses.content_tag(body)
+    app = create_app()
+
+    with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+        response = responses.compressed_json_response(body, tag)
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.headers['Vary'] == 'Accept-Encoding'
+        assert gzip.decompress(response.get_data()) == body
+    assert responses._gzip_bodies.get(tag) is not None
+
+    with app.test_request_context():
+        response = responses.compressed_json_response(body, tag)
+        assert 'Content-Encoding' not in response.headers
+        assert response.get_data() == body
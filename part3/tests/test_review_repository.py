@@ -0,0 +1,108 @@
+import uuid
+import pytest
+from sqlalchemy import inspect
+from app import create_app, db
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.persistence.review_repository import ReviewRepository
+
+
+@pytest.fixture
+def app():
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.create_all()
+        yield app
+
+
+def test_delete_if_author_only_deletes_own_review(app):
+    author = User("Repo", "Author", f"author-{uuid.uuid4()}@example.com", "password123")
+    other = User("Repo", "Other", f"other-{uuid.uuid4()}@example.com", "password123")
+    place = Place("Reviewed Place", "desc", 50.0, 10.0, 10.0, other)
+    review = Review("Nice stay", 5, author, place)
+    db.session.add(review)
+    db.session.commit()
+    review_id = review.id
+
+    repo = ReviewRepository()
+    assert repo.delete_if_author(review_id, user_id=other.id) == 0
+    assert repo.get(review_id) is not None
+    assert repo.delete_if_author(review_id, user_id=author.id) == 1
+    db.session.expire_all()
+    assert repo.get(review_id) is None
+
+    db.session.delete(place)
+    db.session.delete(author)
+    db.session.delete(other)
+    db.session.commit()
+
+
+def test_update_if_author_only_updates_own_review(app):
+    author = User("Repo", "Author", f"author-{uuid.uuid4()}@example.com", "password123")
+    other = User("Repo", "Other", f"other-{uuid.uuid4()}@example.com", "password123")
+    place = Place("Reviewed Place", "desc", 50.0, 10.0, 10.0, other)
+    review = Review("Nice stay", 5, author, place)
+    db.session.add(review)
+    db.session.commit()
+    review_id = review.id
+
+    repo = ReviewRepository()
+    assert repo.get_author_id(review_id) == author.id
+    assert repo.update_if_author(review_id, {'rating': 1}, user_id=other.id) == 0
+    assert repo.update_if_author(review_id, {'rating': 3}, user_id=author.id) == 1
+    db.session.expire_all()
+    assert repo.get(review_id).rating == 3
+
+    db.session.delete(repo.get(review_id))
+    db.session.delete(place)
+    db.session.delete(author)
+    db.session.delete(other)
+    db.session.commit()
+
+
+def test_get_all_projected_reads_foreign_keys(app):
+    author = User("Repo", "Author", f"author-{uuid.uuid4()}@example.com", "password123")
+    other = User("Repo", "Other", f"other-{uuid.uuid4()}@example.com", "password123")
+    place = Place("Reviewed Place", "desc", 50.0, 10.0, 10.0, other)
+    review = Review("Nice stay", 5, author, place)
+    db.session.add(review)
+    db.session.commit()
+
+    row = next(r for r in ReviewRepository().get_all_projected() if r[0] == review.id)
+    assert tuple(row) == (review.id, "Nice stay", 5, author.id, place.id)
+
+    db.session.delete(review)
+    db.session.delete(place)
+    db.session.delete(author)
+    db.session.delete(other)
+    db.session.commit()
+
+
+def test_get_all_with_relations_loads_author_and_place(app):
+    author = User("Repo", "Author", f"author-{uuid.uuid4()}@example.com", "password123")
+    other = User("Repo", "Other", f"other-{uuid.uuid4()}@example.com", "password123")
+    place = Place("Reviewed Place", "desc", 50.0, 10.0, 10.0, other)
+    review = Review("Nice stay", 5, author, place)
+    db.session.add(review)
+    db.session.commit()
+    review_id = review.id
+    db.session.expunge_all()
+
+    loaded = next(r for r in ReviewRepository().get_all_with_relations() if r.id == review_id)
+    unloaded = inspect(loaded).unloaded
+    assert 'user' not in unloaded
+    assert 'place' not in unloaded
+
+    db.session.delete(loaded)
+    db.session.delete(loaded.place)
+    db.session.delete(loaded.user)
+    db.session.delete(loaded.place.owner)
+    db.session.commit()
+
+
+def test_get_listing_version_counts_reviews(app):
+    updated_at, count = ReviewRepository().get_listing_version()
+    assert isinstance(count, int)
+    assert (updated_at is None) == (count == 0)
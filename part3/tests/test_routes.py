@@ -0,0 +1,15 @@
+from collections import Counter
+from app import create_app
+from app.api.v1.models import admin_user_model, user_model
+
+
+def test_each_route_is_registered_once():
+    app = create_app()
+    counts = Counter((rule.rule, tuple(sorted(rule.methods))) for rule in app.url_map.iter_rules())
+    assert [rule for rule, count in counts.items() if count > 1] == []
+
+
+def test_user_models_do_not_collide():
+    assert user_model.name != admin_user_model.name
+    assert user_model['is_admin'].required is False
+    assert admin_user_model['is_admin'].required is True
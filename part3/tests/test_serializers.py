@@ -0,0 +1,16 @@
+from types import SimpleNamespace
+import orjson
+from app.api.v1.serializers import AmenityOut, user_to_dict
+
+
+def test_user_to_dict_excludes_password():
+    user = SimpleNamespace(id='1', first_name='Ada', last_name='Lovelace',
+                           email='ada@example.com', is_admin=False, password='hash')
+    assert user_to_dict(user) == {
+        'id': '1', 'first_name': 'Ada', 'last_name': 'Lovelace',
+        'email': 'ada@example.com', 'is_admin': False}
+
+
+def test_amenity_out_encodes_as_object():
+    amenity = SimpleNamespace(id='1', name='Wifi', created_at='ignored')
+    assert orjson.dumps(AmenityOut.of(amenity)) == b'{"id":"1","name":"Wifi"}'
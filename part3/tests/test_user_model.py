@@ -141,3 +141,8 @@ def test_add_invalid_review_raises():
     # Tentative d’ajouter un entier au lieu d’un objet Review : doit échouer
     with pytest.raises(TypeError):
         user.add_review(123)
+
+
+# Test de la normalisation des emails (espaces supprimés, minuscules)
+def test_normalize_email():
+    assert User.normalize_email("  John.Doe@Example.COM ") == "john.doe@example.com"
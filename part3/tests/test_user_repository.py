@@ -0,0 +1,73 @@
+import uuid
+import pytest
+from sqlalchemy.exc import IntegrityError
+from app import create_app, db
+from app.models.user import User
+from app.persistence.user_repository import UserRepository
+from app.services import facade
+
+
+@pytest.fixture
+def app():
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.app_context():
+        db.create_all()
+        yield app
+
+
+def test_update_fields_updates_existing_user(app):
+    user = User("Repo", "User", f"user-{uuid.uuid4()}@example.com", "password123")
+    db.session.add(user)
+    db.session.commit()
+
+    repo = UserRepository()
+    assert repo.update_fields(user.id, {'first_name': 'Renamed'}) == 1
+    assert repo.get(user.id).first_name == 'Renamed'
+    assert repo.update_fields(str(uuid.uuid4()), {'first_name': 'Nobody'}) == 0
+
+    db.session.delete(user)
+    db.session.commit()
+
+
+def test_update_fields_rejects_duplicate_email(app):
+    first = User("Repo", "First", f"first-{uuid.uuid4()}@example.com", "password123")
+    second = User("Repo", "Second", f"second-{uuid.uuid4()}@example.com", "password123")
+    db.session.add_all([first, second])
+    db.session.commit()
+
+    with pytest.raises(IntegrityError):
+        UserRepository().update_fields(second.id, {'email': first.email})
+
+    db.session.delete(first)
+    db.session.delete(second)
+    db.session.commit()
+
+
+def test_get_users_in_and_batch_lookup(app):
+    users = [User("Repo", f"Batch{i}", f"batch-{uuid.uuid4()}@example.com", "password123")
+             for i in range(3)]
+    db.session.add_all(users)
+    db.session.commit()
+    ids = [user.id for user in users]
+
+    assert {u.id for u in UserRepository().get_users_in(ids)} == set(ids)
+
+    requested = [ids[2], str(uuid.uuid4()), ids[0], ids[2]]
+    assert [u.id for u in facade.get_users_by_ids(requested, chunk_size=1)] == [ids[2], ids[0]]
+
+    for user in users:
+        db.session.delete(user)
+    db.session.commit()
+
+
+def test_get_all_projected_reads_public_columns(app):
+    user = User("Repo", "Listed", f"listed-{uuid.uuid4()}@example.com", "password123")
+    db.session.add(user)
+    db.session.commit()
+
+    rows = {row[0]: tuple(row) for row in UserRepository().get_all_projected()}
+    assert rows[user.id] == (user.id, "Repo", "Listed", user.email)
+
+    db.session.delete(user)
+    db.session.commit()
@@ -0,0 +1,26 @@
+import pytest
+from numbers import Real
+from app.utils.validation import PayloadSchema
+
+schema = PayloadSchema({'name': str, 'price': Real, 'is_admin': bool}, required=('name',))
+
+
+def test_validate_keeps_declared_fields():
+    assert schema.validate({'name': 'Loft', 'price': 10, 'extra': 1}) == {'name': 'Loft', 'price': 10}
+
+
+def test_validate_requires_fields():
+    with pytest.raises(ValueError, match='name'):
+        schema.validate({'price': 10.5})
+
+
+@pytest.mark.parametrize('payload', [
+    {'name': 1},
+    {'name': 'Loft', 'price': True},
+    {'name': 'Loft', 'is_admin': 1},
+    {'name': None},
+    ['name'],
+])
+def test_validate_rejects_wrong_types(payload):
+    with pytest.raises(ValueError):
+        schema.validate(payload)